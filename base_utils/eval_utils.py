@@ -158,3 +158,17 @@ def dump_eval_result(out_dir, content):
     logger.info(f"Evaluation result file generated at {file_path}")
     with open(file_path, "w+") as f:
         json.dump(content, f, indent=4)
+
+
+def episode_result_path(out_dir, episode_id):
+    return os.path.join(out_dir, "episodes", f"episode_{episode_id:04d}.json")
+
+
+def dump_episode_result(out_dir, episode_id, content):
+    # write to a temp file and rename, readers never see a partial episode result
+    file_path = episode_result_path(out_dir, episode_id)
+    os.makedirs(os.path.dirname(file_path), exist_ok=True)
+    tmp_path = f"{file_path}.{os.getpid()}.tmp"
+    with open(tmp_path, "w") as f:
+        json.dump(content, f, indent=4)
+    os.replace(tmp_path, file_path)
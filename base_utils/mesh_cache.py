@@ -0,0 +1,65 @@
+# Copyright (c) 2023-2025, AgiBot Inc. All Rights Reserved.
+# Author: Genie Sim Team
+# License: Mozilla Public License Version 2.0
+
+"""
+Process wide cache of object meshes and their surface samples, keyed by mesh
+path and mtime so an edited asset is loaded again. Samples use a fixed seed and,
+on request, are persisted as <mesh>.samples<count>.npz next to the asset, so
+later processes skip parsing the mesh altogether.
+"""
+
+import os
+from functools import lru_cache
+
+import numpy as np
+import trimesh
+
+from base_utils.logger import Logger
+
+logger = Logger()  # Create singleton instance
+
+SURFACE_SAMPLE_SEED = 0
+
+
+def _mtime(mesh_file):
+    return os.stat(mesh_file).st_mtime_ns
+
+
+@lru_cache(maxsize=32)
+def _load_mesh(mesh_file, mtime):
+    return trimesh.load(mesh_file, force="mesh")
+
+
+def _samples_file(mesh_file, count):
+    return "%s.samples%d.npz" % (mesh_file, count)
+
+
+@lru_cache(maxsize=256)
+def _surface_samples(mesh_file, mtime, count, persist):
+    samples_file = _samples_file(mesh_file, count)
+    if os.path.exists(samples_file):
+        data = np.load(samples_file)
+        if int(data["mtime"]) == mtime:
+            return data["points"]
+
+    points, _ = trimesh.sample.sample_surface(_load_mesh(mesh_file, mtime), count, seed=SURFACE_SAMPLE_SEED)
+    points = np.asarray(points)
+    if persist:
+        try:
+            tmp_file = samples_file + ".tmp%d.npz" % os.getpid()
+            np.savez(tmp_file, points=points, mtime=mtime)
+            os.replace(tmp_file, samples_file)
+        except OSError as e:
+            # read only asset dirs just keep the in-memory cache
+            logger.warning(f"Failed to save surface samples of {mesh_file}: {e}")
+    return points
+
+
+def surface_samples(mesh_file, count, persist=False):
+    """
+    Fixed seed surface samples in the mesh frame and units, (count, 3).
+    The returned array is shared, do not modify it in place.
+    persist writes them next to the mesh, only for asset dirs owned by the caller.
+    """
+    return _surface_samples(mesh_file, _mtime(mesh_file), count, persist)
@@ -0,0 +1,169 @@
+# Copyright (c) 2023-2025, AgiBot Inc. All Rights Reserved.
+# Author: Genie Sim Team
+# License: Mozilla Public License Version 2.0
+
+"""
+Append-only SQLite store of benchmark episode results, one row per episode.
+Aggregating across runs is a query instead of a walk over evaluate_ret json files:
+
+    python -m base_utils.results_store output/results.db --group_by task policy seed
+"""
+
+import argparse
+import sqlite3
+import time
+
+from .eval_utils import ErrorCode, TASK_STEPS
+from .logger import Logger
+
+logger = Logger()
+
+# one column per TASK_STEPS stage score, STEP{i} of summarize_scores
+STEP_COLUMNS = [f"step{i}" for i in range(max(len(s) for s in TASK_STEPS.values()))]
+
+RESULT_COLUMNS = [
+    ("run_id", "TEXT"),
+    ("task", "TEXT"),
+    ("episode_id", "INTEGER"),
+    ("policy", "TEXT"),
+    ("seed", "INTEGER"),
+    ("task_uid", "TEXT"),
+    ("start_time", "TEXT"),
+    ("end_time", "TEXT"),
+    ("code", "INTEGER"),
+    ("step", "INTEGER"),
+    ("msg", "TEXT"),
+    ("e2e", "REAL"),
+    ("setup_time", "REAL"),
+    ("sim_time", "REAL"),
+    ("wall_time", "REAL"),
+    ("recorded_at", "REAL"),
+] + [(name, "REAL") for name in STEP_COLUMNS]
+
+GROUP_COLUMNS = ("run_id", "task", "policy", "seed")
+
+
+def result_row(run_id, task, episode_id, policy, seed, result):
+    """flatten an EVAL_TEMPLATE style episode result into a row dict"""
+    eval_result = result.get("result", {})
+    scores = eval_result.get("scores", {})
+    steps = scores.get("STEPS", {})
+    row = {
+        "run_id": run_id,
+        "task": task,
+        "episode_id": episode_id,
+        "policy": policy,
+        "seed": seed,
+        "task_uid": result.get("task_uid"),
+        "start_time": result.get("start_time"),
+        "end_time": result.get("end_time"),
+        "code": eval_result.get("code"),
+        "step": eval_result.get("step"),
+        "msg": eval_result.get("msg"),
+        "e2e": scores.get("E2E"),
+        "setup_time": result.get("setup_time"),
+        "sim_time": result.get("sim_time"),
+        "wall_time": result.get("wall_time"),
+        "recorded_at": time.time(),
+    }
+    for i, name in enumerate(STEP_COLUMNS):
+        row[name] = steps.get(f"STEP{i}")
+    return row
+
+
+class ResultsStore:
+    def __init__(self, db_path):
+        self.db_path = db_path
+        # several benchmark runs may share one file, wait for the writer lock
+        self.conn = sqlite3.connect(db_path, timeout=30)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self._create_table()
+
+    def _create_table(self):
+        columns = ", ".join(f"{name} {kind}" for name, kind in RESULT_COLUMNS)
+        with self.conn:
+            self.conn.execute(f"CREATE TABLE IF NOT EXISTS episodes ({columns})")
+            # files written before TASK_STEPS grew get the new stage columns
+            existing = {row[1] for row in self.conn.execute("PRAGMA table_info(episodes)")}
+            for name, kind in RESULT_COLUMNS:
+                if name not in existing:
+                    self.conn.execute(f"ALTER TABLE episodes ADD COLUMN {name} {kind}")
+            self.conn.execute("CREATE INDEX IF NOT EXISTS episodes_group ON episodes (task, policy, seed)")
+
+    def append(self, rows):
+        rows = list(rows)
+        if not rows:
+            return
+        names = [name for name, _ in RESULT_COLUMNS]
+        with self.conn:
+            self.conn.executemany(
+                f"INSERT INTO episodes ({', '.join(names)}) " f"VALUES ({', '.join('?' for _ in names)})",
+                [tuple(row.get(name) for name in names) for row in rows],
+            )
+        logger.info(f"{len(rows)} episode results appended to {self.db_path}")
+
+    def append_results(self, run_id, task, policy, seed, episode_results):
+        """episode_results: [(episode_id, EVAL_TEMPLATE style result)]"""
+        self.append(
+            result_row(run_id, task, episode_id, policy, seed, result) for episode_id, result in episode_results
+        )
+
+    def success_rates(self, group_by=("task", "policy", "seed"), run_id=None):
+        """[(*group values, episodes, success rate, e2e rate, *mean stage scores)]"""
+        for name in group_by:
+            if name not in GROUP_COLUMNS:
+                raise ValueError(f"Invalid group column: {name}")
+        group = ", ".join(group_by)
+        where, params = "", ()
+        if run_id is not None:
+            where, params = "WHERE run_id = ?", (run_id,)
+        stage_means = "".join(f", AVG({name})" for name in STEP_COLUMNS)
+        query = (
+            f"SELECT {group}, COUNT(*), AVG(code = {int(ErrorCode.SUCCESS.value)}), "
+            f"AVG(e2e){stage_means} FROM episodes {where} "
+            f"GROUP BY {group} ORDER BY {group}"
+        )
+        return self.conn.execute(query, params).fetchall()
+
+    def close(self):
+        self.conn.close()
+
+
+def format_table(header, rows):
+    cells = [
+        [("-" if value is None else f"{value:.3f}" if isinstance(value, float) else str(value)) for value in row]
+        for row in rows
+    ]
+    widths = [max([len(h)] + [len(r[i]) for r in cells]) for i, h in enumerate(header)]
+    lines = []
+    for row in [header] + cells:
+        lines.append("  ".join(c.ljust(w) for c, w in zip(row, widths)).rstrip())
+    return "\n".join(lines)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="benchmark success rates")
+    parser.add_argument("db_path", type=str, help="results.db of one or more runs")
+    parser.add_argument(
+        "--group_by",
+        nargs="+",
+        default=["task", "policy", "seed"],
+        choices=GROUP_COLUMNS,
+    )
+    parser.add_argument("--run_id", type=str, default=None)
+    parser.add_argument("--steps", action="store_true", help="also print mean per stage scores")
+    args = parser.parse_args()
+
+    store = ResultsStore(args.db_path)
+    rows = store.success_rates(args.group_by, run_id=args.run_id)
+    store.close()
+    header = list(args.group_by) + ["episodes", "success", "e2e"]
+    if args.steps:
+        header += STEP_COLUMNS
+    else:
+        rows = [row[: len(header)] for row in rows]
+    print(format_table(header, rows))
+
+
+if __name__ == "__main__":
+    main()
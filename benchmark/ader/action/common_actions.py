@@ -131,6 +131,12 @@ class EvaluateAction(ActionBase):
     def __init__(self, env):
         super().__init__(env)
         self.rpc_robot = env.robot
+        self._aabb_cache = {}
+
+    def update(self, delta_time: float) -> float:
+        # AABBs prefetched for this tick are stale after it
+        self._aabb_cache.clear()
+        return super().update(delta_time)
 
     def _analyze_obj_name(self, obj_name):
         if obj_name.startswith("/World"):
@@ -143,6 +149,12 @@ class EvaluateAction(ActionBase):
 
         return np.array(pose)
 
+    def get_obj_poses(self, *obj_names):
+        prim_paths = [self._analyze_obj_name(obj_name) for obj_name in obj_names]
+        poses = self.rpc_robot.get_prim_world_poses(prim_paths)
+
+        return [np.array(poses[prim_path]) for prim_path in prim_paths]
+
     def get_obj_aabb(self, obj_name, obj_size):
         # Position of objects in world coordinate system
         pose = self.rpc_robot.get_prim_world_pose(self._analyze_obj_name(obj_name))
@@ -187,8 +199,17 @@ class EvaluateAction(ActionBase):
         obj_scale = object_paramsters["scale"]
         return [obj_scale * v for v in obj_size]
 
+    def prefetch_obj_aabbs(self, *obj_names):
+        prim_paths = [self._analyze_obj_name(obj_name) for obj_name in obj_names]
+        aabbs = self.rpc_robot.client.GetObjectAABBs(prim_paths)
+        for prim_path, aabb in zip(prim_paths, aabbs):
+            self._aabb_cache[prim_path] = (aabb[0], aabb[1])
+
     def get_obj_aabb_new(self, obj_name):
-        rsp = self.rpc_robot.client.GetObjectAABB(self._analyze_obj_name(obj_name))
+        prim_path = self._analyze_obj_name(obj_name)
+        if prim_path in self._aabb_cache:
+            return self._aabb_cache[prim_path]
+        rsp = self.rpc_robot.client.GetObjectAABB(prim_path)
         room_aabb_low, room_aabb_hi = np.array(
             [rsp.bbox[0], rsp.bbox[1], rsp.bbox[2]]
         ), np.array([rsp.bbox[3], rsp.bbox[4], rsp.bbox[5]])
@@ -20,6 +20,7 @@ class Cover(EvaluateAction):
 
     def update(self, delta_time: float) -> float:
         # Get the AABB bounding box of two objects
+        self.prefetch_obj_aabbs(self.active_obj, self.passive_obj)
         aa_A, bb_A = self.get_obj_aabb_new(self.active_obj)
         aa_B, bb_B = self.get_obj_aabb_new(self.passive_obj)
 
@@ -23,8 +23,9 @@ class OnShelf(EvaluateAction):
         self.bbox = ast.literal_eval(bbox)
 
     def update(self, delta_time: float) -> float:
-        [x, y, z] = self.get_obj_pose(self.obj_name)[0:3, 3]
-        [x_t, y_t, z_t] = self.get_obj_pose(self.target_name)[0:3, 3]
+        obj_pose, target_pose = self.get_obj_poses(self.obj_name, self.target_name)
+        [x, y, z] = obj_pose[0:3, 3]
+        [x_t, y_t, z_t] = target_pose[0:3, 3]
 
         x_min, x_max = self.bbox[0:2]
         y_min, y_max = self.bbox[2:4]
@@ -13,11 +13,27 @@ from ader.action.common_actions import ActionBase
 
 
 class BaseEnv(object):
-    def __init__(self, robot: IsaacSimRpcRobot) -> None:
+    def __init__(self, robot: IsaacSimRpcRobot, step_dt=None) -> None:
+        """
+        step_dt: None advances the eval actions by wall clock time, otherwise by
+        step_dt seconds of sim time per env.step, independent of host load
+        """
         self.robot = robot
         self.action_executor = ActionManager()
-        self.last_update_time = time.time()
+        self.step_dt = step_dt
+        self.current_step = 0
         self.has_done = False
+        self.reset_clock()
+
+    def reset_clock(self):
+        self.last_update_time = time.time()
+        self.last_update_step = self.current_step
+        self.sim_time = 0.0
+        self.wall_time = 0.0
+
+    def close(self):
+        """release what the env holds on the sim at the end of an episode"""
+        pass
 
     def do_action(self, slot: str, name: str, action: ActionBase):
         self.action_executor.start(slot, name, action)
@@ -45,9 +61,18 @@ class BaseEnv(object):
         if not self.exist_eval_action():
             self.has_done = True
             return
-        delta_time = time.time() - self.last_update_time
+        now = time.time()
+        wall_delta = now - self.last_update_time
+        self.last_update_time = now
+        if self.step_dt is None:
+            delta_time = wall_delta
+        else:
+            # every env.step since the last update counts, a slow tick skips nothing
+            delta_time = (self.current_step - self.last_update_step) * self.step_dt
+        self.last_update_step = self.current_step
+        self.sim_time += delta_time
+        self.wall_time += wall_delta
         self.action_executor.update(delta_time)
-        self.last_update_time = time.time()
         if self.has_done:
             self.cancel_action("eval")
 
@@ -114,13 +139,13 @@ class BaseEnv(object):
                 if "box" not in object_info["name"]:
                     continue
                 self.add_object(object_info)
-            time.sleep(1)
+            self.robot.wait_until_settled()
 
             for object_info in task_info["objects"]:
                 if "obj" not in object_info["name"]:
                     continue
                 self.add_object(object_info)
-            time.sleep(1)
+            self.robot.wait_until_settled()
 
         self.task_info = task_info
         self.robot.target_object = task_info["target_object"]
@@ -15,20 +15,28 @@ from planner.manip_solver import (
     load_task_solution,
     generate_action_stages,
     split_grasp_stages,
+    stage_object_id,
 )
 from benchmark.tasks.demo_task import DemoTask
 from tasks.dummy_task import DummyTask
 from base_utils.transform_utils import calculate_rotation_matrix
+from base_utils.data_utils import pose_difference
 
 
 from base_utils.logger import Logger
 
 logger = Logger()  # Create singleton instance
 
+# a stage plan is reused while its objects stay within these of the planned poses
+PLAN_POSITION_TOLERANCE = 0.005
+PLAN_ANGLE_TOLERANCE = 2.0
+
 
 class DemoEnv(BaseEnv):
-    def __init__(self, robot: Robot, task_file: str, init_task_config, policy=None):
-        super().__init__(robot)
+    def __init__(
+        self, robot: Robot, task_file: str, init_task_config, policy=None, step_dt=None
+    ):
+        super().__init__(robot, step_dt=step_dt)
         self.policy = policy
         self.attached_obj_id = None
         self.current_episode = 0
@@ -59,6 +67,8 @@ class DemoEnv(BaseEnv):
         self.task_info = task_info
         self.policy_stages, self.policy_objects = load_task_solution(task_info)
         self.policy_objects = self.update_objects(self.policy_objects)
+        self.split_stages = split_grasp_stages(self.policy_stages)
+        self.stage_plans = {}
 
     def reset_variables(self):
         """
@@ -66,6 +76,8 @@ class DemoEnv(BaseEnv):
         """
         self.current_episode += 1
         self.current_step = 0
+        self.reset_clock()
+        self.stage_plans = {}
 
     def get_capture_frame(self, data_keys):
         observation = {}
@@ -84,7 +96,7 @@ class DemoEnv(BaseEnv):
             cam_data = {}
             for cam_prim in data_keys["camera"]["camera_prim_list"]:
                 cam_data[cam_prim] = {}
-                response = self.robot.client.capture_frame(camera_prim_path=cam_prim)
+                response, rgb, _ = self.robot.client.read_frame(cam_prim)
                 # cam_info
                 cam_info = {
                     "W": response.color_info.width,
@@ -99,9 +111,7 @@ class DemoEnv(BaseEnv):
                     "scale": 1,
                 }
                 # rgb
-                rgb = np.frombuffer(response.color_image.data, dtype=np.uint8).reshape(
-                    cam_info["H"], cam_info["W"], 4
-                )[:, :, :3]
+                rgb = rgb.reshape(cam_info["H"], cam_info["W"], 4)[:, :, :3]
                 cam_data[cam_prim]["image"] = rgb
 
             observation["camera"] = cam_data
@@ -146,21 +156,56 @@ class DemoEnv(BaseEnv):
         observaion = self.get_observation()
         return observaion
 
+    def plan_poses(self, stages):
+        poses = {}
+        for stage in stages:
+            for key in ["active", "passive"]:
+                obj_id = stage_object_id(stage[key])
+                if obj_id != "gripper":
+                    poses[obj_id] = self.policy_objects[obj_id].obj_pose.copy()
+        return poses
+
+    def get_stage_plan(self, plan_id, stages):
+        """
+        Grasp selection and IK of a stage group only depend on the poses of its
+        objects, so the plan is kept until one of them moves or the plan fails.
+        """
+        if plan_id in self.stage_plans:
+            action_stages, planned_poses = self.stage_plans[plan_id]
+            for obj_id, planned_pose in planned_poses.items():
+                pos_diff, angle_diff = pose_difference(
+                    self.policy_objects[obj_id].obj_pose, planned_pose
+                )
+                if pos_diff > PLAN_POSITION_TOLERANCE or (
+                    angle_diff > PLAN_ANGLE_TOLERANCE
+                ):
+                    logger.info(f"{obj_id} moved, replan stage group {plan_id}")
+                    break
+            else:
+                for _, substages in action_stages:
+                    if substages is not None:
+                        substages.rewind()
+                return action_stages
+
+        action_stages = generate_action_stages(self.policy_objects, stages, self.robot)
+        if len(action_stages):
+            self.stage_plans[plan_id] = (action_stages, self.plan_poses(stages))
+        else:
+            self.stage_plans.pop(plan_id, None)
+        return action_stages
+
     def step(self, actions):
         self.current_step += 1
-        split_stages = split_grasp_stages(self.policy_stages)
         stage_id = -1
         substages = None
-        for _stages in split_stages:
+        for plan_id, _stages in enumerate(self.split_stages):
             extra_params = _stages[0].get("extra_params", {})
             active_id, passive_id = (
                 _stages[0]["active"]["object_id"],
                 _stages[0]["passive"]["object_id"],
             )
             arm = extra_params.get("arm", "right")
-            action_stages = generate_action_stages(
-                self.policy_objects, _stages, self.robot
-            )
+            action_stages = self.get_stage_plan(plan_id, _stages)
             if not len(action_stages):
                 success = False
                 logger.warning("No action stage generated.")
@@ -278,6 +323,8 @@ class DemoEnv(BaseEnv):
                 if success == False:
                     break
             if success == False:
+                # a failed plan is not tried again as is
+                self.stage_plans.pop(plan_id, None)
                 break
 
         observaion = self.get_observation()
@@ -326,7 +373,7 @@ class DemoEnv(BaseEnv):
                 self.articulated_objs.append(object_info["object_id"])
             object_info["material"] = "general"
             self.add_object(object_info)
-        time.sleep(2)
+        self.robot.wait_until_settled()
 
         self.arm = task_info["arm"]
 
@@ -353,20 +400,26 @@ class DemoEnv(BaseEnv):
             material_infos += task_info["object_with_material"][key]
         if len(material_infos):
             self.robot.client.SetMaterial(material_infos)
-            time.sleep(0.3)
+            self.robot.wait_until_settled(objects=False, min_steps=2)
 
         light_infos = []
         for key in task_info["lights"]:
             light_infos += task_info["lights"][key]
         if len(light_infos):
             self.robot.client.SetLight(light_infos)
-            time.sleep(0.3)
+            self.robot.wait_until_settled(objects=False, min_steps=2)
 
     def update_objects(self, objects, arm="right"):
         # update gripper pose
         objects["gripper"].obj_pose = self.robot.get_ee_pose(ee_type="gripper", id=arm)
 
         # update object pose
+        prim_paths = [
+            "/World/Objects/%s" % obj_id
+            for obj_id in objects
+            if obj_id not in ("gripper", "fix_pose")
+        ]
+        obj_poses = self.robot.get_prim_world_poses(prim_paths)
         for obj_id in objects:
             if obj_id == "gripper":
                 continue
@@ -397,9 +450,7 @@ class DemoEnv(BaseEnv):
                         objects[obj_id].joint_position = joint_position
                         objects[obj_id].joint_velocity = joint_velocity
 
-            objects[obj_id].obj_pose = self.robot.get_prim_world_pose(
-                "/World/Objects/%s" % obj_id
-            )
+            objects[obj_id].obj_pose = obj_poses["/World/Objects/%s" % obj_id]
             if (
                 "simple_place" in objects[obj_id].info
                 and objects[obj_id].info["simple_place"]
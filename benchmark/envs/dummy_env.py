@@ -24,16 +24,39 @@ from benchmark.tasks.demo_task import DemoTask
 from tasks.dummy_task import DummyTask
 from base_utils.time_utils import TimerContextManager
 
+# env steps between two observations handed to the policy
+OBSERVATION_INTERVAL = 30
+# sim loop steps per env step, the benchmark policy loop and the sim loop (--rendering_step)
+# both run at 30 Hz by default
+SIM_STEPS_PER_ENV_STEP = 1
+OBSERVATION_TIMEOUT = 10.0  # s
+
 
 class DummyEnv(BaseEnv):
-    def __init__(self, robot: Robot, task_file: str, init_task_config, need_setup=True):
-        super().__init__(robot)
+    def __init__(
+        self,
+        robot: Robot,
+        task_file: str,
+        init_task_config,
+        need_setup=True,
+        step_dt=None,
+        sim_steps_per_env_step=SIM_STEPS_PER_ENV_STEP,
+    ):
+        """
+        sim_steps_per_env_step: sizes the observation stream to the env loop, the server
+        captures one frame per OBSERVATION_INTERVAL env steps instead of frames nobody reads
+        """
+        super().__init__(robot, step_dt=step_dt)
         self.attached_obj_id = None
         self.current_episode = 0
         self.current_step = 0
         self.init_task_config = init_task_config
         self.camera_list = self.init_task_config["recording_setting"]["camera_list"]
         self.specific_task_name = self.init_task_config["specific_task_name"]
+        self.observation_stream = None
+        self.stream_interval = max(
+            1, round(OBSERVATION_INTERVAL * sim_steps_per_env_step)
+        )
 
         # Initialize the scene layout according to task_file
         self.load(task_file)
@@ -64,6 +87,7 @@ class DummyEnv(BaseEnv):
         """
         self.current_episode += 1
         self.current_step = 0
+        self.reset_clock()
 
     def get_observation(self):
         """
@@ -78,12 +102,21 @@ class DummyEnv(BaseEnv):
                 "joint_position": True,
                 "gripper": True,
             }
+
+        The newest streamed frame, captured on the server's cadence rather than when it
+        is read: it is up to one stream interval (OBSERVATION_INTERVAL env steps, ~1 s)
+        older than the last action. Blocks for the next frame if the newest one was read.
         """
-        observation_raw = self.robot.client.get_observation(self.data_keys)
+        observation_raw = self.observation_stream.get(timeout=OBSERVATION_TIMEOUT)
         joint = self.robot.client.get_joint_positions()
 
         return observation_raw
 
+    def close(self):
+        if self.observation_stream is not None:
+            self.observation_stream.close()
+            self.observation_stream = None
+
     def reset(self, data_keys=None):
         if data_keys is None:
             data_keys = {
@@ -99,6 +132,11 @@ class DummyEnv(BaseEnv):
         self.data_keys = data_keys
         self.task.reset(self)
         self.reset_variables()
+        # subscribe once instead of a GetObservation round trip per observation
+        self.close()
+        self.observation_stream = self.robot.stream_observation(
+            self.data_keys, step_interval=self.stream_interval
+        )
         observaion = self.get_observation()
         return observaion
 
@@ -106,7 +144,7 @@ class DummyEnv(BaseEnv):
         observaion = None
         self.current_step += 1
         need_update = False
-        if self.current_step != 1 and self.current_step % 30 == 0:
+        if self.current_step != 1 and self.current_step % OBSERVATION_INTERVAL == 0:
             observaion = self.get_observation()
             self.task.step(self)
             self.action_update()
@@ -151,7 +189,7 @@ class DummyEnv(BaseEnv):
                 self.articulated_objs.append(object_info["object_id"])
             object_info["material"] = "general"
             self.add_object(object_info)
-        time.sleep(2)
+        self.robot.wait_until_settled()
 
         self.arm = task_info["arm"]
 
@@ -169,14 +207,14 @@ class DummyEnv(BaseEnv):
             material_infos += task_info["object_with_material"][key]
         if len(material_infos):
             self.robot.client.SetMaterial(material_infos)
-            time.sleep(0.3)
+            self.robot.wait_until_settled(objects=False, min_steps=2)
 
         light_infos = []
         for key in task_info["lights"]:
             light_infos += task_info["lights"][key]
         if len(light_infos):
             self.robot.client.SetLight(light_infos)
-            time.sleep(0.3)
+            self.robot.wait_until_settled(objects=False, min_steps=2)
 
     def update_objects(self, objects, arm="right"):
         # update gripper pose
@@ -0,0 +1,212 @@
+# Copyright (c) 2023-2025, AgiBot Inc. All Rights Reserved.
+# Author: Genie Sim Team
+# License: Mozilla Public License Version 2.0
+
+import copy
+import multiprocessing as mp
+import os
+import queue
+import traceback
+from collections import deque
+
+from base_utils.logger import Logger
+from base_utils.error_code import ErrorCode
+from base_utils.eval_utils import (
+    EVAL_TEMPLATE,
+    dump_episode_result,
+    dump_eval_result,
+    episode_result_path,
+)
+import base_utils
+
+logger = Logger()  # Create singleton instance
+
+
+class EpisodeItem:
+    def __init__(self, task, episode_id, episode_file, task_config):
+        self.task = task
+        self.episode_id = episode_id
+        self.episode_file = episode_file
+        self.task_config = task_config
+        self.attempt = 0
+
+    @property
+    def key(self):
+        return self.task, self.episode_id
+
+
+def _episode_worker(worker_id, generation, endpoint, ros_domain_id, args, work_queue, event_queue):
+    # one sim server per worker, the server runs a single episode at a time
+    # events carry the worker generation, a restarted worker has a new one
+    if ros_domain_id is not None:
+        os.environ["ROS_DOMAIN_ID"] = str(ros_domain_id)
+    from benchmark.task_benchmark import TaskBenchmark, make_policy
+
+    args = copy.copy(args)
+    args.client_host = endpoint
+    policy = make_policy(args)
+    benchmark = TaskBenchmark(policy, args)
+    try:
+        while True:
+            item = work_queue.get()
+            if item is None:
+                break
+            try:
+                result = benchmark.run_episode(item.task_config, item.episode_file)
+                out_dir = os.path.join(args.output_dir, item.task)
+                dump_episode_result(out_dir, item.episode_id, result)
+                event_queue.put(("done", worker_id, generation, None))
+            except Exception:
+                event_queue.put(("failed", worker_id, generation, traceback.format_exc()))
+    finally:
+        benchmark.close_robot()
+        policy.shutdown()
+
+
+class EpisodeScheduler:
+    """
+    Spreads (task, episode) items over one worker process per sim endpoint.
+    Items are handed to idle workers one at a time, so the scheduler always knows
+    which episode a crashed worker was running. Failed episodes are retried on the
+    next idle worker and a crashed worker is restarted on the same endpoint.
+    Every episode result is written on its own and evaluate_ret is assembled in
+    episode order, so it does not depend on the number of workers.
+    """
+
+    def __init__(self, benchmark, endpoints, max_retries=2, ros_domain_ids=None):
+        self.benchmark = benchmark
+        self.endpoints = endpoints
+        self.max_retries = max_retries
+        self.ros_domain_ids = ros_domain_ids or [None] * len(endpoints)
+        # grpc and rclpy do not survive fork
+        self.context = mp.get_context("spawn")
+        self.event_queue = None
+        self.workers = []
+        self.work_queues = []
+        self.restarts = []
+
+    def collect_items(self):
+        items = []
+        for task in self.benchmark.tasks:
+            for episode_id, (task_config, episode_file) in enumerate(self.benchmark.prepare_task(task)):
+                items.append(EpisodeItem(task, episode_id, episode_file, task_config))
+        return items
+
+    def _start_worker(self, worker_id):
+        work_queue = self.context.Queue()
+        worker = self.context.Process(
+            target=_episode_worker,
+            args=(
+                worker_id,
+                self.restarts[worker_id],
+                self.endpoints[worker_id],
+                self.ros_domain_ids[worker_id],
+                self.benchmark.args,
+                work_queue,
+                self.event_queue,
+            ),
+        )
+        worker.start()
+        self.workers[worker_id] = worker
+        self.work_queues[worker_id] = work_queue
+
+    def _finish(self, item, reason=None):
+        """returns the item if it should run again, writes a failed result otherwise"""
+        if reason is None:
+            logger.info(f"{item.task} episode {item.episode_id} done")
+            return None
+        item.attempt += 1
+        if item.attempt <= self.max_retries:
+            logger.warning(
+                f"{item.task} episode {item.episode_id} failed, retry {item.attempt}/{self.max_retries}: {reason}"
+            )
+            return item
+        logger.error(f"{item.task} episode {item.episode_id} failed: {reason}")
+        result = copy.deepcopy(EVAL_TEMPLATE)
+        result["task_name"] = item.task_config["task"]
+        result["seed"] = self.benchmark.args.seed
+        result["result"]["code"] = int(ErrorCode.ABNORMAL_INTERRUPTION.value)
+        result["result"]["msg"] = reason.strip().splitlines()[-1]
+        out_dir = os.path.join(self.benchmark.output_dir, item.task)
+        dump_episode_result(out_dir, item.episode_id, result)
+        return None
+
+    def _check_workers(self, running, todo):
+        for worker_id, worker in enumerate(self.workers):
+            if worker is None or worker.is_alive():
+                continue
+            endpoint = self.endpoints[worker_id]
+            item = running.pop(worker_id, None)
+            if item is not None:
+                retry = self._finish(item, f"worker on {endpoint} died")
+                if retry is not None:
+                    todo.appendleft(retry)
+            if self.restarts[worker_id] >= self.max_retries:
+                logger.error(f"giving up on {endpoint}")
+                self.workers[worker_id] = None
+                continue
+            self.restarts[worker_id] += 1
+            logger.warning(f"restart worker on {endpoint}")
+            self._start_worker(worker_id)
+        if all(worker is None for worker in self.workers):
+            raise RuntimeError("no benchmark worker left, check the sim endpoints")
+
+    def run(self):
+        items = self.collect_items()
+        todo = deque(item for item in items if self.benchmark.finished_result(item.task, item.episode_id) is None)
+        new_keys = {item.key for item in todo}
+        running = {}
+        self.event_queue = self.context.Queue()
+        self.workers = [None] * len(self.endpoints)
+        self.work_queues = [None] * len(self.endpoints)
+        self.restarts = [0] * len(self.endpoints)
+        # nothing left to run on a fully resumed output dir
+        for worker_id in range(len(self.endpoints) if todo else 0):
+            self._start_worker(worker_id)
+        try:
+            while todo or running:
+                for worker_id, worker in enumerate(self.workers):
+                    if todo and worker is not None and worker_id not in running:
+                        running[worker_id] = todo.popleft()
+                        self.work_queues[worker_id].put(running[worker_id])
+                try:
+                    event, worker_id, generation, reason = self.event_queue.get(timeout=5)
+                except queue.Empty:
+                    self._check_workers(running, todo)
+                    continue
+                if generation != self.restarts[worker_id] or worker_id not in running:
+                    # late event of a dead worker, its item was already retried
+                    logger.warning(f"ignore stale {event} event of worker {worker_id}")
+                    continue
+                item = running.pop(worker_id)
+                retry = self._finish(item, reason if event == "failed" else None)
+                if retry is not None:
+                    todo.append(retry)
+        finally:
+            for worker, work_queue in zip(self.workers, self.work_queues):
+                if worker is not None:
+                    work_queue.put(None)
+            for worker in self.workers:
+                if worker is not None:
+                    worker.join()
+
+        self.dump_results(items, new_keys)
+
+    def dump_results(self, items, new_keys):
+        results = {}
+        for item in items:
+            out_dir = os.path.join(self.benchmark.output_dir, item.task)
+            results.setdefault(item.task, []).append(
+                base_utils.load_json(episode_result_path(out_dir, item.episode_id))
+            )
+        for task, evaluate_results in results.items():
+            dump_eval_result(os.path.join(self.benchmark.output_dir, task), evaluate_results)
+            # episodes finished by an earlier run are already in the results store
+            self.benchmark.store_results(
+                task,
+                [
+                    (episode_id, result)
+                    for episode_id, result in enumerate(evaluate_results)
+                    if (task, episode_id) in new_keys
+                ],
+            )
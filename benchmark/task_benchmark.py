@@ -3,7 +3,9 @@
 # License: Mozilla Public License Version 2.0
 
 import argparse
-import os, sys
+import copy
+import os, sys, time
+import random
 import numpy as np
 import glob
 import json, uuid
@@ -30,6 +32,7 @@ from layout.task_generate import TaskGenerator
 from hooks.task import TaskMetric, TaskHook
 from base_utils.error_code import ErrorCode
 from base_utils.eval_utils import *
+from base_utils.results_store import ResultsStore
 
 import base_utils
 
@@ -62,6 +65,11 @@ class TaskBenchmark(object):
         self.task_config = None
         self.record = args.record
         self.fps = args.fps
+        self.reset_mode = args.reset_mode
+        self.run_id = None
+        # soft reset: robot kept across episodes as long as robot and scene match
+        self.robot = None
+        self.robot_key = None
 
     def check_task(self, args):
         if not os.path.exists(self.output_dir):
@@ -88,56 +96,134 @@ class TaskBenchmark(object):
         return tasks
 
     def evaluate_policy(self):
-        for task in self.tasks:
-            # load task config
-            task_config_file = os.path.join(
-                base_utils.benchmark_ader_path(), "eval_tasks", task + ".json"
+        self.run_id = self.resolve_run_id()
+        if self.args.sim_endpoints:
+            from benchmark.episode_scheduler import EpisodeScheduler
+
+            scheduler = EpisodeScheduler(
+                self,
+                self.args.sim_endpoints,
+                max_retries=self.args.max_retries,
+                ros_domain_ids=self.args.ros_domain_ids,
             )
-            self.task_config = base_utils.load_json(task_config_file)
-            self.task_config["specific_task_name"] = task
+            scheduler.run()
+            return
 
-            # benchmark result
+        for task in self.tasks:
             out_dir = os.path.join(self.output_dir, task)
-            if not os.path.exists(out_dir):
-                os.makedirs(out_dir)
             evaluate_results = []
-            episode = 0
-            per_episode_metrics = {}
-            scene_instance_ids = [0]
-            for instance_id in scene_instance_ids:
-                # one instance
-                self.task_config["scene"]["scene_instance_id"] = instance_id
-
-                task_generator = TaskGenerator(self.task_config)
-                task_folder = os.path.join(
-                    base_utils.benchmark_root_path(),
-                    "saved_task/%s" % (self.task_config["task"]),
-                )
-                task_generator.generate_tasks(
-                    save_path=task_folder,
-                    task_num=self.episodes_per_instance,
-                    task_name=self.task_config["task"],
-                )
-                robot_position = task_generator.robot_init_pose["position"]
-                robot_rotation = task_generator.robot_init_pose["quaternion"]
-                self.task_config["robot"]["robot_init_pose"][
-                    "position"
-                ] = robot_position
-                self.task_config["robot"]["robot_init_pose"][
-                    "quaternion"
-                ] = robot_rotation
-                specific_task_files = glob.glob(task_folder + "/*.json")
-                for episode_id in range(self.episodes_per_instance):
-                    self.single_evaluate_ret = EVAL_TEMPLATE
-                    # one episode
-                    episode_file = specific_task_files[episode_id]
-                    per_episode_metrics[episode] = self.evaluate_episode(episode_file)
-                    episode += 1
-                    summarize_scores(self.single_evaluate_ret, self.task_name)
-                    evaluate_results.append(self.single_evaluate_ret)
+            new_results = []
+            for episode_id, (task_config, episode_file) in enumerate(
+                self.prepare_task(task)
+            ):
+                result = self.finished_result(task, episode_id)
+                if result is None:
+                    result = self.run_episode(task_config, episode_file)
+                    # written right away, a crashed run resumes after this episode
+                    dump_episode_result(out_dir, episode_id, result)
+                    new_results.append((episode_id, result))
+                evaluate_results.append(result)
 
             # output evaluate_results
             dump_eval_result(out_dir, evaluate_results)
+            self.store_results(task, new_results)
+        self.close_robot()
+
+    def resolve_run_id(self):
+        # a resumed run keeps its run id, the results store sees a single run
+        run_id_file = os.path.join(self.output_dir, "run_id")
+        if self.args.resume and os.path.exists(run_id_file):
+            with open(run_id_file, "r") as f:
+                return f.read().strip()
+        run_id = "%s_%s" % (time.strftime("%Y%m%d_%H%M%S"), uuid.uuid4().hex[:8])
+        with open(run_id_file, "w") as f:
+            f.write(run_id)
+        return run_id
+
+    def finished_result(self, task, episode_id):
+        """with --resume, the result of an episode an earlier run already finished"""
+        if not self.args.resume:
+            return None
+        file_path = episode_result_path(os.path.join(self.output_dir, task), episode_id)
+        if not os.path.exists(file_path):
+            return None
+        result = base_utils.load_json(file_path)
+        # a different seed means a different layout, interrupted episodes run again
+        if result.get("seed") != self.args.seed:
+            return None
+        if result["result"]["code"] == int(ErrorCode.ABNORMAL_INTERRUPTION.value):
+            return None
+        logger.info(f"Resume: {task} episode {episode_id} already finished")
+        return result
+
+    def store_results(self, task, episode_results):
+        """episode_results: [(episode_id, result)] of the episodes run by this invocation"""
+        if not self.args.results_db or not episode_results:
+            return
+        store = ResultsStore(self.args.results_db)
+        try:
+            store.append_results(
+                self.run_id,
+                task,
+                self.args.policy_class,
+                self.args.seed,
+                episode_results,
+            )
+        finally:
+            store.close()
+
+    def prepare_task(self, task):
+        """generate the episodes of a task, returns [(task_config, episode_file)]"""
+        # load task config
+        task_config_file = os.path.join(
+            base_utils.benchmark_ader_path(), "eval_tasks", task + ".json"
+        )
+        self.task_config = base_utils.load_json(task_config_file)
+        self.task_config["specific_task_name"] = task
+
+        # benchmark result
+        out_dir = os.path.join(self.output_dir, task)
+        if not os.path.exists(out_dir):
+            os.makedirs(out_dir)
+        episodes = []
+        scene_instance_ids = [0]
+        for instance_id in scene_instance_ids:
+            # one instance
+            self.task_config["scene"]["scene_instance_id"] = instance_id
+
+            task_generator = TaskGenerator(
+                self.task_config,
+                seed=self.args.seed,
+                cache_dir=self.args.layout_cache or None,
+            )
+            task_folder = os.path.join(
+                base_utils.benchmark_root_path(),
+                "saved_task/%s" % (self.task_config["task"]),
+            )
+            task_generator.generate_tasks(
+                save_path=task_folder,
+                task_num=self.episodes_per_instance,
+                task_name=self.task_config["task"],
+            )
+            robot_position = task_generator.robot_init_pose["position"]
+            robot_rotation = task_generator.robot_init_pose["quaternion"]
+            self.task_config["robot"]["robot_init_pose"]["position"] = robot_position
+            self.task_config["robot"]["robot_init_pose"]["quaternion"] = robot_rotation
+            # sorted, episode ids must not depend on directory listing order
+            specific_task_files = sorted(glob.glob(task_folder + "/*.json"))
+            instance_config = copy.deepcopy(self.task_config)
+            for episode_id in range(self.episodes_per_instance):
+                episodes.append((instance_config, specific_task_files[episode_id]))
+        return episodes
+
+    def run_episode(self, task_config, episode_file):
+        self.task_config = task_config
+        # one episode, a fresh result so episodes do not share the template dict
+        self.single_evaluate_ret = copy.deepcopy(EVAL_TEMPLATE)
+        self.single_evaluate_ret["seed"] = self.args.seed
+        self.evaluate_episode(episode_file)
+        summarize_scores(self.single_evaluate_ret, self.task_name)
+        return self.single_evaluate_ret
 
     def evaluate_episode(self, episode_file):
         # Create agent to be evaluated
@@ -146,22 +232,28 @@ class TaskBenchmark(object):
         else:
             robot_cfg = self.task_config["robot"]["robot_cfg"]
         # init robot and scene
-        robot = IsaacSimRpcRobot(
-            robot_cfg=robot_cfg,
-            scene_usd=self.task_config["scene"]["scene_usd"],
-            client_host=self.args.client_host,
-            position=self.task_config["robot"]["robot_init_pose"]["position"],
-            rotation=self.task_config["robot"]["robot_init_pose"]["quaternion"],
-            gripper_control_type=self.args.gripper_control_type,
-        )
+        setup_start = time.perf_counter()
+        robot = self.setup_robot(robot_cfg)
 
+        step_dt = self.args.step_dt if self.args.time_mode == "sim" else None
         if self.args.env_class == "DemoEnv":
-            env = DemoEnv(robot, episode_file, self.task_config, self.policy)
+            env = DemoEnv(
+                robot, episode_file, self.task_config, self.policy, step_dt=step_dt
+            )
         else:
-            env = DummyEnv(robot, episode_file, self.task_config)
+            env = DummyEnv(
+                robot,
+                episode_file,
+                self.task_config,
+                step_dt=step_dt,
+                sim_steps_per_env_step=self.args.sim_steps_per_env_step,
+            )
         init_pose = self.task_config["robot"].get("init_arm_pose")
         if init_pose:
             robot.set_init_pose(init_pose)
+        setup_time = time.perf_counter() - setup_start
+        self.single_evaluate_ret["setup_time"] = setup_time
+        logger.info(f"Episode setup ({self.reset_mode} reset) took {setup_time:.2f}s")
 
         (
             start_callbacks,
@@ -209,16 +301,65 @@ class TaskBenchmark(object):
 
         for callback in end_callbacks:  # during task
             callback(env, action)
+        env.close()
         self.single_evaluate_ret["end_time"] = base_utils.TIMENOW()
+        # time seen by the eval actions vs host time, equal in wall time mode
+        self.single_evaluate_ret["sim_time"] = env.sim_time
+        self.single_evaluate_ret["wall_time"] = env.wall_time
+        logger.info(
+            f"Episode eval time {env.sim_time:.2f}s, wall time {env.wall_time:.2f}s"
+        )
 
         if self.record:
             env.robot.client.stop_recording()
 
-        robot.client.Exit()
+        if self.reset_mode == "hard":
+            robot.client.Exit()
 
         metrics_summary = {}
         return metrics_summary
 
+    def setup_robot(self, robot_cfg):
+        """
+        hard: InitRobot for every episode, the server exits at the end of the episode
+        soft: reuse the robot and scene of the previous episode, only the layout is rebuilt
+        """
+        scene_usd = self.task_config["scene"]["scene_usd"]
+        robot_init_pose = self.task_config["robot"]["robot_init_pose"]
+        robot_key = (
+            robot_cfg,
+            scene_usd,
+            tuple(robot_init_pose["position"]),
+            tuple(robot_init_pose["quaternion"]),
+        )
+        if self.robot is not None:
+            if self.robot_key == robot_key:
+                self.robot.soft_reset()
+                return self.robot
+            logger.warning("Robot or scene changed, falling back to a hard reset")
+            self.close_robot()
+
+        robot = IsaacSimRpcRobot(
+            robot_cfg=robot_cfg,
+            scene_usd=scene_usd,
+            client_host=self.args.client_host,
+            position=robot_init_pose["position"],
+            rotation=robot_init_pose["quaternion"],
+            gripper_control_type=self.args.gripper_control_type,
+            use_shm=self.args.use_shm,
+            local_ik_workers=self.args.local_ik_workers,
+        )
+        if self.reset_mode == "soft":
+            self.robot = robot
+            self.robot_key = robot_key
+        return robot
+
+    def close_robot(self):
+        if self.robot is not None:
+            self.robot.client.Exit()
+            self.robot = None
+            self.robot_key = None
+
     def convert_code(self, info):
         if info["done_cond_name"] == "Timeout":
             return int(ErrorCode.OUT_OF_MAX_STEP.value)
@@ -298,13 +439,23 @@ class TaskBenchmark(object):
             logger.info("Aggregated eval results saved to %s" % summary_log_file)
 
 
+def make_policy(args):
+    if args.policy_class == "DemoPolicy":
+        return DemoPolicy(task_name=args.task_name)
+    elif args.policy_class == "BaselinePolicy":
+        return BaselinePolicy(task_name=args.task_name)
+    raise ValueError("Invalid policy class: {}".format(args.policy_class))
+
+
 def main():
     parser = argparse.ArgumentParser()
     parser.add_argument(
         "--client_host",
+        "--sim_endpoint",
+        dest="client_host",
         type=str,
-        default="localhost:50051",
-        help="The client host",
+        default=os.getenv("SIM_ENDPOINT", "localhost:50051"),
+        help="host:port of the sim server this benchmark shard talks to, env SIM_ENDPOINT",
     )
     parser.add_argument(
         "--num_episode",
@@ -348,19 +499,110 @@ def main():
         "--fps", type=int, default=30, help="Set the fps of the recording"
     )
     parser.add_argument("--record", action="store_true", help="Enable data recording")
+    parser.add_argument(
+        "--use_shm",
+        action="store_true",
+        help="Read camera frames through shared memory, sim server on the same host",
+    )
+    parser.add_argument(
+        "--local_ik_workers",
+        type=int,
+        default=0,
+        help="Filter grasp candidates with the IK-SDK solver in this many local processes instead of GetIKStatus, 0 to disable",
+    )
+    parser.add_argument(
+        "--seed",
+        type=int,
+        default=None,
+        help="Seed the layout generation, recorded with the results",
+    )
+    parser.add_argument(
+        "--resume",
+        action="store_true",
+        help="Skip episodes an earlier run with the same output_dir and seed already finished",
+    )
+    parser.add_argument(
+        "--results_db",
+        type=str,
+        default=None,
+        help="SQLite file the episode results are appended to, default <output_dir>/results.db, empty to disable",
+    )
+    parser.add_argument(
+        "--layout_cache",
+        type=str,
+        default=None,
+        help="Directory of generated layouts reused by runs with the same task, assets and --seed, default <benchmark>/layout_cache, empty to disable",
+    )
+    parser.add_argument(
+        "--time_mode",
+        type=str,
+        default="wall",
+        choices=["wall", "sim"],
+        help="Advance eval actions (timeouts, waits) by wall clock or by --step_dt per env step",
+    )
+    parser.add_argument(
+        "--step_dt",
+        type=float,
+        default=1.0 / 30,
+        help="Sim seconds per env step with --time_mode sim, matches the 30Hz policy loop",
+    )
+    parser.add_argument(
+        "--sim_steps_per_env_step",
+        type=float,
+        default=1.0,
+        help="Sim loop steps per env step, sizes the DummyEnv observation stream to the env loop",
+    )
+    parser.add_argument(
+        "--reset_mode",
+        type=str,
+        default="hard",
+        choices=["hard", "soft"],
+        help="hard: InitRobot and Exit per episode, soft: keep robot and scene loaded between episodes",
+    )
+    parser.add_argument(
+        "--sim_endpoints",
+        type=str,
+        nargs="+",
+        default=None,
+        help="Run episodes in parallel, one worker process per sim server host:port",
+    )
+    parser.add_argument(
+        "--max_retries",
+        type=int,
+        default=2,
+        help="Retries of a failed episode with --sim_endpoints",
+    )
+    parser.add_argument(
+        "--ros_domain_ids",
+        type=int,
+        nargs="+",
+        default=None,
+        help="ROS_DOMAIN_ID of each worker, matching its sim server's",
+    )
     args = parser.parse_args()
+    if args.results_db is None:
+        args.results_db = os.path.join(args.output_dir, "results.db")
+    if args.layout_cache is None:
+        args.layout_cache = os.path.join(
+            base_utils.benchmark_root_path(), "layout_cache"
+        )
+    if args.seed is not None:
+        random.seed(args.seed)
+        np.random.seed(args.seed)
+    if args.ros_domain_ids and len(args.ros_domain_ids) != len(args.sim_endpoints or []):
+        parser.error("--ros_domain_ids needs one id per --sim_endpoints entry")
 
     logger.info(
         "Evaluating agent of type {} on {}".format(args.policy_class, args.task_name)
     )
 
-    if args.policy_class == "DemoPolicy":
-        policy = DemoPolicy(task_name=args.task_name)
-    elif args.policy_class == "BaselinePolicy":
-        policy = BaselinePolicy(task_name=args.task_name)
-    else:
-        raise ValueError("Invalid policy class: {}".format(args.policy_class))
+    if args.sim_endpoints:
+        # every worker process creates its own policy
+        benchmark = TaskBenchmark(None, args)
+        benchmark.evaluate_policy()
+        return
 
+    policy = make_policy(args)
     benchmark = TaskBenchmark(policy, args)
     benchmark.evaluate_policy()  # Evaluate agent on the benchmark
     policy.shutdown()
@@ -5,6 +5,10 @@
 import os, sys
 import json
 import time
+import random
+import shutil
+import hashlib
+import zlib
 import numpy as np
 
 current_directory = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
@@ -22,6 +26,10 @@ from base_utils.logger import Logger
 logger = Logger()  # Create singleton instance
 
 
+# bump when a layout code change makes cached layouts stale
+LAYOUT_CACHE_VERSION = 2
+
+
 def list_to_dict(data: list):
     tmp = {}
     for i in range(len(data)):
@@ -130,10 +138,55 @@ class LayoutGenerator:
 
 
 class TaskGenerator:
-    def __init__(self, task_template):
+    def __init__(self, task_template, seed=None, cache_dir=None):
         self.data_root = os.path.dirname(os.path.dirname(__file__)) + "/assets"
+        self.seed = seed
+        # unseeded layouts are meant to differ from run to run, only seeded ones are cached
+        self.cache_dir = cache_dir if seed is not None else None
+        self.layouts = None
+        # hash before init_info, it updates the fix objects of the template in place
+        self.cache_key = None
+        if self.cache_dir is not None:
+            self.cache_key = self.layout_cache_key(task_template)
         self.init_info(task_template)
 
+    def _asset_version(self, relative_path):
+        path = os.path.join(self.data_root, relative_path)
+        if not os.path.exists(path):
+            return None
+        stat = os.stat(path)
+        return [stat.st_mtime_ns, stat.st_size]
+
+    def layout_cache_key(self, task_template):
+        """hash of the task json, the asset files the layout is built from and the seed"""
+        assets = {}
+        objects = task_template["objects"]
+        for obj in (
+            objects["task_related_objects"]
+            + objects["extra_objects"]
+            + objects.get("fix_objects", [])
+        ):
+            if "data_info_dir" not in obj:
+                continue
+            for name in ["object_parameters.json", "Aligned.obj"]:
+                relative_path = os.path.join(obj["data_info_dir"], name)
+                assets[relative_path] = self._asset_version(relative_path)
+        if "scene_info_dir" in task_template["scene"]:
+            relative_path = (
+                task_template["scene"]["scene_info_dir"] + "/scene_parameters.json"
+            )
+            assets[relative_path] = self._asset_version(relative_path)
+        content = json.dumps(
+            {
+                "version": LAYOUT_CACHE_VERSION,
+                "task": task_template,
+                "assets": assets,
+                "seed": self.seed,
+            },
+            sort_keys=True,
+        )
+        return hashlib.sha256(content.encode("utf-8")).hexdigest()
+
     def _load_json(self, relative_path):
         with open(os.path.join(self.data_root, relative_path), "r") as file:
             return json.load(file)
@@ -187,10 +240,9 @@ class TaskGenerator:
                 if "extent" in obj:
                     info["extent"] = obj["extent"]
                 obj_infos[obj_id] = info
-                logger.info(f"obj_id {obj_id} all_key_objs {all_key_objs}")
-                objects[obj_id] = LayoutObject(info, use_sdf=obj_id in all_key_objs)
 
         self.obj_infos, self.objects = obj_infos, objects
+        self.sdf_obj_ids = all_key_objs
 
         self.fix_obj_infos = []
         for fix_obj in self.fix_objs:
@@ -250,27 +302,91 @@ class TaskGenerator:
             workspaces = {"0": workspaces[robot_init_workspace_id]}
         elif isinstance(workspaces, dict) and "position" in workspaces:
             workspaces = {"0": workspaces}
-        self.layouts = {}
+        self.workspaces, self.constraint = workspaces, constraint
 
-        for key in workspaces:
+    def init_layouts(self):
+        """Load meshes, sdf and collision points of the objects, only needed to solve layouts"""
+        for obj_id, info in self.obj_infos.items():
+            if obj_id in self.objects:
+                continue
+            logger.info(f"obj_id {obj_id} all_key_objs {self.sdf_obj_ids}")
+            self.objects[obj_id] = LayoutObject(
+                info, use_sdf=obj_id in self.sdf_obj_ids
+            )
+
+        self.layouts = {}
+        for key in self.workspaces:
             ws, key_ids, extra_ids = (
-                workspaces[key],
+                self.workspaces[key],
                 self.key_obj_ids.get(key, []),
                 self.extra_obj_ids.get(key, []),
             )
             self.layouts[key] = LayoutGenerator(
                 ws,
-                obj_infos,
-                objects,
+                self.obj_infos,
+                self.objects,
                 key_ids,
                 extra_ids,
-                constraint=constraint,
+                constraint=self.constraint,
                 fix_obj_ids=self.fix_obj_ids,
             )
 
+    def _cache_path(self, task_num):
+        return os.path.join(self.cache_dir, "%s_%d" % (self.cache_key, task_num))
+
+    def load_cached_tasks(self, save_path, task_num):
+        """Copy the episodes of an earlier identical generation, False on a cache miss"""
+        if self.cache_dir is None:
+            return False
+        cache_path = self._cache_path(task_num)
+        if not os.path.isdir(cache_path):
+            return False
+        for file_name in sorted(os.listdir(cache_path)):
+            shutil.copyfile(
+                os.path.join(cache_path, file_name), os.path.join(save_path, file_name)
+            )
+        logger.info(f"Loaded cached layouts from {cache_path}")
+        return True
+
+    def save_cached_tasks(self, task_num, task_files):
+        if self.cache_dir is None or not task_files:
+            return
+        cache_path = self._cache_path(task_num)
+        if os.path.isdir(cache_path):
+            return
+        # rename a complete directory into place, parallel runs may fill the same entry
+        tmp_path = cache_path + ".tmp%d" % os.getpid()
+        os.makedirs(tmp_path, exist_ok=True)
+        for task_file in task_files:
+            shutil.copyfile(
+                task_file, os.path.join(tmp_path, os.path.basename(task_file))
+            )
+        try:
+            os.rename(tmp_path, cache_path)
+        except OSError:
+            shutil.rmtree(tmp_path, ignore_errors=True)
+
+    def seed_random(self, task_name, stage):
+        """seed the global random and np.random streams from the task seed"""
+        if self.seed is None:
+            return
+        # per task, a layout must not depend on the tasks generated (or cached) before it
+        stage_seed = zlib.crc32(f"{self.seed}:{task_name}:{stage}".encode("utf-8"))
+        random.seed(stage_seed)
+        np.random.seed(stage_seed)
+
     def generate_tasks(self, save_path, task_num, task_name):
         os.makedirs(save_path, exist_ok=True)
-
+        self.seed_random(task_name, "layout")
+        if not self.load_cached_tasks(save_path, task_num):
+            self.solve_tasks(save_path, task_num, task_name)
+        # the episodes draw from the same streams after a cache hit as after a miss
+        self.seed_random(task_name, "episode")
+
+    def solve_tasks(self, save_path, task_num, task_name):
+        if self.layouts is None:
+            self.init_layouts()
+        task_files = []
         for i in range(task_num):
             output_file = os.path.join(save_path, f"{task_name}_%d.json" % (i))
             self.task_template["objects"] = []
@@ -293,3 +409,5 @@ class TaskGenerator:
             logger.info("Saved task json to %s" % output_file)
             with open(output_file, "w") as f:
                 json.dump(self.task_template, f, indent=4)
+            task_files.append(output_file)
+        self.save_cached_tasks(task_num, task_files)
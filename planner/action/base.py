@@ -2,12 +2,31 @@
 # Author: Genie Sim Team
 # License: Mozilla Public License Version 2.0
 
-import copy
 import numpy as np
-from collections import deque
+from collections import deque, namedtuple
+from types import MappingProxyType
 
 from base_utils.data_utils import pose_difference
 
+# what a stage needs to remember about an object, without its grasps and meshes
+PoseSnapshot = namedtuple(
+    "PoseSnapshot", ["obj_pose", "joint_position", "joint_velocity"]
+)
+
+
+def snapshot_objects(objects):
+    """Read only {object_id: PoseSnapshot}, a cheap stand-in for deepcopy(objects)"""
+    snapshot = {}
+    for obj_id, obj in objects.items():
+        obj_pose = np.array(obj.obj_pose, dtype=float)
+        obj_pose.flags.writeable = False
+        snapshot[obj_id] = PoseSnapshot(
+            obj_pose,
+            getattr(obj, "joint_position", None),
+            getattr(obj, "joint_velocity", None),
+        )
+    return MappingProxyType(snapshot)
+
 
 def simple_check_completion(
     goal,
@@ -101,6 +120,11 @@ class StageTemplate:
     def __len__(self) -> int:
         return len(self.sub_stages) - self.step_id
 
+    def rewind(self):
+        """Start over from the first sub-stage, to execute the same plan again"""
+        self.step_id = 0
+        self.last_statement = None
+
     def get_action(self, objects):
         if self.__len__() == 0:
             return None
@@ -125,7 +149,7 @@ class StageTemplate:
                 target_gripper_pose = solve_target_gripper_pose(goal_datapack, objects)
 
             last_statement = {
-                "objects": copy.deepcopy(objects),
+                "objects": snapshot_objects(objects),
                 "target_gripper_pose": target_gripper_pose,
             }
             self.last_statement = last_statement
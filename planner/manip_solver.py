@@ -6,7 +6,6 @@ import os, sys
 import copy
 import json
 import time
-import trimesh
 
 curPath = os.path.abspath(os.path.dirname(__file__))
 rootPath = os.path.split(curPath)[0]
@@ -16,10 +15,10 @@ import numpy as np
 from base_utils.transform_utils import calculate_rotation_matrix, rotate_around_axis
 from base_utils.object import OmniObject, transform_coordinates_3d
 from base_utils.data_utils import pose_difference_batch, vector_difference_batch
+from base_utils.mesh_cache import surface_samples
 from base_utils.fix_rotation import (
     rotate_180_along_axis,
     translate_along_axis,
-    rotate_along_axis,
 )
 
 
@@ -32,6 +31,9 @@ from base_utils.logger import Logger
 
 logger = Logger()  # Create singleton instance
 
+# rotate_along_axis(pose, 180, "z", use_local=True) as a right-multiplied transform
+GRASP_FLIP_Z = np.diag([-1.0, -1.0, 1.0, 1.0])
+
 
 def format_object(obj, distance, type="active"):
     if obj is None:
@@ -207,15 +209,18 @@ def load_task_solution(task_info):
     return stages, objects
 
 
+def stage_object_id(stage_obj):
+    """key of a stage active/passive object in the load_task_solution objects"""
+    obj_id = stage_obj["object_id"]
+    if "part_id" in stage_obj:
+        obj_id += "/%s" % stage_obj["part_id"]
+    return obj_id
+
+
 def parse_stage(stage, objects):
     action = stage["action"]
-    active_obj_id = stage["active"]["object_id"]
-    if "part_id" in stage["active"]:
-        active_obj_id += "/%s" % stage["active"]["part_id"]
-
-    passive_obj_id = stage["passive"]["object_id"]
-    if "part_id" in stage["passive"]:
-        passive_obj_id += "/%s" % stage["passive"]["part_id"]
+    active_obj_id = stage_object_id(stage["active"])
+    passive_obj_id = stage_object_id(stage["passive"])
 
     active_obj = objects[active_obj_id]
     passive_obj = objects[passive_obj_id]
@@ -285,8 +290,7 @@ def select_obj(objects, stages, robot):
         grasp_widths = passive_element["width"]
 
         z_values = grasp_poses_canonical[:, 1, 3]
-        z_lower_threshold = np.percentile(z_values, 20)
-        z_upper_threshold = np.percentile(z_values, 40)
+        z_lower_threshold, z_upper_threshold = np.percentile(z_values, [20, 40])
         # filter grasp pose with z_min and z_max value
         mask = (z_values <= z_upper_threshold) & (z_values >= z_lower_threshold)
         grasp_poses_canonical = grasp_poses_canonical[mask]
@@ -296,25 +300,16 @@ def select_obj(objects, stages, robot):
             grasp_poses_canonical[:, :3, :3]
             @ robot.robot_gripper_2_grasp_gripper[np.newaxis, ...]
         )
-        grasp_poses_canonical_flip = []
-        for _i in range(grasp_poses_canonical.shape[0]):
-            grasp_poses_canonical_flip.append(
-                rotate_along_axis(grasp_poses_canonical[_i], 180, "z", use_local=True)
-            )
-
         grasp_poses_canonical = np.concatenate(
-            [grasp_poses_canonical, grasp_poses_canonical_flip], axis=0
+            [grasp_poses_canonical, grasp_poses_canonical @ GRASP_FLIP_Z], axis=0
         )
         grasp_widths = np.concatenate([grasp_widths, grasp_widths], axis=0)
         grasp_poses = (
             objects[passive_obj_id].obj_pose[np.newaxis, ...] @ grasp_poses_canonical
         )
 
-        # grasp offset
-        grasp_rotate = grasp_poses.copy()
-        grasp_rotate[:, :3, 3] = np.array([0, 0, 0])
-        transport_vector = grasp_rotate @ np.array([0, 0, 1, 0])[:, np.newaxis]
-        transport_vector = transport_vector[:, :3, 0]
+        # grasp offset, along the gripper z axis
+        transport_vector = grasp_poses[:, :3, 2]
         transport_vector = transport_vector / np.linalg.norm(
             transport_vector, axis=1, keepdims=True
         )
@@ -362,10 +357,9 @@ def select_obj(objects, stages, robot):
 
             if action == "place":
                 obj_pose = active_obj.obj_pose
-                mesh = trimesh.load(active_obj.info["mesh_file"], force="mesh")
-                mesh.apply_scale(0.001)
-                mesh.apply_transform(obj_pose)
-                pts, _ = trimesh.sample.sample_surface(mesh, 200)  # Surface sampling
+                # Surface sampling, cached per mesh file, mm to m then to world
+                pts = surface_samples(active_obj.info["mesh_file"], 200) * 0.001
+                pts = pts @ obj_pose[:3, :3].T + obj_pose[:3, 3]
                 xyz = np.array(
                     [
                         np.mean(pts[:, 0]),
@@ -15,6 +15,7 @@ import os, time
 from scipy.spatial.transform import Rotation
 from robot import Robot
 from robot.isaac_sim.client import Rpc_Client
+from robot import local_ik
 from robot.utils import (
     get_quaternion_wxyz_from_rotation_matrix,
     get_rotation_matrix_from_quaternion,
@@ -36,6 +37,16 @@ from copy import deepcopy
 
 SIM_REPO_ROOT = os.getenv("SIM_REPO_ROOT")
 
+# wait_until_settled limits, steps are sim loop steps (one per rendered frame)
+SETTLE_MAX_STEPS = 240
+SETTLE_LINEAR_VELOCITY = 0.01  # m/s
+SETTLE_ANGULAR_VELOCITY = 0.1  # rad/s
+SETTLE_JOINT_VELOCITY = 0.05  # rad/s
+
+# local IK is only used while it agrees with GetIKStatus on the check poses
+LOCAL_IK_CHECK_POSES = 64
+LOCAL_IK_MIN_AGREEMENT = 0.95
+
 
 def mat_to_rot6d(mat):
     batch_dim = mat.shape[:-2]
@@ -88,6 +99,8 @@ class IsaacSimRpcRobot(Robot):
         position=[0, 0, 0],
         rotation=[1, 0, 0, 0],
         gripper_control_type=0,
+        use_shm=False,
+        local_ik_workers=0,
     ):
         robot_urdf = robot_cfg.split(".")[0] + ".urdf"
         self.robot_cfg = robot_cfg
@@ -96,7 +109,7 @@ class IsaacSimRpcRobot(Robot):
             self.ik_solver_cfg = "g1_solver.yaml"
         else:
             raise ValueError(f"robot_cfg is not valid {self.robot_cfg}")
-        self.client = Rpc_Client(client_host, robot_urdf)
+        self.client = Rpc_Client(client_host, robot_urdf, use_shm=use_shm)
         self.client.InitRobot(
             robot_cfg=robot_cfg,
             robot_usd="",
@@ -124,6 +137,11 @@ class IsaacSimRpcRobot(Robot):
                 "idx67_arm_r_joint7",
             ],
         }
+        # gripper_control_joint of the robot cfg, the other finger joints follow it
+        self.gripper_joint_names = {
+            "left": ["idx41_gripper_l_outer_joint1"],
+            "right": ["idx81_gripper_r_outer_joint1"],
+        }
 
         self.cam_info = None
         if "omnipicker" in robot_cfg:
@@ -143,6 +161,12 @@ class IsaacSimRpcRobot(Robot):
         self.left_grasp_close = False
         self.right_grasp_close = False
         self.reset_odometry()
+        self.local_ik_workers = local_ik_workers
+        # arms whose local solver agrees with GetIKStatus
+        self.local_ik_arms = set()
+        for arm in ["left", "right"]:
+            if self.local_ik_workers:
+                self.check_local_ik(arm=arm)
 
     def reset_odometry(self):
         self.init_transform()
@@ -174,9 +198,42 @@ class IsaacSimRpcRobot(Robot):
     def reset(self):
         self.target_object = None
         self.client.reset()
-        time.sleep(0.5)
+        # objects are removed on the next app update
+        self.wait_until_settled(objects=False, min_steps=2)
         self.close_gripper(id="right")
-        time.sleep(0.5)
+        self.wait_until_settled(objects=False, joints=self.gripper_joint_names["right"])
+
+    def wait_until_settled(
+        self, objects=True, joints=False, min_steps=1, max_steps=SETTLE_MAX_STEPS
+    ):
+        """
+        Block on the sim instead of sleeping a fixed time: until the added objects and/or the
+        robot joints are at rest, with neither just until min_steps sim steps have run.
+        joints: True for all robot joints, or a list of the joint names to watch
+        """
+        settled = self.client.WaitUntilSettled(
+            min_steps=min_steps,
+            max_steps=max_steps,
+            linear_velocity=SETTLE_LINEAR_VELOCITY if objects else 0.0,
+            angular_velocity=SETTLE_ANGULAR_VELOCITY if objects else 0.0,
+            joint_velocity=SETTLE_JOINT_VELOCITY if joints else 0.0,
+            joint_names=joints if isinstance(joints, (list, tuple)) else (),
+        )
+        if not settled:
+            logger.warning(f"Sim not settled after {max_steps} steps")
+        return settled
+
+    def soft_reset(self):
+        """
+        Prepare the next episode without InitRobot: the server restores the robot joints,
+        detaches grasped objects and removes the layout objects, the scene stays loaded.
+        """
+        self.target_object = None
+        self.client.reset(soft=True)
+        self.left_grasp_close = False
+        self.right_grasp_close = False
+        self.last_eef_pos = [None, None]
+        self.reset_odometry()
 
     def setup(self):
         self.target_object = None
@@ -236,7 +293,9 @@ class IsaacSimRpcRobot(Robot):
             cam_data = {}
             for cam_prim in data_keys["camera"]["camera_prim_list"]:
                 cam_data[cam_prim] = {}
-                response = self.client.capture_frame(camera_prim_path=cam_prim)
+                response, rgb, depth = self.client.read_frame(
+                    cam_prim, depth=render_depth
+                )
                 # cam_info
                 cam_info = {
                     "W": response.color_info.width,
@@ -255,15 +314,11 @@ class IsaacSimRpcRobot(Robot):
                 c2w = self.get_prim_world_pose(cam_prim, camera=True)
                 cam_data[cam_prim]["c2w"] = c2w
                 # rgb
-                rgb = np.frombuffer(response.color_image.data, dtype=np.uint8).reshape(
-                    cam_info["H"], cam_info["W"], 4
-                )[:, :, :3]
+                rgb = rgb.reshape(cam_info["H"], cam_info["W"], 4)[:, :, :3]
                 cam_data[cam_prim]["image"] = rgb
                 # depth
                 if render_depth:
-                    depth = np.frombuffer(
-                        response.depth_image.data, dtype=np.float32
-                    ).reshape(cam_info["H"], cam_info["W"])
+                    depth = depth.reshape(cam_info["H"], cam_info["W"])
                     cam_data[cam_prim]["depth"] = depth
 
                 # semantic
@@ -301,6 +356,14 @@ class IsaacSimRpcRobot(Robot):
 
         return observation
 
+    def stream_observation(self, data_keys, step_interval=1):
+        """
+        Subscribe once and receive one observation every step_interval physics steps,
+        data_keys has the layout of get_observation, the observations the one of
+        Rpc_Client.get_observation. Read them with get(), close() unsubscribes.
+        """
+        return self.client.stream_observations(data_keys, step_interval)
+
     def open_gripper(self, id="left", width=0.1):
         is_Right = True if id == "right" else False
         self.client.set_gripper_state(
@@ -339,13 +402,13 @@ class IsaacSimRpcRobot(Robot):
 
     def set_gripper_action(self, action, arm="right"):
         assert arm in ["left", "right"]
-        time.sleep(0.3)
         if action is None:
             return
         if action == "open":
             self.open_gripper(id=arm, width=0.1)
         elif action == "close":
             self.close_gripper(id=arm)
+        self.wait_until_settled(objects=False, joints=self.gripper_joint_names[arm])
 
     def move(self, content):
         """
@@ -587,6 +650,10 @@ class IsaacSimRpcRobot(Robot):
             pose = pose @ rotation_x_180
         return pose
 
+    def get_prim_world_poses(self, prim_paths):
+        """fetch the world poses of several prims in one request"""
+        return self.client.GetWorldPoses(prim_paths)
+
     def pose_from_cam_to_robot(self, pose2cam):
         """transform pose from cam-coordinate to robot-coordinate"""
         cam2world = self.get_prim_world_pose(prim_path=self.base_camera, camera=True)
@@ -738,23 +805,101 @@ class IsaacSimRpcRobot(Robot):
         )
         return state.isSuccess
 
-    def solve_ik(self, pose, arm="right", type="Simple", **kwargs):
-        single_mode = len(pose.shape) == 2
-        if single_mode:
-            pose = pose[np.newaxis, ...]
-
+    def solve_ik_rpc(self, pose, arm="right", ObsAvoid=False):
         xyz, quat = pose[:, :3, 3], get_quaternion_wxyz_from_rotation_matrix(
             pose[:, :3, :3]
         )
         target_poses = []
         for i in range(len(pose)):
-            pose = {"position": xyz[i], "rotation": quat[i]}
-            target_poses.append(pose)
-
-        ObsAvoid = type == "ObsAvoid" or type == "AvoidObs"
-        result = self.client.GetIKStatus(
+            target_poses.append({"position": xyz[i], "rotation": quat[i]})
+        return self.client.GetIKStatus(
             target_poses=target_poses, is_right=arm == "right", ObsAvoid=ObsAvoid
         )  # True: isaac,  False: curobo
+
+    def solve_ik_local(self, pose, arm="right"):
+        """GetIKStatus style results of (N, 4, 4) world poses from the local solver pool"""
+        solver_paths = (
+            f"{SIM_REPO_ROOT}/base_utils/IK-SDK/{self.ik_cfg}",
+            os.path.join(f"{SIM_REPO_ROOT}/base_utils/IK-SDK", self.ik_solver_cfg),
+            os.path.join(
+                os.path.dirname(os.path.abspath(local_ik.__file__)),
+                "isaac_sim/robot_urdf",
+                self.client.robot_urdf,
+            ),
+        )
+        pool = local_ik.get_pool(solver_paths, self.local_ik_workers)
+        joint_states = {
+            state.name: state.position
+            for state in self.client.get_joint_positions().states
+        }
+        base_poses = np.linalg.inv(self.ego_transform)[np.newaxis, ...] @ pose
+        return local_ik.solve_ik_batch(
+            pool,
+            arm,
+            self.joint_names[arm],
+            joint_states,
+            base_poses,
+            self.local_ik_workers,
+        )
+
+    def disable_local_ik(self, error):
+        logger.error(f"local IK failed, keep solving on the sim: {error}")
+        self.local_ik_workers = 0
+        self.local_ik_arms.clear()
+
+    def check_local_ik(self, arm="right", num_poses=LOCAL_IK_CHECK_POSES, seed=0):
+        """
+        Compare the local solver of an arm with GetIKStatus on a fixed seed set of poses
+        around its current gripper pose, that arm keeps solving on GetIKStatus when they
+        disagree. A local solver that fails to load disables local IK altogether.
+        """
+        rng = np.random.default_rng(seed)
+        poses = np.tile(self.get_ee_pose(id=arm), (num_poses, 1, 1))
+        poses[:, :3, 3] += rng.uniform(-0.1, 0.1, size=(num_poses, 3))
+        poses[:, :3, :3] = (
+            Rotation.from_rotvec(rng.normal(scale=0.3, size=(num_poses, 3))).as_matrix()
+            @ poses[:, :3, :3]
+        )
+        rpc_status = np.array(
+            [state["status"] for state in self.solve_ik_rpc(poses, arm=arm)]
+        )
+        try:
+            local_results = self.solve_ik_local(poses, arm=arm)
+        except Exception as e:
+            self.disable_local_ik(e)
+            return None
+        local_status = np.array([state["status"] for state in local_results])
+        agreement = np.mean(rpc_status == local_status)
+        logger.info(
+            f"local IK of the {arm} arm agrees with GetIKStatus on {agreement:.0%} of "
+            f"{num_poses} poses, success {np.sum(local_status)} local / "
+            f"{np.sum(rpc_status)} rpc"
+        )
+        if agreement < LOCAL_IK_MIN_AGREEMENT:
+            logger.warning(
+                f"local IK of the {arm} arm disagrees with GetIKStatus, "
+                "keep solving on the sim"
+            )
+            self.local_ik_arms.discard(arm)
+        else:
+            self.local_ik_arms.add(arm)
+        return agreement
+
+    def solve_ik(self, pose, arm="right", type="Simple", **kwargs):
+        single_mode = len(pose.shape) == 2
+        if single_mode:
+            pose = pose[np.newaxis, ...]
+
+        ObsAvoid = type == "ObsAvoid" or type == "AvoidObs"
+        result = None
+        # the local solver does not know the scene, collision aware IK stays on curobo
+        if arm in self.local_ik_arms and not ObsAvoid:
+            try:
+                result = self.solve_ik_local(pose, arm=arm)
+            except Exception as e:
+                self.disable_local_ik(e)
+        if result is None:
+            result = self.solve_ik_rpc(pose, arm=arm, ObsAvoid=ObsAvoid)
         ik_result = []
         jacobian_score = []
         joint_positions = []
@@ -28,29 +28,29 @@ _sym_db = _symbol_database.Default()
 
 
 
-DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n+aimdk/protocol/hal/sensors/rs2_camera.proto\x12\x0e\x61imdk.protocol\"/\n\x0f\x43ompressedImage\x12\x0e\n\x06\x66ormat\x18\x02 \x01(\t\x12\x0c\n\x04\x64\x61ta\x18\x03 \x01(\x0c\"\x9c\x01\n\nCameraInfo\x12\r\n\x05width\x18\x01 \x01(\x05\x12\x0e\n\x06height\x18\x02 \x01(\x05\x12\x0b\n\x03ppx\x18\x03 \x01(\x02\x12\x0b\n\x03ppy\x18\x04 \x01(\x02\x12\n\n\x02\x66x\x18\x05 \x01(\x02\x12\n\n\x02\x66y\x18\x06 \x01(\x02\x12-\n\x05model\x18\x07 \x01(\x0e\x32\x1e.aimdk.protocol.DistortionType\x12\x0e\n\x06\x63oeffs\x18\x08 \x03(\x02\"Y\n\x14GetCameraInfoRequest\x12\x11\n\tserial_no\x18\x01 \x01(\t\x12.\n\x0bstream_type\x18\x02 \x01(\x0e\x32\x19.aimdk.protocol.ImageType\"A\n\x15GetCameraInfoResponse\x12(\n\x04info\x18\x01 \x03(\x0b\x32\x1a.aimdk.protocol.CameraInfo\")\n\x14GetCameraDataRequest\x12\x11\n\tserial_no\x18\x01 \x01(\t\"\xf6\x01\n\x15GetCameraDataResponse\x12\x11\n\tserial_no\x18\x01 \x01(\t\x12.\n\ncolor_info\x18\x02 \x01(\x0b\x32\x1a.aimdk.protocol.CameraInfo\x12\x34\n\x0b\x63olor_image\x18\x03 \x01(\x0b\x32\x1f.aimdk.protocol.CompressedImage\x12.\n\ndepth_info\x18\x04 \x01(\x0b\x32\x1a.aimdk.protocol.CameraInfo\x12\x34\n\x0b\x64\x65pth_image\x18\x05 \x01(\x0b\x32\x1f.aimdk.protocol.CompressedImage*N\n\tImageType\x12\x17\n\x13ImageType_UNDEFINED\x10\x00\x12\x13\n\x0fImageType_DEPTH\x10\x01\x12\x13\n\x0fImageType_COLOR\x10\x02*\xfe\x01\n\x0e\x44istortionType\x12\x1c\n\x18\x44istortionType_UNDEFINED\x10\x00\x12)\n%DistortionType_MODIFIED_BROWN_CONRADY\x10\x01\x12(\n$DistortionType_INVERSE_BROWN_CONRADY\x10\x02\x12\x19\n\x15\x44istortionType_FTHETA\x10\x03\x12 \n\x1c\x44istortionType_BROWN_CONRADY\x10\x04\x12\"\n\x1e\x44istortionType_KANNALA_BRANDT4\x10\x05\x12\x18\n\x14\x44istortionType_COUNT\x10\x06\x32\xcb\x01\n\rCameraService\x12\\\n\rGetCameraInfo\x12$.aimdk.protocol.GetCameraInfoRequest\x1a%.aimdk.protocol.GetCameraInfoResponse\x12\\\n\rGetCameraData\x12$.aimdk.protocol.GetCameraDataRequest\x1a%.aimdk.protocol.GetCameraDataResponseb\x06proto3')
+DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n+aimdk/protocol/hal/sensors/rs2_camera.proto\x12\x0e\x61imdk.protocol\"\x80\x01\n\x0f\x43ompressedImage\x12\x0e\n\x06\x66ormat\x18\x02 \x01(\t\x12\x0c\n\x04\x64\x61ta\x18\x03 \x01(\x0c\x12\x0e\n\x06in_shm\x18\x04 \x01(\x08\x12\x10\n\x08shm_slot\x18\x05 \x01(\x05\x12\r\n\x05shape\x18\x06 \x03(\x05\x12\r\n\x05\x64type\x18\x07 \x01(\t\x12\x0f\n\x07shm_seq\x18\x08 \x01(\x04\"\x9c\x01\n\nCameraInfo\x12\r\n\x05width\x18\x01 \x01(\x05\x12\x0e\n\x06height\x18\x02 \x01(\x05\x12\x0b\n\x03ppx\x18\x03 \x01(\x02\x12\x0b\n\x03ppy\x18\x04 \x01(\x02\x12\n\n\x02\x66x\x18\x05 \x01(\x02\x12\n\n\x02\x66y\x18\x06 \x01(\x02\x12-\n\x05model\x18\x07 \x01(\x0e\x32\x1e.aimdk.protocol.DistortionType\x12\x0e\n\x06\x63oeffs\x18\x08 \x03(\x02\"Y\n\x14GetCameraInfoRequest\x12\x11\n\tserial_no\x18\x01 \x01(\t\x12.\n\x0bstream_type\x18\x02 \x01(\x0e\x32\x19.aimdk.protocol.ImageType\"A\n\x15GetCameraInfoResponse\x12(\n\x04info\x18\x01 \x03(\x0b\x32\x1a.aimdk.protocol.CameraInfo\":\n\x14GetCameraDataRequest\x12\x11\n\tserial_no\x18\x01 \x01(\t\x12\x0f\n\x07use_shm\x18\x02 \x01(\x08\"\x88\x02\n\x15GetCameraDataResponse\x12\x11\n\tserial_no\x18\x01 \x01(\t\x12.\n\ncolor_info\x18\x02 \x01(\x0b\x32\x1a.aimdk.protocol.CameraInfo\x12\x34\n\x0b\x63olor_image\x18\x03 \x01(\x0b\x32\x1f.aimdk.protocol.CompressedImage\x12.\n\ndepth_info\x18\x04 \x01(\x0b\x32\x1a.aimdk.protocol.CameraInfo\x12\x34\n\x0b\x64\x65pth_image\x18\x05 \x01(\x0b\x32\x1f.aimdk.protocol.CompressedImage\x12\x10\n\x08shm_name\x18\x06 \x01(\t*N\n\tImageType\x12\x17\n\x13ImageType_UNDEFINED\x10\x00\x12\x13\n\x0fImageType_DEPTH\x10\x01\x12\x13\n\x0fImageType_COLOR\x10\x02*\xfe\x01\n\x0e\x44istortionType\x12\x1c\n\x18\x44istortionType_UNDEFINED\x10\x00\x12)\n%DistortionType_MODIFIED_BROWN_CONRADY\x10\x01\x12(\n$DistortionType_INVERSE_BROWN_CONRADY\x10\x02\x12\x19\n\x15\x44istortionType_FTHETA\x10\x03\x12 \n\x1c\x44istortionType_BROWN_CONRADY\x10\x04\x12\"\n\x1e\x44istortionType_KANNALA_BRANDT4\x10\x05\x12\x18\n\x14\x44istortionType_COUNT\x10\x06\x32\xcb\x01\n\rCameraService\x12\\\n\rGetCameraInfo\x12$.aimdk.protocol.GetCameraInfoRequest\x1a%.aimdk.protocol.GetCameraInfoResponse\x12\\\n\rGetCameraData\x12$.aimdk.protocol.GetCameraDataRequest\x1a%.aimdk.protocol.GetCameraDataResponseb\x06proto3')
 
 _globals = globals()
 _builder.BuildMessageAndEnumDescriptors(DESCRIPTOR, _globals)
 _builder.BuildTopDescriptorsAndMessages(DESCRIPTOR, 'aimdk.protocol.hal.sensors.rs2_camera_pb2', _globals)
 if not _descriptor._USE_C_DESCRIPTORS:
   DESCRIPTOR._loaded_options = None
-  _globals['_IMAGETYPE']._serialized_start=721
-  _globals['_IMAGETYPE']._serialized_end=799
-  _globals['_DISTORTIONTYPE']._serialized_start=802
-  _globals['_DISTORTIONTYPE']._serialized_end=1056
-  _globals['_COMPRESSEDIMAGE']._serialized_start=63
-  _globals['_COMPRESSEDIMAGE']._serialized_end=110
-  _globals['_CAMERAINFO']._serialized_start=113
-  _globals['_CAMERAINFO']._serialized_end=269
-  _globals['_GETCAMERAINFOREQUEST']._serialized_start=271
-  _globals['_GETCAMERAINFOREQUEST']._serialized_end=360
-  _globals['_GETCAMERAINFORESPONSE']._serialized_start=362
-  _globals['_GETCAMERAINFORESPONSE']._serialized_end=427
-  _globals['_GETCAMERADATAREQUEST']._serialized_start=429
-  _globals['_GETCAMERADATAREQUEST']._serialized_end=470
-  _globals['_GETCAMERADATARESPONSE']._serialized_start=473
-  _globals['_GETCAMERADATARESPONSE']._serialized_end=719
-  _globals['_CAMERASERVICE']._serialized_start=1059
-  _globals['_CAMERASERVICE']._serialized_end=1262
+  _globals['_IMAGETYPE']._serialized_start=838
+  _globals['_IMAGETYPE']._serialized_end=916
+  _globals['_DISTORTIONTYPE']._serialized_start=919
+  _globals['_DISTORTIONTYPE']._serialized_end=1173
+  _globals['_COMPRESSEDIMAGE']._serialized_start=64
+  _globals['_COMPRESSEDIMAGE']._serialized_end=192
+  _globals['_CAMERAINFO']._serialized_start=195
+  _globals['_CAMERAINFO']._serialized_end=351
+  _globals['_GETCAMERAINFOREQUEST']._serialized_start=353
+  _globals['_GETCAMERAINFOREQUEST']._serialized_end=442
+  _globals['_GETCAMERAINFORESPONSE']._serialized_start=444
+  _globals['_GETCAMERAINFORESPONSE']._serialized_end=509
+  _globals['_GETCAMERADATAREQUEST']._serialized_start=511
+  _globals['_GETCAMERADATAREQUEST']._serialized_end=569
+  _globals['_GETCAMERADATARESPONSE']._serialized_start=572
+  _globals['_GETCAMERADATARESPONSE']._serialized_end=836
+  _globals['_CAMERASERVICE']._serialized_start=1176
+  _globals['_CAMERASERVICE']._serialized_end=1379
 # @@protoc_insertion_point(module_scope)
@@ -58,6 +58,11 @@ class SimObjectServiceStub(object):
                 request_serializer=aimdk_dot_protocol_dot_sim_dot_sim__object__service__pb2.SetTargetPointReq.SerializeToString,
                 response_deserializer=aimdk_dot_protocol_dot_sim_dot_sim__object__service__pb2.SetTargetPointRsp.FromString,
                 _registered_method=True)
+        self.GetWorldPoses = channel.unary_unary(
+                '/aimdk.protocol.SimObjectService/GetWorldPoses',
+                request_serializer=aimdk_dot_protocol_dot_sim_dot_sim__object__service__pb2.GetWorldPosesReq.SerializeToString,
+                response_deserializer=aimdk_dot_protocol_dot_sim_dot_sim__object__service__pb2.GetWorldPosesRsp.FromString,
+                _registered_method=True)
 
 
 class SimObjectServiceServicer(object):
@@ -87,6 +92,12 @@ class SimObjectServiceServicer(object):
         context.set_details('Method not implemented!')
         raise NotImplementedError('Method not implemented!')
 
+    def GetWorldPoses(self, request, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
 
 def add_SimObjectServiceServicer_to_server(servicer, server):
     rpc_method_handlers = {
@@ -110,6 +121,11 @@ def add_SimObjectServiceServicer_to_server(servicer, server):
                     request_deserializer=aimdk_dot_protocol_dot_sim_dot_sim__object__service__pb2.SetTargetPointReq.FromString,
                     response_serializer=aimdk_dot_protocol_dot_sim_dot_sim__object__service__pb2.SetTargetPointRsp.SerializeToString,
             ),
+            'GetWorldPoses': grpc.unary_unary_rpc_method_handler(
+                    servicer.GetWorldPoses,
+                    request_deserializer=aimdk_dot_protocol_dot_sim_dot_sim__object__service__pb2.GetWorldPosesReq.FromString,
+                    response_serializer=aimdk_dot_protocol_dot_sim_dot_sim__object__service__pb2.GetWorldPosesRsp.SerializeToString,
+            ),
     }
     generic_handler = grpc.method_handlers_generic_handler(
             'aimdk.protocol.SimObjectService', rpc_method_handlers)
@@ -228,3 +244,30 @@ class SimObjectService(object):
             timeout,
             metadata,
             _registered_method=True)
+
+    @staticmethod
+    def GetWorldPoses(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(
+            request,
+            target,
+            '/aimdk.protocol.SimObjectService/GetWorldPoses',
+            aimdk_dot_protocol_dot_sim_dot_sim__object__service__pb2.GetWorldPosesReq.SerializeToString,
+            aimdk_dot_protocol_dot_sim_dot_sim__object__service__pb2.GetWorldPosesRsp.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
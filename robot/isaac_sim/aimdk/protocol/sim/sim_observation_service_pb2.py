@@ -44,7 +44,7 @@ from aimdk.protocol.common import joint_pb2 as aimdk_dot_protocol_dot_common_dot
 from aimdk.protocol.common.se3_pose_pb2 import *
 from aimdk.protocol.common.joint_pb2 import *
 
-DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n0aimdk/protocol/sim/sim_observation_service.proto\x12\x0e\x61imdk.protocol\x1a$aimdk/protocol/common/se3_pose.proto\x1a!aimdk/protocol/common/joint.proto\"*\n\x0cSemanticData\x12\x0c\n\x04name\x18\x02 \x01(\t\x12\x0c\n\x04\x64\x61ta\x18\x03 \x01(\x0c\"4\n\x0cSemanticDict\x12\x10\n\x08label_id\x18\x02 \x01(\x05\x12\x12\n\nlabel_name\x18\x03 \x01(\t\"(\n\x08\x43\x61mImage\x12\x0e\n\x06\x66ormat\x18\x02 \x01(\t\x12\x0c\n\x04\x64\x61ta\x18\x03 \x01(\x0c\"Z\n\x07\x43\x61mInfo\x12\r\n\x05width\x18\x01 \x01(\x05\x12\x0e\n\x06height\x18\x02 \x01(\x05\x12\x0b\n\x03ppx\x18\x03 \x01(\x02\x12\x0b\n\x03ppy\x18\x04 \x01(\x02\x12\n\n\x02\x66x\x18\x05 \x01(\x02\x12\n\n\x02\x66y\x18\x06 \x01(\x02\"\xfe\x01\n\tCameraRsp\x12,\n\x0b\x63\x61mera_info\x18\x01 \x01(\x0b\x32\x17.aimdk.protocol.CamInfo\x12,\n\nrgb_camera\x18\x02 \x01(\x0b\x32\x18.aimdk.protocol.CamImage\x12.\n\x0c\x64\x65pth_camera\x18\x03 \x01(\x0b\x32\x18.aimdk.protocol.CamImage\x12\x33\n\rsemantic_mask\x18\x04 \x01(\x0b\x32\x1c.aimdk.protocol.SemanticData\x12\x30\n\nlabel_dict\x18\x05 \x03(\x0b\x32\x1c.aimdk.protocol.SemanticDict\"\x95\x01\n\x08JointRsp\x12,\n\x08left_arm\x18\x01 \x03(\x0b\x32\x1a.aimdk.protocol.JointState\x12-\n\tright_arm\x18\x02 \x03(\x0b\x32\x1a.aimdk.protocol.JointState\x12,\n\x08\x62ody_arm\x18\x03 \x03(\x0b\x32\x1a.aimdk.protocol.JointState\"<\n\tObjectRsp\x12/\n\x0bobject_pose\x18\x07 \x01(\x0b\x32\x1a.aimdk.protocol.SE3RpyPose\"q\n\nGripperRsp\x12\x30\n\x0cleft_gripper\x18\x01 \x01(\x0b\x32\x1a.aimdk.protocol.SE3RpyPose\x12\x31\n\rright_gripper\x18\x02 \x01(\x0b\x32\x1a.aimdk.protocol.SE3RpyPose\"X\n\rCameraRequest\x12\x14\n\x0crender_depth\x18\x01 \x01(\x08\x12\x17\n\x0frender_semantic\x18\x02 \x01(\x08\x12\x18\n\x10\x63\x61mera_prim_list\x18\x03 \x03(\t\"-\n\x0eGripperRequest\x12\x0c\n\x04left\x18\x01 \x01(\x08\x12\r\n\x05right\x18\x02 \x01(\x08\"\xa0\x02\n\x11GetObservationReq\x12\r\n\x05isCam\x18\x01 \x01(\x08\x12\x30\n\tCameraReq\x18\x02 \x01(\x0b\x32\x1d.aimdk.protocol.CameraRequest\x12\x0f\n\x07isJoint\x18\x03 \x01(\x08\x12\x0e\n\x06isPose\x18\x04 \x01(\x08\x12\x13\n\x0bobjectPrims\x18\x05 \x03(\t\x12\x11\n\tisGripper\x18\x06 \x01(\x08\x12\x32\n\ngripperReq\x18\x07 \x01(\x0b\x32\x1e.aimdk.protocol.GripperRequest\x12\x16\n\x0estartRecording\x18\x08 \x01(\x08\x12\x15\n\rstopRecording\x18\t \x01(\x08\x12\x0b\n\x03\x66ps\x18\n \x01(\x05\x12\x11\n\ttask_name\x18\x0b \x01(\t\"\xd5\x01\n\x11GetObservationRsp\x12)\n\x06\x63\x61mera\x18\x01 \x03(\x0b\x32\x19.aimdk.protocol.CameraRsp\x12\'\n\x04pose\x18\x02 \x03(\x0b\x32\x19.aimdk.protocol.ObjectRsp\x12\'\n\x05joint\x18\x03 \x01(\x0b\x32\x18.aimdk.protocol.JointRsp\x12+\n\x07gripper\x18\x04 \x01(\x0b\x32\x1a.aimdk.protocol.GripperRsp\x12\x16\n\x0erecordingState\x18\x05 \x01(\t\"\x19\n\x08ResetReq\x12\r\n\x05reset\x18\x01 \x01(\x08\"\x17\n\x08ResetRsp\x12\x0b\n\x03msg\x18\x01 \x01(\t\"0\n\tAttachReq\x12\x11\n\tobj_prims\x18\x01 \x03(\t\x12\x10\n\x08is_right\x18\x02 \x01(\x08\"\x18\n\tAttachRsp\x12\x0b\n\x03msg\x18\x01 \x01(\t\"\x1b\n\tDetachReq\x12\x0e\n\x06\x64\x65tach\x18\x01 \x01(\x08\"\x18\n\tDetachRsp\x12\x0b\n\x03msg\x18\x01 \x01(\t\"\x86\x01\n\x0cMultiMoveReq\x12\x12\n\nrobot_name\x18\x01 \x01(\t\x12\x0c\n\x04plan\x18\x02 \x01(\x08\x12)\n\x05poses\x18\x03 \x03(\x0b\x32\x1a.aimdk.protocol.SE3RpyPose\x12)\n\x08\x63md_plan\x18\x04 \x01(\x0b\x32\x17.aimdk.protocol.CmdPlan\"G\n\x0cMultiMoveRsp\x12*\n\tcmd_plans\x18\x01 \x03(\x0b\x32\x17.aimdk.protocol.CmdPlan\x12\x0b\n\x03msg\x18\x02 \x01(\t\"O\n\x07\x43mdPlan\x12\x13\n\x0bjoint_names\x18\x01 \x03(\t\x12/\n\x0bjoint_plans\x18\x02 \x03(\x0b\x32\x1a.aimdk.protocol.SinglePlan\"\x1f\n\nSinglePlan\x12\x11\n\tjoint_pos\x18\x01 \x03(\x02\"4\n\rTaskStatusReq\x12\x11\n\tisSuccess\x18\x01 \x01(\x08\x12\x10\n\x08\x66\x61ilStep\x18\x02 \x03(\x05\"\x1c\n\rTaskStatusRsp\x12\x0b\n\x03msg\x18\x01 \x01(\t\"\x17\n\x07\x45xitReq\x12\x0c\n\x04\x65xit\x18\x01 \x01(\x08\"\x16\n\x07\x45xitRsp\x12\x0b\n\x03msg\x18\x02 \x01(\t\"\'\n\x13GetObjectsOfTypeReq\x12\x10\n\x08obj_type\x18\x01 \x01(\t\")\n\x13GetObjectsOfTypeRsp\x12\x12\n\nprim_paths\x18\x01 \x03(\t\"\xc6\x01\n\x0cInitRobotReq\x12\x16\n\x0erobot_cfg_file\x18\x01 \x01(\t\x12\x16\n\x0erobot_usd_path\x18\x02 \x01(\t\x12\x16\n\x0escene_usd_path\x18\x03 \x01(\t\x12.\n\nrobot_pose\x18\x04 \x01(\x0b\x32\x1a.aimdk.protocol.SE3RpyPose\x12\x12\n\nstand_type\x18\x05 \x01(\t\x12\x14\n\x0cstand_size_x\x18\x06 \x01(\x02\x12\x14\n\x0cstand_size_y\x18\x07 \x01(\x02\"\x1b\n\x0cInitRobotRsp\x12\x0b\n\x03msg\x18\x01 \x01(\t\"\xd3\x01\n\x0c\x41\x64\x64\x43\x61meraReq\x12\x13\n\x0b\x63\x61mera_prim\x18\x01 \x01(\t\x12/\n\x0b\x63\x61mera_pose\x18\x02 \x01(\x0b\x32\x1a.aimdk.protocol.SE3RpyPose\x12\x14\n\x0c\x66ocus_length\x18\x03 \x01(\x02\x12\x1b\n\x13horizontal_aperture\x18\x04 \x01(\x02\x12\x19\n\x11vertical_aperture\x18\x05 \x01(\x02\x12\r\n\x05width\x18\x06 \x01(\x05\x12\x0e\n\x06height\x18\x07 \x01(\x05\x12\x10\n\x08is_local\x18\x08 \x01(\x08\"\x1b\n\x0c\x41\x64\x64\x43\x61meraRsp\x12\x0b\n\x03msg\x18\x01 \x01(\t\"\xa8\x01\n\x0b\x44rawLineReq\x12*\n\x0cpoint_list_1\x18\x01 \x03(\x0b\x32\x14.aimdk.protocol.Vec3\x12*\n\x0cpoint_list_2\x18\x02 \x03(\x0b\x32\x14.aimdk.protocol.Vec3\x12$\n\x06\x63olors\x18\x03 \x03(\x0b\x32\x14.aimdk.protocol.Vec3\x12\r\n\x05sizes\x18\x04 \x03(\x02\x12\x0c\n\x04name\x18\x05 \x01(\t\"\x1a\n\x0b\x44rawLineRsp\x12\x0b\n\x03msg\x18\x01 \x01(\t\"I\n\nObjectPose\x12\x11\n\tprim_path\x18\x01 \x01(\t\x12(\n\x04pose\x18\x02 \x01(\x0b\x32\x1a.aimdk.protocol.SE3RpyPose\"Q\n\x0bObjectJoint\x12\x11\n\tprim_path\x18\x01 \x01(\t\x12/\n\tjoint_cmd\x18\x02 \x03(\x0b\x32\x1c.aimdk.protocol.JointCommand\"\xa7\x01\n\x10SetObjectPoseReq\x12/\n\x0bobject_pose\x18\x01 \x03(\x0b\x32\x1a.aimdk.protocol.ObjectPose\x12/\n\tjoint_cmd\x18\x02 \x03(\x0b\x32\x1c.aimdk.protocol.JointCommand\x12\x31\n\x0cobject_joint\x18\x03 \x03(\x0b\x32\x1b.aimdk.protocol.ObjectJoint\"\x1f\n\x10SetObjectPoseRsp\x12\x0b\n\x03msg\x18\x01 \x01(\t\"^\n\x14SetTrajectoryListReq\x12\x34\n\x10trajectory_point\x18\x01 \x03(\x0b\x32\x1a.aimdk.protocol.SE3RpyPose\x12\x10\n\x08is_block\x18\x02 \x01(\x08\"#\n\x14SetTrajectoryListRsp\x12\x0b\n\x03msg\x18\x01 \x01(\t\"\'\n\x10SetFrameStateReq\x12\x13\n\x0b\x66rame_state\x18\x01 \x01(\t\"\x1f\n\x10SetFrameStateRsp\x12\x0b\n\x03msg\x18\x01 \x01(\t\"e\n\x0cMaterialInfo\x12\x13\n\x0bobject_prim\x18\x01 \x01(\t\x12\x15\n\rmaterial_name\x18\x02 \x01(\t\x12\x15\n\rmaterial_path\x18\x03 \x01(\t\x12\x12\n\nlabel_name\x18\x04 \x01(\t\"A\n\x0eSetMaterailReq\x12/\n\tmaterials\x18\x01 \x03(\x0b\x32\x1c.aimdk.protocol.MaterialInfo\"\x1d\n\x0eSetMaterialRsp\x12\x0b\n\x03msg\x18\x01 \x01(\t\"\xaa\x01\n\x08LightCfg\x12\x12\n\nlight_type\x18\x01 \x01(\t\x12\x12\n\nlight_prim\x18\x02 \x01(\t\x12\x19\n\x11light_temperature\x18\x03 \x01(\x02\x12\x17\n\x0flight_intensity\x18\x04 \x01(\x02\x12+\n\x0elight_rotation\x18\x05 \x01(\x0b\x32\x13.aimdk.protocol.Rpy\x12\x15\n\rlight_texture\x18\x06 \x01(\t\"7\n\x0bSetLightReq\x12(\n\x06lights\x18\x01 \x03(\x0b\x32\x18.aimdk.protocol.LightCfg\"\x1a\n\x0bSetLightRsp\x12\x0b\n\x03msg\x18\x01 \x01(\t\"\x1c\n\x0c\x43learLineReq\x12\x0c\n\x04name\x18\x01 \x01(\t\"\x1b\n\x0c\x43learLineRsp\x12\x0b\n\x03msg\x18\x01 \x01(\t\"\x8e\x01\n\x18OmniCmdChangePropertyReq\x12\x11\n\tprop_path\x18\x01 \x01(\t\x12\x13\n\tstr_value\x18\x02 \x01(\tH\x00\x12\x13\n\tint_value\x18\x03 \x01(\x05H\x00\x12\x16\n\x0c\x64ouble_value\x18\x04 \x01(\x01H\x00\x12\x14\n\nbool_value\x18\x05 \x01(\x08H\x00\x42\x07\n\x05value\"\'\n\x18OmniCmdChangePropertyRsp\x12\x0b\n\x03msg\x18\x01 \x01(\t\"<\n\x19GetPartiPointNumInbboxReq\x12\x11\n\tprim_path\x18\x01 \x01(\t\x12\x0c\n\x04\x62\x62ox\x18\x02 \x03(\x02\"(\n\x19GetPartiPointNumInbboxRsp\x12\x0b\n\x03num\x18\x01 \x01(\x05\"%\n\x10GetObjectAABBReq\x12\x11\n\tprim_path\x18\x01 \x01(\t\" \n\x10GetObjectAABBRsp\x12\x0c\n\x04\x62\x62ox\x18\x01 \x03(\x02\"$\n\x0fGetWorldPoseReq\x12\x11\n\tprim_path\x18\x01 \x01(\t\",\n\x0fGetWorldPoseRsp\x12\x0b\n\x03pos\x18\x01 \x03(\x02\x12\x0c\n\x04quat\x18\x02 \x03(\x02\x32\xa4\r\n\x15SimObservationService\x12V\n\x0eGetObservation\x12!.aimdk.protocol.GetObservationReq\x1a!.aimdk.protocol.GetObservationRsp\x12;\n\x05Reset\x12\x18.aimdk.protocol.ResetReq\x1a\x18.aimdk.protocol.ResetRsp\x12\x41\n\tAttachObj\x12\x19.aimdk.protocol.AttachReq\x1a\x19.aimdk.protocol.AttachRsp\x12\x41\n\tDetachObj\x12\x19.aimdk.protocol.DetachReq\x1a\x19.aimdk.protocol.DetachRsp\x12G\n\tMultiMove\x12\x1c.aimdk.protocol.MultiMoveReq\x1a\x1c.aimdk.protocol.MultiMoveRsp\x12\\\n\x10GetObjectsOfType\x12#.aimdk.protocol.GetObjectsOfTypeReq\x1a#.aimdk.protocol.GetObjectsOfTypeRsp\x12J\n\nTaskStatus\x12\x1d.aimdk.protocol.TaskStatusReq\x1a\x1d.aimdk.protocol.TaskStatusRsp\x12\x38\n\x04\x45xit\x12\x17.aimdk.protocol.ExitReq\x1a\x17.aimdk.protocol.ExitRsp\x12G\n\tInitRobot\x12\x1c.aimdk.protocol.InitRobotReq\x1a\x1c.aimdk.protocol.InitRobotRsp\x12G\n\tAddCamera\x12\x1c.aimdk.protocol.AddCameraReq\x1a\x1c.aimdk.protocol.AddCameraRsp\x12\x44\n\x08\x44rawLine\x12\x1b.aimdk.protocol.DrawLineReq\x1a\x1b.aimdk.protocol.DrawLineRsp\x12S\n\rSetObjectPose\x12 .aimdk.protocol.SetObjectPoseReq\x1a .aimdk.protocol.SetObjectPoseRsp\x12_\n\x11SetTrajectoryList\x12$.aimdk.protocol.SetTrajectoryListReq\x1a$.aimdk.protocol.SetTrajectoryListRsp\x12S\n\rSetFrameState\x12 .aimdk.protocol.SetFrameStateReq\x1a .aimdk.protocol.SetFrameStateRsp\x12M\n\x0bSetMaterial\x12\x1e.aimdk.protocol.SetMaterailReq\x1a\x1e.aimdk.protocol.SetMaterialRsp\x12\x44\n\x08SetLight\x12\x1b.aimdk.protocol.SetLightReq\x1a\x1b.aimdk.protocol.SetLightRsp\x12G\n\tClearLine\x12\x1c.aimdk.protocol.ClearLineReq\x1a\x1c.aimdk.protocol.ClearLineRsp\x12k\n\x15OmniCmdChangeProperty\x12(.aimdk.protocol.OmniCmdChangePropertyReq\x1a(.aimdk.protocol.OmniCmdChangePropertyRsp\x12n\n\x16GetPartiPointNumInbbox\x12).aimdk.protocol.GetPartiPointNumInbboxReq\x1a).aimdk.protocol.GetPartiPointNumInbboxRsp\x12S\n\rGetObjectAABB\x12 .aimdk.protocol.GetObjectAABBReq\x1a .aimdk.protocol.GetObjectAABBRsp\x12P\n\x0cGetWorldPose\x12\x1f.aimdk.protocol.GetWorldPoseReq\x1a\x1f.aimdk.protocol.GetWorldPoseRspP\x00P\x01\x62\x06proto3')
+DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n0aimdk/protocol/sim/sim_observation_service.proto\x12\x0e\x61imdk.protocol\x1a$aimdk/protocol/common/se3_pose.proto\x1a!aimdk/protocol/common/joint.proto\"*\n\x0cSemanticData\x12\x0c\n\x04name\x18\x02 \x01(\t\x12\x0c\n\x04\x64\x61ta\x18\x03 \x01(\x0c\"4\n\x0cSemanticDict\x12\x10\n\x08label_id\x18\x02 \x01(\x05\x12\x12\n\nlabel_name\x18\x03 \x01(\t\"y\n\x08\x43\x61mImage\x12\x0e\n\x06\x66ormat\x18\x02 \x01(\t\x12\x0c\n\x04\x64\x61ta\x18\x03 \x01(\x0c\x12\x0e\n\x06in_shm\x18\x04 \x01(\x08\x12\x10\n\x08shm_slot\x18\x05 \x01(\x05\x12\r\n\x05shape\x18\x06 \x03(\x05\x12\r\n\x05\x64type\x18\x07 \x01(\t\x12\x0f\n\x07shm_seq\x18\x08 \x01(\x04\"Z\n\x07\x43\x61mInfo\x12\r\n\x05width\x18\x01 \x01(\x05\x12\x0e\n\x06height\x18\x02 \x01(\x05\x12\x0b\n\x03ppx\x18\x03 \x01(\x02\x12\x0b\n\x03ppy\x18\x04 \x01(\x02\x12\n\n\x02\x66x\x18\x05 \x01(\x02\x12\n\n\x02\x66y\x18\x06 \x01(\x02\"\xfe\x01\n\tCameraRsp\x12,\n\x0b\x63\x61mera_info\x18\x01 \x01(\x0b\x32\x17.aimdk.protocol.CamInfo\x12,\n\nrgb_camera\x18\x02 \x01(\x0b\x32\x18.aimdk.protocol.CamImage\x12.\n\x0c\x64\x65pth_camera\x18\x03 \x01(\x0b\x32\x18.aimdk.protocol.CamImage\x12\x33\n\rsemantic_mask\x18\x04 \x01(\x0b\x32\x1c.aimdk.protocol.SemanticData\x12\x30\n\nlabel_dict\x18\x05 \x03(\x0b\x32\x1c.aimdk.protocol.SemanticDict\"\x95\x01\n\x08JointRsp\x12,\n\x08left_arm\x18\x01 \x03(\x0b\x32\x1a.aimdk.protocol.JointState\x12-\n\tright_arm\x18\x02 \x03(\x0b\x32\x1a.aimdk.protocol.JointState\x12,\n\x08\x62ody_arm\x18\x03 \x03(\x0b\x32\x1a.aimdk.protocol.JointState\"<\n\tObjectRsp\x12/\n\x0bobject_pose\x18\x07 \x01(\x0b\x32\x1a.aimdk.protocol.SE3RpyPose\"q\n\nGripperRsp\x12\x30\n\x0cleft_gripper\x18\x01 \x01(\x0b\x32\x1a.aimdk.protocol.SE3RpyPose\x12\x31\n\rright_gripper\x18\x02 \x01(\x0b\x32\x1a.aimdk.protocol.SE3RpyPose\"X\n\rCameraRequest\x12\x14\n\x0crender_depth\x18\x01 \x01(\x08\x12\x17\n\x0frender_semantic\x18\x02 \x01(\x08\x12\x18\n\x10\x63\x61mera_prim_list\x18\x03 \x03(\t\"-\n\x0eGripperRequest\x12\x0c\n\x04left\x18\x01 \x01(\x08\x12\r\n\x05right\x18\x02 \x01(\x08\"\xb1\x02\n\x11GetObservationReq\x12\r\n\x05isCam\x18\x01 \x01(\x08\x12\x30\n\tCameraReq\x18\x02 \x01(\x0b\x32\x1d.aimdk.protocol.CameraRequest\x12\x0f\n\x07isJoint\x18\x03 \x01(\x08\x12\x0e\n\x06isPose\x18\x04 \x01(\x08\x12\x13\n\x0bobjectPrims\x18\x05 \x03(\t\x12\x11\n\tisGripper\x18\x06 \x01(\x08\x12\x32\n\ngripperReq\x18\x07 \x01(\x0b\x32\x1e.aimdk.protocol.GripperRequest\x12\x16\n\x0estartRecording\x18\x08 \x01(\x08\x12\x15\n\rstopRecording\x18\t \x01(\x08\x12\x0b\n\x03\x66ps\x18\n \x01(\x05\x12\x11\n\ttask_name\x18\x0b \x01(\t\x12\x0f\n\x07use_shm\x18\x0c \x01(\x08\"\xe7\x01\n\x11GetObservationRsp\x12)\n\x06\x63\x61mera\x18\x01 \x03(\x0b\x32\x19.aimdk.protocol.CameraRsp\x12\'\n\x04pose\x18\x02 \x03(\x0b\x32\x19.aimdk.protocol.ObjectRsp\x12\'\n\x05joint\x18\x03 \x01(\x0b\x32\x18.aimdk.protocol.JointRsp\x12+\n\x07gripper\x18\x04 \x01(\x0b\x32\x1a.aimdk.protocol.GripperRsp\x12\x16\n\x0erecordingState\x18\x05 \x01(\t\x12\x10\n\x08shm_name\x18\x06 \x01(\t\"j\n\x15StreamObservationsReq\x12:\n\x0fobservation_req\x18\x01 \x01(\x0b\x32!.aimdk.protocol.GetObservationReq\x12\x15\n\rstep_interval\x18\x02 \x01(\x05\"\'\n\x08ResetReq\x12\r\n\x05reset\x18\x01 \x01(\x08\x12\x0c\n\x04soft\x18\x02 \x01(\x08\"\x17\n\x08ResetRsp\x12\x0b\n\x03msg\x18\x01 \x01(\t\"0\n\tAttachReq\x12\x11\n\tobj_prims\x18\x01 \x03(\t\x12\x10\n\x08is_right\x18\x02 \x01(\x08\"\x18\n\tAttachRsp\x12\x0b\n\x03msg\x18\x01 \x01(\t\"\x1b\n\tDetachReq\x12\x0e\n\x06\x64\x65tach\x18\x01 \x01(\x08\"\x18\n\tDetachRsp\x12\x0b\n\x03msg\x18\x01 \x01(\t\"\x86\x01\n\x0cMultiMoveReq\x12\x12\n\nrobot_name\x18\x01 \x01(\t\x12\x0c\n\x04plan\x18\x02 \x01(\x08\x12)\n\x05poses\x18\x03 \x03(\x0b\x32\x1a.aimdk.protocol.SE3RpyPose\x12)\n\x08\x63md_plan\x18\x04 \x01(\x0b\x32\x17.aimdk.protocol.CmdPlan\"G\n\x0cMultiMoveRsp\x12*\n\tcmd_plans\x18\x01 \x03(\x0b\x32\x17.aimdk.protocol.CmdPlan\x12\x0b\n\x03msg\x18\x02 \x01(\t\"O\n\x07\x43mdPlan\x12\x13\n\x0bjoint_names\x18\x01 \x03(\t\x12/\n\x0bjoint_plans\x18\x02 \x03(\x0b\x32\x1a.aimdk.protocol.SinglePlan\"\x1f\n\nSinglePlan\x12\x11\n\tjoint_pos\x18\x01 \x03(\x02\"4\n\rTaskStatusReq\x12\x11\n\tisSuccess\x18\x01 \x01(\x08\x12\x10\n\x08\x66\x61ilStep\x18\x02 \x03(\x05\"\x1c\n\rTaskStatusRsp\x12\x0b\n\x03msg\x18\x01 \x01(\t\"\x17\n\x07\x45xitReq\x12\x0c\n\x04\x65xit\x18\x01 \x01(\x08\"\x16\n\x07\x45xitRsp\x12\x0b\n\x03msg\x18\x02 \x01(\t\"\'\n\x13GetObjectsOfTypeReq\x12\x10\n\x08obj_type\x18\x01 \x01(\t\")\n\x13GetObjectsOfTypeRsp\x12\x12\n\nprim_paths\x18\x01 \x03(\t\"\xc6\x01\n\x0cInitRobotReq\x12\x16\n\x0erobot_cfg_file\x18\x01 \x01(\t\x12\x16\n\x0erobot_usd_path\x18\x02 \x01(\t\x12\x16\n\x0escene_usd_path\x18\x03 \x01(\t\x12.\n\nrobot_pose\x18\x04 \x01(\x0b\x32\x1a.aimdk.protocol.SE3RpyPose\x12\x12\n\nstand_type\x18\x05 \x01(\t\x12\x14\n\x0cstand_size_x\x18\x06 \x01(\x02\x12\x14\n\x0cstand_size_y\x18\x07 \x01(\x02\"\x1b\n\x0cInitRobotRsp\x12\x0b\n\x03msg\x18\x01 \x01(\t\"\xd3\x01\n\x0c\x41\x64\x64\x43\x61meraReq\x12\x13\n\x0b\x63\x61mera_prim\x18\x01 \x01(\t\x12/\n\x0b\x63\x61mera_pose\x18\x02 \x01(\x0b\x32\x1a.aimdk.protocol.SE3RpyPose\x12\x14\n\x0c\x66ocus_length\x18\x03 \x01(\x02\x12\x1b\n\x13horizontal_aperture\x18\x04 \x01(\x02\x12\x19\n\x11vertical_aperture\x18\x05 \x01(\x02\x12\r\n\x05width\x18\x06 \x01(\x05\x12\x0e\n\x06height\x18\x07 \x01(\x05\x12\x10\n\x08is_local\x18\x08 \x01(\x08\"\x1b\n\x0c\x41\x64\x64\x43\x61meraRsp\x12\x0b\n\x03msg\x18\x01 \x01(\t\"\xa8\x01\n\x0b\x44rawLineReq\x12*\n\x0cpoint_list_1\x18\x01 \x03(\x0b\x32\x14.aimdk.protocol.Vec3\x12*\n\x0cpoint_list_2\x18\x02 \x03(\x0b\x32\x14.aimdk.protocol.Vec3\x12$\n\x06\x63olors\x18\x03 \x03(\x0b\x32\x14.aimdk.protocol.Vec3\x12\r\n\x05sizes\x18\x04 \x03(\x02\x12\x0c\n\x04name\x18\x05 \x01(\t\"\x1a\n\x0b\x44rawLineRsp\x12\x0b\n\x03msg\x18\x01 \x01(\t\"I\n\nObjectPose\x12\x11\n\tprim_path\x18\x01 \x01(\t\x12(\n\x04pose\x18\x02 \x01(\x0b\x32\x1a.aimdk.protocol.SE3RpyPose\"Q\n\x0bObjectJoint\x12\x11\n\tprim_path\x18\x01 \x01(\t\x12/\n\tjoint_cmd\x18\x02 \x03(\x0b\x32\x1c.aimdk.protocol.JointCommand\"\xa7\x01\n\x10SetObjectPoseReq\x12/\n\x0bobject_pose\x18\x01 \x03(\x0b\x32\x1a.aimdk.protocol.ObjectPose\x12/\n\tjoint_cmd\x18\x02 \x03(\x0b\x32\x1c.aimdk.protocol.JointCommand\x12\x31\n\x0cobject_joint\x18\x03 \x03(\x0b\x32\x1b.aimdk.protocol.ObjectJoint\"\x1f\n\x10SetObjectPoseRsp\x12\x0b\n\x03msg\x18\x01 \x01(\t\"^\n\x14SetTrajectoryListReq\x12\x34\n\x10trajectory_point\x18\x01 \x03(\x0b\x32\x1a.aimdk.protocol.SE3RpyPose\x12\x10\n\x08is_block\x18\x02 \x01(\x08\"#\n\x14SetTrajectoryListRsp\x12\x0b\n\x03msg\x18\x01 \x01(\t\"\'\n\x10SetFrameStateReq\x12\x13\n\x0b\x66rame_state\x18\x01 \x01(\t\"\x1f\n\x10SetFrameStateRsp\x12\x0b\n\x03msg\x18\x01 \x01(\t\"e\n\x0cMaterialInfo\x12\x13\n\x0bobject_prim\x18\x01 \x01(\t\x12\x15\n\rmaterial_name\x18\x02 \x01(\t\x12\x15\n\rmaterial_path\x18\x03 \x01(\t\x12\x12\n\nlabel_name\x18\x04 \x01(\t\"A\n\x0eSetMaterailReq\x12/\n\tmaterials\x18\x01 \x03(\x0b\x32\x1c.aimdk.protocol.MaterialInfo\"\x1d\n\x0eSetMaterialRsp\x12\x0b\n\x03msg\x18\x01 \x01(\t\"\xaa\x01\n\x08LightCfg\x12\x12\n\nlight_type\x18\x01 \x01(\t\x12\x12\n\nlight_prim\x18\x02 \x01(\t\x12\x19\n\x11light_temperature\x18\x03 \x01(\x02\x12\x17\n\x0flight_intensity\x18\x04 \x01(\x02\x12+\n\x0elight_rotation\x18\x05 \x01(\x0b\x32\x13.aimdk.protocol.Rpy\x12\x15\n\rlight_texture\x18\x06 \x01(\t\"7\n\x0bSetLightReq\x12(\n\x06lights\x18\x01 \x03(\x0b\x32\x18.aimdk.protocol.LightCfg\"\x1a\n\x0bSetLightRsp\x12\x0b\n\x03msg\x18\x01 \x01(\t\"\x1c\n\x0c\x43learLineReq\x12\x0c\n\x04name\x18\x01 \x01(\t\"\x1b\n\x0c\x43learLineRsp\x12\x0b\n\x03msg\x18\x01 \x01(\t\"\x8e\x01\n\x18OmniCmdChangePropertyReq\x12\x11\n\tprop_path\x18\x01 \x01(\t\x12\x13\n\tstr_value\x18\x02 \x01(\tH\x00\x12\x13\n\tint_value\x18\x03 \x01(\x05H\x00\x12\x16\n\x0c\x64ouble_value\x18\x04 \x01(\x01H\x00\x12\x14\n\nbool_value\x18\x05 \x01(\x08H\x00\x42\x07\n\x05value\"\'\n\x18OmniCmdChangePropertyRsp\x12\x0b\n\x03msg\x18\x01 \x01(\t\"<\n\x19GetPartiPointNumInbboxReq\x12\x11\n\tprim_path\x18\x01 \x01(\t\x12\x0c\n\x04\x62\x62ox\x18\x02 \x03(\x02\"(\n\x19GetPartiPointNumInbboxRsp\x12\x0b\n\x03num\x18\x01 \x01(\x05\"%\n\x10GetObjectAABBReq\x12\x11\n\tprim_path\x18\x01 \x01(\t\" \n\x10GetObjectAABBRsp\x12\x0c\n\x04\x62\x62ox\x18\x01 \x03(\x02\"\'\n\x11GetObjectAABBsReq\x12\x12\n\nprim_paths\x18\x01 \x03(\t\"!\n\x11GetObjectAABBsRsp\x12\x0c\n\x04\x62\x62ox\x18\x01 \x03(\x02\"$\n\x0fGetWorldPoseReq\x12\x11\n\tprim_path\x18\x01 \x01(\t\",\n\x0fGetWorldPoseRsp\x12\x0b\n\x03pos\x18\x01 \x03(\x02\x12\x0c\n\x04quat\x18\x02 \x03(\x02\"\xaf\x01\n\x13WaitUntilSettledReq\x12\x11\n\tmin_steps\x18\x01 \x01(\x05\x12\x11\n\tmax_steps\x18\x02 \x01(\x05\x12\x17\n\x0flinear_velocity\x18\x03 \x01(\x02\x12\x18\n\x10\x61ngular_velocity\x18\x04 \x01(\x02\x12\x16\n\x0ejoint_velocity\x18\x05 \x01(\x02\x12\x12\n\nprim_paths\x18\x06 \x03(\t\x12\x13\n\x0bjoint_names\x18\x07 \x03(\t\"5\n\x13WaitUntilSettledRsp\x12\x0f\n\x07settled\x18\x01 \x01(\x08\x12\r\n\x05steps\x18\x02 \x01(\x05\"\"\n\x11GetServerStatsReq\x12\r\n\x05reset\x18\x01 \x01(\x08\"\"\n\x11GetServerStatsRsp\x12\r\n\x05stats\x18\x01 \x01(\t2\x94\x10\n\x15SimObservationService\x12V\n\x0eGetObservation\x12!.aimdk.protocol.GetObservationReq\x1a!.aimdk.protocol.GetObservationRsp\x12`\n\x12StreamObservations\x12%.aimdk.protocol.StreamObservationsReq\x1a!.aimdk.protocol.GetObservationRsp0\x01\x12;\n\x05Reset\x12\x18.aimdk.protocol.ResetReq\x1a\x18.aimdk.protocol.ResetRsp\x12\x41\n\tAttachObj\x12\x19.aimdk.protocol.AttachReq\x1a\x19.aimdk.protocol.AttachRsp\x12\x41\n\tDetachObj\x12\x19.aimdk.protocol.DetachReq\x1a\x19.aimdk.protocol.DetachRsp\x12G\n\tMultiMove\x12\x1c.aimdk.protocol.MultiMoveReq\x1a\x1c.aimdk.protocol.MultiMoveRsp\x12\\\n\x10GetObjectsOfType\x12#.aimdk.protocol.GetObjectsOfTypeReq\x1a#.aimdk.protocol.GetObjectsOfTypeRsp\x12J\n\nTaskStatus\x12\x1d.aimdk.protocol.TaskStatusReq\x1a\x1d.aimdk.protocol.TaskStatusRsp\x12\x38\n\x04\x45xit\x12\x17.aimdk.protocol.ExitReq\x1a\x17.aimdk.protocol.ExitRsp\x12G\n\tInitRobot\x12\x1c.aimdk.protocol.InitRobotReq\x1a\x1c.aimdk.protocol.InitRobotRsp\x12G\n\tAddCamera\x12\x1c.aimdk.protocol.AddCameraReq\x1a\x1c.aimdk.protocol.AddCameraRsp\x12\x44\n\x08\x44rawLine\x12\x1b.aimdk.protocol.DrawLineReq\x1a\x1b.aimdk.protocol.DrawLineRsp\x12S\n\rSetObjectPose\x12 .aimdk.protocol.SetObjectPoseReq\x1a .aimdk.protocol.SetObjectPoseRsp\x12_\n\x11SetTrajectoryList\x12$.aimdk.protocol.SetTrajectoryListReq\x1a$.aimdk.protocol.SetTrajectoryListRsp\x12S\n\rSetFrameState\x12 .aimdk.protocol.SetFrameStateReq\x1a .aimdk.protocol.SetFrameStateRsp\x12M\n\x0bSetMaterial\x12\x1e.aimdk.protocol.SetMaterailReq\x1a\x1e.aimdk.protocol.SetMaterialRsp\x12\x44\n\x08SetLight\x12\x1b.aimdk.protocol.SetLightReq\x1a\x1b.aimdk.protocol.SetLightRsp\x12G\n\tClearLine\x12\x1c.aimdk.protocol.ClearLineReq\x1a\x1c.aimdk.protocol.ClearLineRsp\x12k\n\x15OmniCmdChangeProperty\x12(.aimdk.protocol.OmniCmdChangePropertyReq\x1a(.aimdk.protocol.OmniCmdChangePropertyRsp\x12n\n\x16GetPartiPointNumInbbox\x12).aimdk.protocol.GetPartiPointNumInbboxReq\x1a).aimdk.protocol.GetPartiPointNumInbboxRsp\x12S\n\rGetObjectAABB\x12 .aimdk.protocol.GetObjectAABBReq\x1a .aimdk.protocol.GetObjectAABBRsp\x12V\n\x0eGetObjectAABBs\x12!.aimdk.protocol.GetObjectAABBsReq\x1a!.aimdk.protocol.GetObjectAABBsRsp\x12P\n\x0cGetWorldPose\x12\x1f.aimdk.protocol.GetWorldPoseReq\x1a\x1f.aimdk.protocol.GetWorldPoseRsp\x12V\n\x0eGetServerStats\x12!.aimdk.protocol.GetServerStatsReq\x1a!.aimdk.protocol.GetServerStatsRsp\x12\\\n\x10WaitUntilSettled\x12#.aimdk.protocol.WaitUntilSettledReq\x1a#.aimdk.protocol.WaitUntilSettledRspP\x00P\x01\x62\x06proto3')
 
 _globals = globals()
 _builder.BuildMessageAndEnumDescriptors(DESCRIPTOR, _globals)
@@ -56,117 +56,131 @@ if not _descriptor._USE_C_DESCRIPTORS:
   _globals['_SEMANTICDICT']._serialized_start=185
   _globals['_SEMANTICDICT']._serialized_end=237
   _globals['_CAMIMAGE']._serialized_start=239
-  _globals['_CAMIMAGE']._serialized_end=279
-  _globals['_CAMINFO']._serialized_start=281
-  _globals['_CAMINFO']._serialized_end=371
-  _globals['_CAMERARSP']._serialized_start=374
-  _globals['_CAMERARSP']._serialized_end=628
-  _globals['_JOINTRSP']._serialized_start=631
-  _globals['_JOINTRSP']._serialized_end=780
-  _globals['_OBJECTRSP']._serialized_start=782
-  _globals['_OBJECTRSP']._serialized_end=842
-  _globals['_GRIPPERRSP']._serialized_start=844
-  _globals['_GRIPPERRSP']._serialized_end=957
-  _globals['_CAMERAREQUEST']._serialized_start=959
-  _globals['_CAMERAREQUEST']._serialized_end=1047
-  _globals['_GRIPPERREQUEST']._serialized_start=1049
-  _globals['_GRIPPERREQUEST']._serialized_end=1094
-  _globals['_GETOBSERVATIONREQ']._serialized_start=1097
-  _globals['_GETOBSERVATIONREQ']._serialized_end=1385
-  _globals['_GETOBSERVATIONRSP']._serialized_start=1388
-  _globals['_GETOBSERVATIONRSP']._serialized_end=1601
-  _globals['_RESETREQ']._serialized_start=1603
-  _globals['_RESETREQ']._serialized_end=1628
-  _globals['_RESETRSP']._serialized_start=1630
-  _globals['_RESETRSP']._serialized_end=1653
-  _globals['_ATTACHREQ']._serialized_start=1655
-  _globals['_ATTACHREQ']._serialized_end=1703
-  _globals['_ATTACHRSP']._serialized_start=1705
-  _globals['_ATTACHRSP']._serialized_end=1729
-  _globals['_DETACHREQ']._serialized_start=1731
-  _globals['_DETACHREQ']._serialized_end=1758
-  _globals['_DETACHRSP']._serialized_start=1760
-  _globals['_DETACHRSP']._serialized_end=1784
-  _globals['_MULTIMOVEREQ']._serialized_start=1787
-  _globals['_MULTIMOVEREQ']._serialized_end=1921
-  _globals['_MULTIMOVERSP']._serialized_start=1923
-  _globals['_MULTIMOVERSP']._serialized_end=1994
-  _globals['_CMDPLAN']._serialized_start=1996
-  _globals['_CMDPLAN']._serialized_end=2075
-  _globals['_SINGLEPLAN']._serialized_start=2077
-  _globals['_SINGLEPLAN']._serialized_end=2108
-  _globals['_TASKSTATUSREQ']._serialized_start=2110
-  _globals['_TASKSTATUSREQ']._serialized_end=2162
-  _globals['_TASKSTATUSRSP']._serialized_start=2164
-  _globals['_TASKSTATUSRSP']._serialized_end=2192
-  _globals['_EXITREQ']._serialized_start=2194
-  _globals['_EXITREQ']._serialized_end=2217
-  _globals['_EXITRSP']._serialized_start=2219
-  _globals['_EXITRSP']._serialized_end=2241
-  _globals['_GETOBJECTSOFTYPEREQ']._serialized_start=2243
-  _globals['_GETOBJECTSOFTYPEREQ']._serialized_end=2282
-  _globals['_GETOBJECTSOFTYPERSP']._serialized_start=2284
-  _globals['_GETOBJECTSOFTYPERSP']._serialized_end=2325
-  _globals['_INITROBOTREQ']._serialized_start=2328
-  _globals['_INITROBOTREQ']._serialized_end=2526
-  _globals['_INITROBOTRSP']._serialized_start=2528
-  _globals['_INITROBOTRSP']._serialized_end=2555
-  _globals['_ADDCAMERAREQ']._serialized_start=2558
-  _globals['_ADDCAMERAREQ']._serialized_end=2769
-  _globals['_ADDCAMERARSP']._serialized_start=2771
-  _globals['_ADDCAMERARSP']._serialized_end=2798
-  _globals['_DRAWLINEREQ']._serialized_start=2801
-  _globals['_DRAWLINEREQ']._serialized_end=2969
-  _globals['_DRAWLINERSP']._serialized_start=2971
-  _globals['_DRAWLINERSP']._serialized_end=2997
-  _globals['_OBJECTPOSE']._serialized_start=2999
-  _globals['_OBJECTPOSE']._serialized_end=3072
-  _globals['_OBJECTJOINT']._serialized_start=3074
-  _globals['_OBJECTJOINT']._serialized_end=3155
-  _globals['_SETOBJECTPOSEREQ']._serialized_start=3158
-  _globals['_SETOBJECTPOSEREQ']._serialized_end=3325
-  _globals['_SETOBJECTPOSERSP']._serialized_start=3327
-  _globals['_SETOBJECTPOSERSP']._serialized_end=3358
-  _globals['_SETTRAJECTORYLISTREQ']._serialized_start=3360
-  _globals['_SETTRAJECTORYLISTREQ']._serialized_end=3454
-  _globals['_SETTRAJECTORYLISTRSP']._serialized_start=3456
-  _globals['_SETTRAJECTORYLISTRSP']._serialized_end=3491
-  _globals['_SETFRAMESTATEREQ']._serialized_start=3493
-  _globals['_SETFRAMESTATEREQ']._serialized_end=3532
-  _globals['_SETFRAMESTATERSP']._serialized_start=3534
-  _globals['_SETFRAMESTATERSP']._serialized_end=3565
-  _globals['_MATERIALINFO']._serialized_start=3567
-  _globals['_MATERIALINFO']._serialized_end=3668
-  _globals['_SETMATERAILREQ']._serialized_start=3670
-  _globals['_SETMATERAILREQ']._serialized_end=3735
-  _globals['_SETMATERIALRSP']._serialized_start=3737
-  _globals['_SETMATERIALRSP']._serialized_end=3766
-  _globals['_LIGHTCFG']._serialized_start=3769
-  _globals['_LIGHTCFG']._serialized_end=3939
-  _globals['_SETLIGHTREQ']._serialized_start=3941
-  _globals['_SETLIGHTREQ']._serialized_end=3996
-  _globals['_SETLIGHTRSP']._serialized_start=3998
-  _globals['_SETLIGHTRSP']._serialized_end=4024
-  _globals['_CLEARLINEREQ']._serialized_start=4026
-  _globals['_CLEARLINEREQ']._serialized_end=4054
-  _globals['_CLEARLINERSP']._serialized_start=4056
-  _globals['_CLEARLINERSP']._serialized_end=4083
-  _globals['_OMNICMDCHANGEPROPERTYREQ']._serialized_start=4086
-  _globals['_OMNICMDCHANGEPROPERTYREQ']._serialized_end=4228
-  _globals['_OMNICMDCHANGEPROPERTYRSP']._serialized_start=4230
-  _globals['_OMNICMDCHANGEPROPERTYRSP']._serialized_end=4269
-  _globals['_GETPARTIPOINTNUMINBBOXREQ']._serialized_start=4271
-  _globals['_GETPARTIPOINTNUMINBBOXREQ']._serialized_end=4331
-  _globals['_GETPARTIPOINTNUMINBBOXRSP']._serialized_start=4333
-  _globals['_GETPARTIPOINTNUMINBBOXRSP']._serialized_end=4373
-  _globals['_GETOBJECTAABBREQ']._serialized_start=4375
-  _globals['_GETOBJECTAABBREQ']._serialized_end=4412
-  _globals['_GETOBJECTAABBRSP']._serialized_start=4414
-  _globals['_GETOBJECTAABBRSP']._serialized_end=4446
-  _globals['_GETWORLDPOSEREQ']._serialized_start=4448
-  _globals['_GETWORLDPOSEREQ']._serialized_end=4484
-  _globals['_GETWORLDPOSERSP']._serialized_start=4486
-  _globals['_GETWORLDPOSERSP']._serialized_end=4530
-  _globals['_SIMOBSERVATIONSERVICE']._serialized_start=4533
-  _globals['_SIMOBSERVATIONSERVICE']._serialized_end=6233
+  _globals['_CAMIMAGE']._serialized_end=360
+  _globals['_CAMINFO']._serialized_start=362
+  _globals['_CAMINFO']._serialized_end=452
+  _globals['_CAMERARSP']._serialized_start=455
+  _globals['_CAMERARSP']._serialized_end=709
+  _globals['_JOINTRSP']._serialized_start=712
+  _globals['_JOINTRSP']._serialized_end=861
+  _globals['_OBJECTRSP']._serialized_start=863
+  _globals['_OBJECTRSP']._serialized_end=923
+  _globals['_GRIPPERRSP']._serialized_start=925
+  _globals['_GRIPPERRSP']._serialized_end=1038
+  _globals['_CAMERAREQUEST']._serialized_start=1040
+  _globals['_CAMERAREQUEST']._serialized_end=1128
+  _globals['_GRIPPERREQUEST']._serialized_start=1130
+  _globals['_GRIPPERREQUEST']._serialized_end=1175
+  _globals['_GETOBSERVATIONREQ']._serialized_start=1178
+  _globals['_GETOBSERVATIONREQ']._serialized_end=1483
+  _globals['_GETOBSERVATIONRSP']._serialized_start=1486
+  _globals['_GETOBSERVATIONRSP']._serialized_end=1717
+  _globals['_STREAMOBSERVATIONSREQ']._serialized_start=1719
+  _globals['_STREAMOBSERVATIONSREQ']._serialized_end=1825
+  _globals['_RESETREQ']._serialized_start=1827
+  _globals['_RESETREQ']._serialized_end=1866
+  _globals['_RESETRSP']._serialized_start=1868
+  _globals['_RESETRSP']._serialized_end=1891
+  _globals['_ATTACHREQ']._serialized_start=1893
+  _globals['_ATTACHREQ']._serialized_end=1941
+  _globals['_ATTACHRSP']._serialized_start=1943
+  _globals['_ATTACHRSP']._serialized_end=1967
+  _globals['_DETACHREQ']._serialized_start=1969
+  _globals['_DETACHREQ']._serialized_end=1996
+  _globals['_DETACHRSP']._serialized_start=1998
+  _globals['_DETACHRSP']._serialized_end=2022
+  _globals['_MULTIMOVEREQ']._serialized_start=2025
+  _globals['_MULTIMOVEREQ']._serialized_end=2159
+  _globals['_MULTIMOVERSP']._serialized_start=2161
+  _globals['_MULTIMOVERSP']._serialized_end=2232
+  _globals['_CMDPLAN']._serialized_start=2234
+  _globals['_CMDPLAN']._serialized_end=2313
+  _globals['_SINGLEPLAN']._serialized_start=2315
+  _globals['_SINGLEPLAN']._serialized_end=2346
+  _globals['_TASKSTATUSREQ']._serialized_start=2348
+  _globals['_TASKSTATUSREQ']._serialized_end=2400
+  _globals['_TASKSTATUSRSP']._serialized_start=2402
+  _globals['_TASKSTATUSRSP']._serialized_end=2430
+  _globals['_EXITREQ']._serialized_start=2432
+  _globals['_EXITREQ']._serialized_end=2455
+  _globals['_EXITRSP']._serialized_start=2457
+  _globals['_EXITRSP']._serialized_end=2479
+  _globals['_GETOBJECTSOFTYPEREQ']._serialized_start=2481
+  _globals['_GETOBJECTSOFTYPEREQ']._serialized_end=2520
+  _globals['_GETOBJECTSOFTYPERSP']._serialized_start=2522
+  _globals['_GETOBJECTSOFTYPERSP']._serialized_end=2563
+  _globals['_INITROBOTREQ']._serialized_start=2566
+  _globals['_INITROBOTREQ']._serialized_end=2764
+  _globals['_INITROBOTRSP']._serialized_start=2766
+  _globals['_INITROBOTRSP']._serialized_end=2793
+  _globals['_ADDCAMERAREQ']._serialized_start=2796
+  _globals['_ADDCAMERAREQ']._serialized_end=3007
+  _globals['_ADDCAMERARSP']._serialized_start=3009
+  _globals['_ADDCAMERARSP']._serialized_end=3036
+  _globals['_DRAWLINEREQ']._serialized_start=3039
+  _globals['_DRAWLINEREQ']._serialized_end=3207
+  _globals['_DRAWLINERSP']._serialized_start=3209
+  _globals['_DRAWLINERSP']._serialized_end=3235
+  _globals['_OBJECTPOSE']._serialized_start=3237
+  _globals['_OBJECTPOSE']._serialized_end=3310
+  _globals['_OBJECTJOINT']._serialized_start=3312
+  _globals['_OBJECTJOINT']._serialized_end=3393
+  _globals['_SETOBJECTPOSEREQ']._serialized_start=3396
+  _globals['_SETOBJECTPOSEREQ']._serialized_end=3563
+  _globals['_SETOBJECTPOSERSP']._serialized_start=3565
+  _globals['_SETOBJECTPOSERSP']._serialized_end=3596
+  _globals['_SETTRAJECTORYLISTREQ']._serialized_start=3598
+  _globals['_SETTRAJECTORYLISTREQ']._serialized_end=3692
+  _globals['_SETTRAJECTORYLISTRSP']._serialized_start=3694
+  _globals['_SETTRAJECTORYLISTRSP']._serialized_end=3729
+  _globals['_SETFRAMESTATEREQ']._serialized_start=3731
+  _globals['_SETFRAMESTATEREQ']._serialized_end=3770
+  _globals['_SETFRAMESTATERSP']._serialized_start=3772
+  _globals['_SETFRAMESTATERSP']._serialized_end=3803
+  _globals['_MATERIALINFO']._serialized_start=3805
+  _globals['_MATERIALINFO']._serialized_end=3906
+  _globals['_SETMATERAILREQ']._serialized_start=3908
+  _globals['_SETMATERAILREQ']._serialized_end=3973
+  _globals['_SETMATERIALRSP']._serialized_start=3975
+  _globals['_SETMATERIALRSP']._serialized_end=4004
+  _globals['_LIGHTCFG']._serialized_start=4007
+  _globals['_LIGHTCFG']._serialized_end=4177
+  _globals['_SETLIGHTREQ']._serialized_start=4179
+  _globals['_SETLIGHTREQ']._serialized_end=4234
+  _globals['_SETLIGHTRSP']._serialized_start=4236
+  _globals['_SETLIGHTRSP']._serialized_end=4262
+  _globals['_CLEARLINEREQ']._serialized_start=4264
+  _globals['_CLEARLINEREQ']._serialized_end=4292
+  _globals['_CLEARLINERSP']._serialized_start=4294
+  _globals['_CLEARLINERSP']._serialized_end=4321
+  _globals['_OMNICMDCHANGEPROPERTYREQ']._serialized_start=4324
+  _globals['_OMNICMDCHANGEPROPERTYREQ']._serialized_end=4466
+  _globals['_OMNICMDCHANGEPROPERTYRSP']._serialized_start=4468
+  _globals['_OMNICMDCHANGEPROPERTYRSP']._serialized_end=4507
+  _globals['_GETPARTIPOINTNUMINBBOXREQ']._serialized_start=4509
+  _globals['_GETPARTIPOINTNUMINBBOXREQ']._serialized_end=4569
+  _globals['_GETPARTIPOINTNUMINBBOXRSP']._serialized_start=4571
+  _globals['_GETPARTIPOINTNUMINBBOXRSP']._serialized_end=4611
+  _globals['_GETOBJECTAABBREQ']._serialized_start=4613
+  _globals['_GETOBJECTAABBREQ']._serialized_end=4650
+  _globals['_GETOBJECTAABBRSP']._serialized_start=4652
+  _globals['_GETOBJECTAABBRSP']._serialized_end=4684
+  _globals['_GETOBJECTAABBSREQ']._serialized_start=4686
+  _globals['_GETOBJECTAABBSREQ']._serialized_end=4725
+  _globals['_GETOBJECTAABBSRSP']._serialized_start=4727
+  _globals['_GETOBJECTAABBSRSP']._serialized_end=4760
+  _globals['_GETWORLDPOSEREQ']._serialized_start=4762
+  _globals['_GETWORLDPOSEREQ']._serialized_end=4798
+  _globals['_GETWORLDPOSERSP']._serialized_start=4800
+  _globals['_GETWORLDPOSERSP']._serialized_end=4844
+  _globals['_WAITUNTILSETTLEDREQ']._serialized_start=4847
+  _globals['_WAITUNTILSETTLEDREQ']._serialized_end=5022
+  _globals['_WAITUNTILSETTLEDRSP']._serialized_start=5024
+  _globals['_WAITUNTILSETTLEDRSP']._serialized_end=5077
+  _globals['_GETSERVERSTATSREQ']._serialized_start=5079
+  _globals['_GETSERVERSTATSREQ']._serialized_end=5113
+  _globals['_GETSERVERSTATSRSP']._serialized_start=5115
+  _globals['_GETSERVERSTATSRSP']._serialized_end=5149
+  _globals['_SIMOBSERVATIONSERVICE']._serialized_start=5152
+  _globals['_SIMOBSERVATIONSERVICE']._serialized_end=7220
 # @@protoc_insertion_point(module_scope)
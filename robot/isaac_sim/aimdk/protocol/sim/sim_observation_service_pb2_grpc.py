@@ -43,6 +43,11 @@ class SimObservationServiceStub(object):
                 request_serializer=aimdk_dot_protocol_dot_sim_dot_sim__observation__service__pb2.GetObservationReq.SerializeToString,
                 response_deserializer=aimdk_dot_protocol_dot_sim_dot_sim__observation__service__pb2.GetObservationRsp.FromString,
                 _registered_method=True)
+        self.StreamObservations = channel.unary_stream(
+                '/aimdk.protocol.SimObservationService/StreamObservations',
+                request_serializer=aimdk_dot_protocol_dot_sim_dot_sim__observation__service__pb2.StreamObservationsReq.SerializeToString,
+                response_deserializer=aimdk_dot_protocol_dot_sim_dot_sim__observation__service__pb2.GetObservationRsp.FromString,
+                _registered_method=True)
         self.Reset = channel.unary_unary(
                 '/aimdk.protocol.SimObservationService/Reset',
                 request_serializer=aimdk_dot_protocol_dot_sim_dot_sim__observation__service__pb2.ResetReq.SerializeToString,
@@ -138,11 +143,26 @@ class SimObservationServiceStub(object):
                 request_serializer=aimdk_dot_protocol_dot_sim_dot_sim__observation__service__pb2.GetObjectAABBReq.SerializeToString,
                 response_deserializer=aimdk_dot_protocol_dot_sim_dot_sim__observation__service__pb2.GetObjectAABBRsp.FromString,
                 _registered_method=True)
+        self.GetObjectAABBs = channel.unary_unary(
+                '/aimdk.protocol.SimObservationService/GetObjectAABBs',
+                request_serializer=aimdk_dot_protocol_dot_sim_dot_sim__observation__service__pb2.GetObjectAABBsReq.SerializeToString,
+                response_deserializer=aimdk_dot_protocol_dot_sim_dot_sim__observation__service__pb2.GetObjectAABBsRsp.FromString,
+                _registered_method=True)
         self.GetWorldPose = channel.unary_unary(
                 '/aimdk.protocol.SimObservationService/GetWorldPose',
                 request_serializer=aimdk_dot_protocol_dot_sim_dot_sim__observation__service__pb2.GetWorldPoseReq.SerializeToString,
                 response_deserializer=aimdk_dot_protocol_dot_sim_dot_sim__observation__service__pb2.GetWorldPoseRsp.FromString,
                 _registered_method=True)
+        self.GetServerStats = channel.unary_unary(
+                '/aimdk.protocol.SimObservationService/GetServerStats',
+                request_serializer=aimdk_dot_protocol_dot_sim_dot_sim__observation__service__pb2.GetServerStatsReq.SerializeToString,
+                response_deserializer=aimdk_dot_protocol_dot_sim_dot_sim__observation__service__pb2.GetServerStatsRsp.FromString,
+                _registered_method=True)
+        self.WaitUntilSettled = channel.unary_unary(
+                '/aimdk.protocol.SimObservationService/WaitUntilSettled',
+                request_serializer=aimdk_dot_protocol_dot_sim_dot_sim__observation__service__pb2.WaitUntilSettledReq.SerializeToString,
+                response_deserializer=aimdk_dot_protocol_dot_sim_dot_sim__observation__service__pb2.WaitUntilSettledRsp.FromString,
+                _registered_method=True)
 
 
 class SimObservationServiceServicer(object):
@@ -154,6 +174,12 @@ class SimObservationServiceServicer(object):
         context.set_details('Method not implemented!')
         raise NotImplementedError('Method not implemented!')
 
+    def StreamObservations(self, request, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
     def Reset(self, request, context):
         """Missing associated documentation comment in .proto file."""
         context.set_code(grpc.StatusCode.UNIMPLEMENTED)
@@ -268,12 +294,30 @@ class SimObservationServiceServicer(object):
         context.set_details('Method not implemented!')
         raise NotImplementedError('Method not implemented!')
 
+    def GetObjectAABBs(self, request, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
     def GetWorldPose(self, request, context):
         """Missing associated documentation comment in .proto file."""
         context.set_code(grpc.StatusCode.UNIMPLEMENTED)
         context.set_details('Method not implemented!')
         raise NotImplementedError('Method not implemented!')
 
+    def GetServerStats(self, request, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def WaitUntilSettled(self, request, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
 
 def add_SimObservationServiceServicer_to_server(servicer, server):
     rpc_method_handlers = {
@@ -282,6 +326,11 @@ def add_SimObservationServiceServicer_to_server(servicer, server):
                     request_deserializer=aimdk_dot_protocol_dot_sim_dot_sim__observation__service__pb2.GetObservationReq.FromString,
                     response_serializer=aimdk_dot_protocol_dot_sim_dot_sim__observation__service__pb2.GetObservationRsp.SerializeToString,
             ),
+            'StreamObservations': grpc.unary_stream_rpc_method_handler(
+                    servicer.StreamObservations,
+                    request_deserializer=aimdk_dot_protocol_dot_sim_dot_sim__observation__service__pb2.StreamObservationsReq.FromString,
+                    response_serializer=aimdk_dot_protocol_dot_sim_dot_sim__observation__service__pb2.GetObservationRsp.SerializeToString,
+            ),
             'Reset': grpc.unary_unary_rpc_method_handler(
                     servicer.Reset,
                     request_deserializer=aimdk_dot_protocol_dot_sim_dot_sim__observation__service__pb2.ResetReq.FromString,
@@ -377,11 +426,26 @@ def add_SimObservationServiceServicer_to_server(servicer, server):
                     request_deserializer=aimdk_dot_protocol_dot_sim_dot_sim__observation__service__pb2.GetObjectAABBReq.FromString,
                     response_serializer=aimdk_dot_protocol_dot_sim_dot_sim__observation__service__pb2.GetObjectAABBRsp.SerializeToString,
             ),
+            'GetObjectAABBs': grpc.unary_unary_rpc_method_handler(
+                    servicer.GetObjectAABBs,
+                    request_deserializer=aimdk_dot_protocol_dot_sim_dot_sim__observation__service__pb2.GetObjectAABBsReq.FromString,
+                    response_serializer=aimdk_dot_protocol_dot_sim_dot_sim__observation__service__pb2.GetObjectAABBsRsp.SerializeToString,
+            ),
             'GetWorldPose': grpc.unary_unary_rpc_method_handler(
                     servicer.GetWorldPose,
                     request_deserializer=aimdk_dot_protocol_dot_sim_dot_sim__observation__service__pb2.GetWorldPoseReq.FromString,
                     response_serializer=aimdk_dot_protocol_dot_sim_dot_sim__observation__service__pb2.GetWorldPoseRsp.SerializeToString,
             ),
+            'GetServerStats': grpc.unary_unary_rpc_method_handler(
+                    servicer.GetServerStats,
+                    request_deserializer=aimdk_dot_protocol_dot_sim_dot_sim__observation__service__pb2.GetServerStatsReq.FromString,
+                    response_serializer=aimdk_dot_protocol_dot_sim_dot_sim__observation__service__pb2.GetServerStatsRsp.SerializeToString,
+            ),
+            'WaitUntilSettled': grpc.unary_unary_rpc_method_handler(
+                    servicer.WaitUntilSettled,
+                    request_deserializer=aimdk_dot_protocol_dot_sim_dot_sim__observation__service__pb2.WaitUntilSettledReq.FromString,
+                    response_serializer=aimdk_dot_protocol_dot_sim_dot_sim__observation__service__pb2.WaitUntilSettledRsp.SerializeToString,
+            ),
     }
     generic_handler = grpc.method_handlers_generic_handler(
             'aimdk.protocol.SimObservationService', rpc_method_handlers)
@@ -420,6 +484,33 @@ class SimObservationService(object):
             metadata,
             _registered_method=True)
 
+    @staticmethod
+    def StreamObservations(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_stream(
+            request,
+            target,
+            '/aimdk.protocol.SimObservationService/StreamObservations',
+            aimdk_dot_protocol_dot_sim_dot_sim__observation__service__pb2.StreamObservationsReq.SerializeToString,
+            aimdk_dot_protocol_dot_sim_dot_sim__observation__service__pb2.GetObservationRsp.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
+
     @staticmethod
     def Reset(request,
             target,
@@ -933,6 +1024,33 @@ class SimObservationService(object):
             metadata,
             _registered_method=True)
 
+    @staticmethod
+    def GetObjectAABBs(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(
+            request,
+            target,
+            '/aimdk.protocol.SimObservationService/GetObjectAABBs',
+            aimdk_dot_protocol_dot_sim_dot_sim__observation__service__pb2.GetObjectAABBsReq.SerializeToString,
+            aimdk_dot_protocol_dot_sim_dot_sim__observation__service__pb2.GetObjectAABBsRsp.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
+
     @staticmethod
     def GetWorldPose(request,
             target,
@@ -959,3 +1077,57 @@ class SimObservationService(object):
             timeout,
             metadata,
             _registered_method=True)
+
+    @staticmethod
+    def GetServerStats(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(
+            request,
+            target,
+            '/aimdk.protocol.SimObservationService/GetServerStats',
+            aimdk_dot_protocol_dot_sim_dot_sim__observation__service__pb2.GetServerStatsReq.SerializeToString,
+            aimdk_dot_protocol_dot_sim_dot_sim__observation__service__pb2.GetServerStatsRsp.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
+
+    @staticmethod
+    def WaitUntilSettled(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(
+            request,
+            target,
+            '/aimdk.protocol.SimObservationService/WaitUntilSettled',
+            aimdk_dot_protocol_dot_sim_dot_sim__observation__service__pb2.WaitUntilSettledReq.SerializeToString,
+            aimdk_dot_protocol_dot_sim_dot_sim__observation__service__pb2.WaitUntilSettledRsp.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
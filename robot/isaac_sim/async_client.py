@@ -0,0 +1,181 @@
+# Copyright (c) 2023-2025, AgiBot Inc. All Rights Reserved.
+# Author: Genie Sim Team
+# License: Mozilla Public License Version 2.0
+
+import asyncio
+import json
+import os
+import sys
+import grpc
+
+current_directory = os.path.dirname(os.path.abspath(__file__))
+if current_directory not in sys.path:
+    sys.path.append(current_directory)
+
+from aimdk.protocol.sim import sim_object_service_pb2
+from aimdk.protocol.sim import sim_observation_service_pb2
+from robot.isaac_sim.client import Rpc_Client, DEFAULT_MAX_MESSAGE_MB
+from shm_transport import ShmSlotOverwritten
+from base_utils.logger import Logger
+
+logger = Logger()  # Create singleton instance
+
+
+class AsyncRpcClient(Rpc_Client):
+    """
+    grpc.aio flavour of Rpc_Client with the same method surface.
+    Methods that only wrap a single unary call are inherited and return awaitables,
+    methods that post-process the response are coroutines here.
+    Create it inside a running event loop: client = await AsyncRpcClient.connect(host)
+    """
+
+    def __init__(
+        self,
+        client_host,
+        robot_urdf="G1_120s.urdf",
+        use_shm=False,
+        keepalive_time_ms=None,
+        compression=None,
+        max_message_mb=DEFAULT_MAX_MESSAGE_MB,
+    ):
+        self.use_shm = use_shm
+        self.shm_buffers = {}
+        self.robot_urdf = robot_urdf
+        self.channel = grpc.aio.insecure_channel(
+            client_host,
+            options=self._channel_options(keepalive_time_ms, max_message_mb),
+            compression=compression,
+        )
+        self._init_stubs()
+
+    @classmethod
+    async def connect(cls, client_host, retries=600, timeout=5, **kwargs):
+        client = cls(client_host, **kwargs)
+        for i in range(retries):
+            try:
+                await asyncio.wait_for(client.channel.channel_ready(), timeout)
+                return client
+            except asyncio.TimeoutError as e:
+                logger.error(f"Failed to connect to gRPC server[{i}]: {e}")
+                if i >= retries - 1:
+                    await client.close()
+                    raise e
+                await asyncio.sleep(3)
+
+    async def close(self):
+        await self.channel.close()
+
+    async def GetWorldPoses(self, prim_paths):
+        req = sim_object_service_pb2.GetWorldPosesReq()
+        req.prim_paths.extend(prim_paths)
+        response = await self.object_stub.GetWorldPoses(req)
+        return self._parse_world_poses(response)
+
+    async def GetObjectAABBs(self, prim_paths):
+        req = sim_observation_service_pb2.GetObjectAABBsReq()
+        req.prim_paths.extend(prim_paths)
+        response = await self.observation_stub.GetObjectAABBs(req)
+        return self._parse_aabbs(response)
+
+    async def read_frame(self, camera_prim_path, depth=False):
+        response = await self.capture_frame(camera_prim_path)
+        try:
+            return self._parse_frame(response, depth)
+        except ShmSlotOverwritten as e:
+            logger.warning(f"{e}, fetching the frame over grpc")
+            response = await self.capture_frame(camera_prim_path, use_shm=False)
+            return self._parse_frame(response, depth)
+
+    async def get_observation(self, data_keys, use_shm=None):
+        req = self._observation_req(data_keys, use_shm)
+        response = await self.observation_stub.GetObservation(req)
+        try:
+            return self._parse_observation(response, data_keys)
+        except ShmSlotOverwritten as e:
+            logger.warning(f"{e}, fetching the observation over grpc")
+            return await self.get_observation(data_keys, use_shm=False)
+
+    async def stream_observations(self, data_keys, step_interval=1):
+        req = sim_observation_service_pb2.StreamObservationsReq()
+        req.observation_req.CopyFrom(self._observation_req(data_keys))
+        req.step_interval = step_interval
+        async for response in self.observation_stub.StreamObservations(req):
+            try:
+                observation = self._parse_observation(response, data_keys)
+            except ShmSlotOverwritten as e:
+                logger.warning(f"{e}, fetching the observation over grpc")
+                observation = await self.get_observation(data_keys, use_shm=False)
+            yield observation
+
+    async def GetServerStats(self, reset=False):
+        req = sim_observation_service_pb2.GetServerStatsReq()
+        req.reset = reset
+        response = await self.observation_stub.GetServerStats(req)
+        return json.loads(response.stats)
+
+    async def WaitUntilSettled(
+        self,
+        min_steps=1,
+        max_steps=240,
+        linear_velocity=0.0,
+        angular_velocity=0.0,
+        joint_velocity=0.0,
+        prim_paths=(),
+        joint_names=(),
+    ):
+        req = self._wait_until_settled_req(
+            min_steps,
+            max_steps,
+            linear_velocity,
+            angular_velocity,
+            joint_velocity,
+            prim_paths,
+            joint_names,
+        )
+        response = await self.observation_stub.WaitUntilSettled(req)
+        return response.settled
+
+    async def GetIKStatus(self, target_poses, is_right, ObsAvoid=False):
+        req = self._ik_status_req(target_poses, is_right, ObsAvoid)
+        response = await self.joint_stub.GetIKStatus(req)
+        return self._parse_ik_status(response)
+
+    async def gather_queries(self, poses=(), joints=(), aabbs=(), gripper=False, joint_positions=False):
+        """
+        Issue independent read-only queries concurrently, so that they can be served
+        within the same physics step.
+            poses: prim paths -> {"pose": {prim_path: 4x4}}
+            joints: articulated prim paths -> {"joint": {prim_path: GetObjectJointRsp}}
+            aabbs: prim paths -> {"aabb": {prim_path: (2, 3)}}
+            gripper: -> {"gripper": {"left": rsp, "right": rsp}}
+            joint_positions: -> {"joint_position": rsp}
+        """
+        keys, calls = [], []
+        if poses:
+            keys.append(("pose", None))
+            calls.append(self.GetWorldPoses(list(poses)))
+        if aabbs:
+            keys.append(("aabb", None))
+            calls.append(self.GetObjectAABBs(list(aabbs)))
+        for prim_path in joints:
+            keys.append(("joint", prim_path))
+            calls.append(self.get_object_joint(prim_path))
+        if gripper:
+            for arm, is_right in (("left", False), ("right", True)):
+                keys.append(("gripper", arm))
+                calls.append(self.get_gripper_state(is_right=is_right))
+        if joint_positions:
+            keys.append(("joint_position", None))
+            calls.append(self.get_joint_positions())
+
+        results = await asyncio.gather(*calls)
+
+        queries = {}
+        for (name, key), result in zip(keys, results):
+            if name == "aabb":
+                queries[name] = dict(zip(aabbs, result))
+            elif key is None:
+                queries[name] = result
+            else:
+                queries.setdefault(name, {})[key] = result
+        return queries
@@ -7,6 +7,7 @@ import numpy as np
 import sys, os
 import time
 import json
+import threading
 
 current_directory = os.path.dirname(os.path.abspath(__file__))
 if current_directory not in sys.path:
@@ -39,19 +40,94 @@ from aimdk.protocol.sim import sim_observation_service_pb2
 from aimdk.protocol.sim import sim_observation_service_pb2_grpc
 
 
+from shm_transport import ShmRingBuffer, ShmSlotOverwritten, unpack_image
 from base_utils.logger import Logger
+from robot.utils import ik_manipulability
 
 logger = Logger()  # Create singleton instance
 
+# keep in line with the server's SIM_GRPC_MAX_MESSAGE_MB
+DEFAULT_MAX_MESSAGE_MB = int(os.getenv("SIM_GRPC_MAX_MESSAGE_MB", "50"))
+
+
+class ObservationStream:
+    """
+    StreamObservations subscription drained by a background thread. Only the newest
+    observation is kept, so get() never returns a frame that sat in the channel while
+    the caller was busy.
+    """
+
+    def __init__(self, client, data_keys, step_interval):
+        req = sim_observation_service_pb2.StreamObservationsReq()
+        req.observation_req.CopyFrom(client._observation_req(data_keys))
+        req.step_interval = step_interval
+        self.call = client.observation_stub.StreamObservations(req)
+        self.condition = threading.Condition()
+        self.observation = None
+        self.received = 0
+        self.returned = 0
+        self.error = None
+        self.closed = False
+        threading.Thread(
+            target=self._drain, args=(client, data_keys), daemon=True
+        ).start()
+
+    def _drain(self, client, data_keys):
+        try:
+            for response in self.call:
+                # parsed right away, shm slots are reused by later frames
+                try:
+                    observation = client._parse_observation(response, data_keys)
+                except ShmSlotOverwritten as e:
+                    logger.warning(f"{e}, fetching the observation over grpc")
+                    observation = client.get_observation(data_keys, use_shm=False)
+                with self.condition:
+                    self.observation = observation
+                    self.received += 1
+                    self.condition.notify_all()
+        except grpc.RpcError as e:
+            if e.code() != grpc.StatusCode.CANCELLED:
+                self.error = e
+        finally:
+            with self.condition:
+                self.closed = True
+                self.condition.notify_all()
+
+    def get(self, timeout=None):
+        """newest observation not returned yet, blocks until the next one arrives"""
+        with self.condition:
+            if not self.condition.wait_for(
+                lambda: self.received > self.returned or self.closed, timeout
+            ):
+                raise TimeoutError(f"No observation streamed within {timeout}s")
+            if self.received == self.returned:
+                raise RuntimeError("Observation stream closed") from self.error
+            self.returned = self.received
+            return self.observation
+
+    def close(self):
+        self.call.cancel()
+
 
 # All rotation angles in the current code are in units of angles
 class Rpc_Client:
-    def __init__(self, client_host, robot_urdf="G1_120s.urdf"):
+    def __init__(
+        self,
+        client_host,
+        robot_urdf="G1_120s.urdf",
+        use_shm=False,
+        keepalive_time_ms=None,
+        compression=None,
+        max_message_mb=DEFAULT_MAX_MESSAGE_MB,
+    ):
+        # read camera frames from the server's shared memory, same host only
+        self.use_shm = use_shm
+        self.shm_buffers = {}
+        options = self._channel_options(keepalive_time_ms, max_message_mb)
         for i in range(600):
             try:
                 self.channel = grpc.insecure_channel(
-                    client_host,
-                    options=[("grpc.max_receive_message_length", 50 * 1024 * 1024)],
+                    client_host, options=options, compression=compression
                 )
                 grpc.channel_ready_future(self.channel).result(timeout=5)
                 self.robot_urdf = robot_urdf
@@ -66,6 +142,37 @@ class Rpc_Client:
                 time.sleep(3)
                 if i >= 599:
                     raise e
+        self._init_stubs()
+
+    @staticmethod
+    def _channel_options(keepalive_time_ms=None, max_message_mb=DEFAULT_MAX_MESSAGE_MB):
+        options = [("grpc.max_receive_message_length", max_message_mb * 1024 * 1024)]
+        if keepalive_time_ms:
+            options += [
+                ("grpc.keepalive_time_ms", keepalive_time_ms),
+                ("grpc.keepalive_timeout_ms", 10000),
+                ("grpc.keepalive_permit_without_calls", 1),
+                ("grpc.http2.max_pings_without_data", 0),
+            ]
+        return options
+
+    def _init_stubs(self):
+        # stubs are cheap to reuse and only bound to the channel
+        self.camera_stub = rs2_camera_pb2_grpc.CameraServiceStub(self.channel)
+        self.sim_camera_stub = sim_camera_service_pb2_grpc.SimCameraServiceStub(
+            self.channel
+        )
+        self.arm_stub = arm_pb2_grpc.G1ArmControlServiceStub(self.channel)
+        self.joint_stub = joint_channel_pb2_grpc.JointControlServiceStub(self.channel)
+        self.gripper_stub = sim_gripper_service_pb2_grpc.SimGripperServiceStub(
+            self.channel
+        )
+        self.object_stub = sim_object_service_pb2_grpc.SimObjectServiceStub(
+            self.channel
+        )
+        self.observation_stub = (
+            sim_observation_service_pb2_grpc.SimObservationServiceStub(self.channel)
+        )
 
     def set_frame_state(
         self,
@@ -75,7 +182,7 @@ class Rpc_Client:
         passive_id: str,
         if_attached: bool,
     ):
-        stub = sim_observation_service_pb2_grpc.SimObservationServiceStub(self.channel)
+        stub = self.observation_stub
         req = sim_observation_service_pb2.SetFrameStateReq()
         frame_state = {
             "action": action,
@@ -90,15 +197,52 @@ class Rpc_Client:
         response = stub.SetFrameState(req)
         return response
 
-    def capture_frame(self, camera_prim_path):
-        stub = rs2_camera_pb2_grpc.CameraServiceStub(self.channel)
+    def capture_frame(self, camera_prim_path, use_shm=None):
+        stub = self.camera_stub
         req = rs2_camera_pb2.GetCameraDataRequest()
         req.serial_no = camera_prim_path
+        req.use_shm = self.use_shm if use_shm is None else use_shm
         response = stub.GetCameraData(req)
         return response
 
+    def read_frame(self, camera_prim_path, depth=False):
+        """capture_frame response with its flat rgba (and depth) pixels read out"""
+        return self._with_shm_fallback(
+            lambda use_shm: self.capture_frame(camera_prim_path, use_shm),
+            lambda response: self._parse_frame(response, depth),
+        )
+
+    def _parse_frame(self, response, depth):
+        rgb = self.read_image(response.color_image, np.uint8, response.shm_name)
+        if not depth:
+            return response, rgb, None
+        depth_image = self.read_image(
+            response.depth_image, np.float32, response.shm_name
+        )
+        return response, rgb, depth_image
+
+    def _with_shm_fallback(self, fetch, parse, use_shm=None):
+        """
+        parse(fetch(use_shm)), fetched again with the pixels in the grpc payload when a
+        shm slot was overwritten before it was read
+        """
+        response = fetch(self.use_shm if use_shm is None else use_shm)
+        try:
+            return parse(response)
+        except ShmSlotOverwritten as e:
+            logger.warning(f"{e}, fetching the frame over grpc")
+            return parse(fetch(False))
+
+    def read_image(self, image, dtype, shm_name=""):
+        shm_buffer = None
+        if image.in_shm:
+            if shm_name not in self.shm_buffers:
+                self.shm_buffers[shm_name] = ShmRingBuffer(name=shm_name)
+            shm_buffer = self.shm_buffers[shm_name]
+        return unpack_image(image, dtype, shm_buffer)
+
     def capture_semantic_frame(self, camera_prim_path):
-        stub = sim_camera_service_pb2_grpc.SimCameraServiceStub(self.channel)
+        stub = self.sim_camera_stub
         req = sim_camera_service_pb2.GetSemanticRequest()
         req.serial_no = "/World/G1/base/collisions/camera"
         req.serial_no = camera_prim_path
@@ -115,7 +259,7 @@ class Rpc_Client:
         ee_interpolation=False,
         distance_frame=0.0008,
     ):
-        stub = arm_pb2_grpc.G1ArmControlServiceStub(self.channel)
+        stub = self.arm_stub
         req = arm_pb2.LinearMoveReq()
         req.robot_name = arm_name
         req.pose.position.x, req.pose.position.y, req.pose.position.z = target_position
@@ -131,7 +275,7 @@ class Rpc_Client:
     def set_joint_positions(
         self, target_joint_position, is_trajectory, joint_indices=None
     ):
-        stub = joint_channel_pb2_grpc.JointControlServiceStub(self.channel)
+        stub = self.joint_stub
         req = joint_channel_pb2.SetJointReq()
         req.is_trajectory = is_trajectory
         for idx, pos in enumerate(target_joint_position):
@@ -146,7 +290,7 @@ class Rpc_Client:
         return response
 
     def get_joint_positions(self):
-        stub = joint_channel_pb2_grpc.JointControlServiceStub(self.channel)
+        stub = self.joint_stub
         req = joint_channel_pb2.GetJointReq()
         req.serial_no = "robot"
         response = stub.GetJointPosition(req)
@@ -174,7 +318,7 @@ class Rpc_Client:
         static_friction=0.5,
         dynamic_friction=0.5,
     ):
-        stub = sim_object_service_pb2_grpc.SimObjectServiceStub(self.channel)
+        stub = self.object_stub
         req = sim_object_service_pb2.AddObjectReq()
         req.usd_path = usd_path
         req.prim_path = prim_path
@@ -212,21 +356,34 @@ class Rpc_Client:
         return response
 
     def get_object_pose(self, prim_path):
-        stub = sim_object_service_pb2_grpc.SimObjectServiceStub(self.channel)
+        stub = self.object_stub
         req = sim_object_service_pb2.GetObjectPoseReq()
         req.prim_path = prim_path
         response = stub.GetObjectPose(req)
         return response
 
+    def GetWorldPoses(self, prim_paths):
+        stub = self.object_stub
+        req = sim_object_service_pb2.GetWorldPosesReq()
+        req.prim_paths.extend(prim_paths)
+        response = stub.GetWorldPoses(req)
+        return self._parse_world_poses(response)
+
+    def _parse_world_poses(self, response):
+        poses = {}
+        for world_pose in response.poses:
+            poses[world_pose.prim_path] = np.array(world_pose.pose).reshape(4, 4)
+        return poses
+
     def get_object_joint(self, prim_path):
-        stub = sim_object_service_pb2_grpc.SimObjectServiceStub(self.channel)
+        stub = self.object_stub
         req = sim_object_service_pb2.GetObjectJointReq()
         req.prim_path = prim_path
         response = stub.GetObjectJoint(req)
         return response
 
     def set_gripper_state(self, gripper_command, is_right, opened_width):
-        stub = sim_gripper_service_pb2_grpc.SimGripperServiceStub(self.channel)
+        stub = self.gripper_stub
         req = sim_gripper_service_pb2.SetGripperStateReq()
         req.gripper_command = gripper_command
         req.is_right = is_right
@@ -235,16 +392,28 @@ class Rpc_Client:
         return response
 
     def get_gripper_state(self, is_right):
-        stub = sim_gripper_service_pb2_grpc.SimGripperServiceStub(self.channel)
+        stub = self.gripper_stub
         req = sim_gripper_service_pb2.GetGripperStateReq()
         req.is_right = is_right
         response = stub.GetGripperState(req)
         return response
 
     # Client side gets all observations of a certain frame
-    def get_observation(self, data_keys):
-        observation = {}
-        stub = sim_observation_service_pb2_grpc.SimObservationServiceStub(self.channel)
+    def get_observation(self, data_keys, use_shm=None):
+        stub = self.observation_stub
+        return self._with_shm_fallback(
+            lambda use_shm: stub.GetObservation(
+                self._observation_req(data_keys, use_shm)
+            ),
+            lambda response: self._parse_observation(response, data_keys),
+            use_shm,
+        )
+
+    # Server pushes one observation every step_interval physics steps
+    def stream_observations(self, data_keys, step_interval=1):
+        return ObservationStream(self, data_keys, step_interval)
+
+    def _observation_req(self, data_keys, use_shm=None):
         req = sim_observation_service_pb2.GetObservationReq()
         if "camera" in data_keys:
             req.isCam = True
@@ -258,19 +427,21 @@ class Rpc_Client:
                 req.objectPrims.append(pose)
         req.isJoint = data_keys["joint_position"]
         req.isGripper = data_keys["gripper"]
-        response = stub.GetObservation(req)
+        req.use_shm = self.use_shm if use_shm is None else use_shm
+        return req
 
+    def _parse_observation(self, response, data_keys):
         # protobuf to dictionary
         camera_datas = {}
         for camera_data, camera_prim in zip(
             response.camera, data_keys["camera"]["camera_prim_list"]
         ):
             cam_data = {
-                "rgb_camera": np.frombuffer(
-                    camera_data.rgb_camera.data, dtype=np.uint8
+                "rgb_camera": self.read_image(
+                    camera_data.rgb_camera, np.uint8, response.shm_name
                 ),
-                "depth_camera": np.frombuffer(
-                    camera_data.depth_camera.data, dtype=np.float32
+                "depth_camera": self.read_image(
+                    camera_data.depth_camera, np.float32, response.shm_name
                 ),
                 "camera_info": {
                     "width": camera_data.camera_info.width,
@@ -352,7 +523,7 @@ class Rpc_Client:
 
     # Client starts recording
     def start_recording(self, data_keys, fps, task_name):
-        stub = sim_observation_service_pb2_grpc.SimObservationServiceStub(self.channel)
+        stub = self.observation_stub
         req = sim_observation_service_pb2.GetObservationReq()
         req.startRecording = True
         req.fps = fps
@@ -374,21 +545,22 @@ class Rpc_Client:
 
     # Client-side start and end recording
     def stop_recording(self):
-        stub = sim_observation_service_pb2_grpc.SimObservationServiceStub(self.channel)
+        stub = self.observation_stub
         req = sim_observation_service_pb2.GetObservationReq()
         req.stopRecording = True
         response = stub.GetObservation(req)
         return response
 
-    def reset(self):
-        stub = sim_observation_service_pb2_grpc.SimObservationServiceStub(self.channel)
+    def reset(self, soft=False):
+        stub = self.observation_stub
         req = sim_observation_service_pb2.ResetReq()
         req.reset = True
+        req.soft = soft
         response = stub.Reset(req)
         return response
 
     def AttachObj(self, prim_paths):
-        stub = sim_observation_service_pb2_grpc.SimObservationServiceStub(self.channel)
+        stub = self.observation_stub
         req = sim_observation_service_pb2.AttachReq()
         for prim in prim_paths:
             req.obj_prims.append(prim)
@@ -396,14 +568,14 @@ class Rpc_Client:
         return response
 
     def DetachObj(self):
-        stub = sim_observation_service_pb2_grpc.SimObservationServiceStub(self.channel)
+        stub = self.observation_stub
         req = sim_observation_service_pb2.DetachReq()
         req.detach = True
         response = stub.DetachObj(req)
         return response
 
     def MultiPlan(self, robot_name, target_poses):
-        stub = sim_observation_service_pb2_grpc.SimObservationServiceStub(self.channel)
+        stub = self.observation_stub
         req = sim_observation_service_pb2.MultiMoveReq()
         req.plan = True
         req.robot_name = robot_name
@@ -417,7 +589,7 @@ class Rpc_Client:
         return response
 
     def MultiMove(self, robot_name, cmd_plan):
-        stub = sim_observation_service_pb2_grpc.SimObservationServiceStub(self.channel)
+        stub = self.observation_stub
         req = sim_observation_service_pb2.MultiMoveReq()
         req.plan = False
         req.robot_name = robot_name
@@ -426,7 +598,7 @@ class Rpc_Client:
         return response
 
     def SendTaskStatus(self, isSuccess, fail_stage_step):
-        stub = sim_observation_service_pb2_grpc.SimObservationServiceStub(self.channel)
+        stub = self.observation_stub
         req = sim_observation_service_pb2.TaskStatusReq()
         for step in fail_stage_step:
             req.failStep.append(step)
@@ -435,26 +607,89 @@ class Rpc_Client:
         return response
 
     def Exit(self):
-        stub = sim_observation_service_pb2_grpc.SimObservationServiceStub(self.channel)
+        stub = self.observation_stub
         req = sim_observation_service_pb2.ExitReq()
         req.exit = True
         response = stub.Exit(req)
         return response
 
+    def GetServerStats(self, reset=False):
+        stub = self.observation_stub
+        req = sim_observation_service_pb2.GetServerStatsReq()
+        req.reset = reset
+        response = stub.GetServerStats(req)
+        return json.loads(response.stats)
+
+    def WaitUntilSettled(
+        self,
+        min_steps=1,
+        max_steps=240,
+        linear_velocity=0.0,
+        angular_velocity=0.0,
+        joint_velocity=0.0,
+        prim_paths=(),
+        joint_names=(),
+    ):
+        """blocks until the sim is at rest, see WaitUntilSettledReq, returns False on max_steps"""
+        req = self._wait_until_settled_req(
+            min_steps,
+            max_steps,
+            linear_velocity,
+            angular_velocity,
+            joint_velocity,
+            prim_paths,
+            joint_names,
+        )
+        response = self.observation_stub.WaitUntilSettled(req)
+        return response.settled
+
+    def _wait_until_settled_req(
+        self,
+        min_steps,
+        max_steps,
+        linear_velocity,
+        angular_velocity,
+        joint_velocity,
+        prim_paths,
+        joint_names,
+    ):
+        req = sim_observation_service_pb2.WaitUntilSettledReq()
+        req.min_steps = min_steps
+        req.max_steps = max_steps
+        req.linear_velocity = linear_velocity
+        req.angular_velocity = angular_velocity
+        req.joint_velocity = joint_velocity
+        req.prim_paths.extend(prim_paths)
+        req.joint_names.extend(joint_names)
+        return req
+
     def GetEEPose(self, is_right):
-        stub = joint_channel_pb2_grpc.JointControlServiceStub(self.channel)
+        stub = self.joint_stub
         req = joint_channel_pb2.GetEEPoseReq()
         req.is_right = is_right
         response = stub.GetEEPose(req)
         return response
 
     def GetIKStatus(self, target_poses, is_right, ObsAvoid=False):
-        import pinocchio
+        stub = self.joint_stub
+        req = self._ik_status_req(target_poses, is_right, ObsAvoid)
+        response = stub.GetIKStatus(req)
+        return self._parse_ik_status(response)
 
-        stub = joint_channel_pb2_grpc.JointControlServiceStub(self.channel)
+    def _ik_status_req(self, target_poses, is_right, ObsAvoid):
         req = joint_channel_pb2.GetIKStatusReq()
         req.is_right = is_right
         req.ObsAvoid = ObsAvoid
+        for pose in target_poses:
+            _pose = sim_observation_service_pb2.SE3RpyPose()
+            _pose.position.x, _pose.position.y, _pose.position.z = pose["position"]
+            _pose.rpy.rw, _pose.rpy.rx, _pose.rpy.ry, _pose.rpy.rz = pose["rotation"]
+            req.target_pose.append(_pose)
+        return req
+
+    def _parse_ik_status(self, response):
+        import pinocchio
+
         urdf = (
             os.path.dirname(os.path.abspath(__file__))
             + "/robot_urdf/"
@@ -468,12 +703,6 @@ class Rpc_Client:
             if name != "universe":
                 joint_names.append(str(name))
 
-        for pose in target_poses:
-            _pose = sim_observation_service_pb2.SE3RpyPose()
-            _pose.position.x, _pose.position.y, _pose.position.z = pose["position"]
-            _pose.rpy.rw, _pose.rpy.rx, _pose.rpy.ry, _pose.rpy.rz = pose["rotation"]
-            req.target_pose.append(_pose)
-        response = stub.GetIKStatus(req)
         result = []
         for ik_status in response.IKStatus:
             joint_datas = {}
@@ -490,12 +719,7 @@ class Rpc_Client:
                     joint_positions.append(joint_datas[name])
             joint_positions = np.array(joint_positions)
 
-            pinocchio.forwardKinematics(model, data, joint_positions)
-            if "G1" in self.robot_urdf:
-                J = pinocchio.computeJointJacobian(model, data, joint_positions, 24)
-            else:
-                J = pinocchio.computeJointJacobian(model, data, joint_positions, 7)
-            manip = np.sqrt(np.linalg.det(np.dot(J, J.T)))
+            manip = ik_manipulability(model, data, joint_positions, self.robot_urdf)
             result.append(
                 {
                     "status": ik_status.isSuccess,
@@ -550,7 +774,7 @@ class Rpc_Client:
         return manip
 
     def GetObjectsOfType(self, obj_type):
-        stub = sim_observation_service_pb2_grpc.SimObservationServiceStub(self.channel)
+        stub = self.observation_stub
         req = sim_observation_service_pb2.GetObjectsOfTypeReq()
         req.obj_type = obj_type
         response = stub.GetObjectsOfType(req)
@@ -568,7 +792,7 @@ class Rpc_Client:
         vertical_aperture,
         is_local,
     ):
-        stub = sim_observation_service_pb2_grpc.SimObservationServiceStub(self.channel)
+        stub = self.observation_stub
         req = sim_observation_service_pb2.AddCameraReq()
         req.camera_prim = camera_prim
         (
@@ -599,7 +823,7 @@ class Rpc_Client:
         init_position=[0, 0, 0],
         init_rotation=[1, 0, 0, 0],
     ):
-        stub = sim_observation_service_pb2_grpc.SimObservationServiceStub(self.channel)
+        stub = self.observation_stub
         req = sim_observation_service_pb2.InitRobotReq()
         req.robot_cfg_file, req.robot_usd_path, req.scene_usd_path = (
             robot_cfg,
@@ -621,7 +845,7 @@ class Rpc_Client:
         return response
 
     def DrawLine(self, point_list_1, point_list_2, colors, sizes):
-        stub = sim_observation_service_pb2_grpc.SimObservationServiceStub(self.channel)
+        stub = self.observation_stub
         req = sim_observation_service_pb2.DrawLineReq()
         for point in point_list_1:
             _point = sim_observation_service_pb2.Vec3()
@@ -641,7 +865,7 @@ class Rpc_Client:
         return response
 
     def SetObjectPose(self, object_info, joint_cmd, object_joints=[]):
-        stub = sim_observation_service_pb2_grpc.SimObservationServiceStub(self.channel)
+        stub = self.observation_stub
         req = sim_observation_service_pb2.SetObjectPoseReq()
         for object in object_info:
             object_pose = sim_observation_service_pb2.ObjectPose()
@@ -676,7 +900,7 @@ class Rpc_Client:
         return response
 
     def SetTrajectoryList(self, trajectory_list, is_block=False):
-        stub = sim_observation_service_pb2_grpc.SimObservationServiceStub(self.channel)
+        stub = self.observation_stub
         req = sim_observation_service_pb2.SetTrajectoryListReq()
         req.is_block = is_block
         for point in trajectory_list:
@@ -688,14 +912,14 @@ class Rpc_Client:
         return response
 
     def SetTargetPoint(self, position):
-        stub = sim_object_service_pb2_grpc.SimObjectServiceStub(self.channel)
+        stub = self.object_stub
         req = sim_object_service_pb2.SetTargetPointReq()
         req.point_position.x, req.point_position.y, req.point_position.z = position
         response = stub.SetTargetPoint(req)
         return response
 
     def SetMaterial(self, material_info):
-        stub = sim_observation_service_pb2_grpc.SimObservationServiceStub(self.channel)
+        stub = self.observation_stub
         req = sim_observation_service_pb2.SetMaterailReq()
         for mat in material_info:
             logger.debug(mat)
@@ -708,7 +932,7 @@ class Rpc_Client:
         return response
 
     def SetLight(self, light_info):
-        stub = sim_observation_service_pb2_grpc.SimObservationServiceStub(self.channel)
+        stub = self.observation_stub
         req = sim_observation_service_pb2.SetLightReq()
         for light in light_info:
             logger.debug(light)
@@ -729,7 +953,7 @@ class Rpc_Client:
         return response
 
     def OmniCmdChangeProperty(self, prop_path, value):
-        stub = sim_observation_service_pb2_grpc.SimObservationServiceStub(self.channel)
+        stub = self.observation_stub
         req = sim_observation_service_pb2.OmniCmdChangePropertyReq()
         req.prop_path = prop_path
         if isinstance(value, bool):
@@ -740,7 +964,7 @@ class Rpc_Client:
         return response
 
     def GetPartiPointNumInbbox(self, prim_path, bbox=None):
-        stub = sim_observation_service_pb2_grpc.SimObservationServiceStub(self.channel)
+        stub = self.observation_stub
         req = sim_observation_service_pb2.GetPartiPointNumInbboxReq()
         req.prim_path = prim_path
         for v in bbox:
@@ -750,15 +974,27 @@ class Rpc_Client:
         return response
 
     def GetObjectAABB(self, prim_path):
-        stub = sim_observation_service_pb2_grpc.SimObservationServiceStub(self.channel)
+        stub = self.observation_stub
         req = sim_observation_service_pb2.GetObjectAABBReq()
         req.prim_path = prim_path
 
         response = stub.GetObjectAABB(req)
         return response
 
+    def GetObjectAABBs(self, prim_paths):
+        stub = self.observation_stub
+        req = sim_observation_service_pb2.GetObjectAABBsReq()
+        req.prim_paths.extend(prim_paths)
+
+        response = stub.GetObjectAABBs(req)
+        return self._parse_aabbs(response)
+
+    def _parse_aabbs(self, response):
+        # (N, 2, 3): lower and upper corner of each prim
+        return np.array(response.bbox).reshape(-1, 2, 3)
+
     def GetWorldPose(self, prim_path):
-        stub = sim_observation_service_pb2_grpc.SimObservationServiceStub(self.channel)
+        stub = self.observation_stub
         req = sim_observation_service_pb2.GetWorldPoseReq()
         req.prim_path = prim_path
 
@@ -10,6 +10,7 @@ from pathlib import Path
 current_directory = os.path.dirname(os.path.abspath(__file__))
 if current_directory not in sys.path:
     sys.path.append(current_directory)
+import json
 import socket
 import threading
 from concurrent.futures import ThreadPoolExecutor
@@ -41,10 +42,22 @@ from aimdk.protocol.sim import sim_object_service_pb2_grpc
 from aimdk.protocol.sim import sim_observation_service_pb2
 from aimdk.protocol.sim import sim_observation_service_pb2_grpc
 
+from shm_transport import ShmRingBuffer, pack_image
+from base_utils.logger import Logger
+
+logger = Logger()  # Create singleton instance
+
+# environment overrides, e.g. SIM_GRPC_PORT=50052 for a second sim server on the host
+DEFAULT_HOST = os.getenv("SIM_GRPC_HOST", "0.0.0.0")
+DEFAULT_PORT = int(os.getenv("SIM_GRPC_PORT", "50051"))
+DEFAULT_MAX_WORKERS = int(os.getenv("SIM_GRPC_MAX_WORKERS", "10"))
+DEFAULT_MAX_MESSAGE_MB = int(os.getenv("SIM_GRPC_MAX_MESSAGE_MB", "50"))
+
 
 class CameraService(rs2_camera_pb2_grpc.CameraService):
-    def __init__(self, server_function):
+    def __init__(self, server_function, shm_buffer=None):
         self.server_function = server_function
+        self.shm_buffer = shm_buffer
 
     def SetCameraInfo(self, camera_info, width, height, ppx, ppy, fx, fy):
         camera_info.width = width
@@ -77,14 +90,17 @@ class CameraService(rs2_camera_pb2_grpc.CameraService):
             camera_info["fx"],
             camera_info["fy"],
         )
+        shm_buffer = self.shm_buffer if req.use_shm else None
+        if shm_buffer is not None:
+            rsp.shm_name = shm_buffer.name
         rgb_camera = current_camera["rgb"]
         rsp.color_image.format = "rgb"
         if rgb_camera is not None:
-            rsp.color_image.data = rgb_camera.tobytes()
+            pack_image(rsp.color_image, rgb_camera, shm_buffer)
         depth_camera = current_camera["depth"]
         rsp.depth_image.format = "depth"
         if depth_camera is not None:
-            rsp.depth_image.data = depth_camera.tobytes()
+            pack_image(rsp.depth_image, depth_camera, shm_buffer)
         return rsp
 
 
@@ -385,6 +401,18 @@ class ObjectService(sim_object_service_pb2_grpc.SimObjectService):
         )
         return rsp
 
+    def GetWorldPoses(self, req, rsp):
+        rsp = sim_object_service_pb2.GetWorldPosesRsp()
+        prim_paths = list(req.prim_paths)
+        poses = self.server_function.blocking_start_server(
+            data={"prim_paths": prim_paths}, Command=36
+        )
+        for prim_path, pose in zip(prim_paths, poses):
+            world_pose = rsp.poses.add()
+            world_pose.prim_path = prim_path
+            world_pose.pose.extend(np.asarray(pose, dtype=np.float64).flatten())
+        return rsp
+
 
 class GripperService(sim_gripper_service_pb2_grpc.SimGripperService):
     def __init__(self, server_function):
@@ -431,8 +459,9 @@ class GripperService(sim_gripper_service_pb2_grpc.SimGripperService):
 
 
 class ObservationService(sim_observation_service_pb2_grpc.SimObservationService):
-    def __init__(self, server_function):
+    def __init__(self, server_function, shm_buffer=None):
         self.server_function = server_function
+        self.shm_buffer = shm_buffer
 
     def SetCameraInfo(self, camera_info, width, height, ppx, ppy, fx, fy):
         camera_info.width = width
@@ -477,6 +506,16 @@ class ObservationService(sim_observation_service_pb2_grpc.SimObservationService)
             rsp.recordingState = result
             return rsp
 
+        shm_buffer = self.shm_buffer if req.use_shm else None
+        return self._pack_observation(
+            rsp, result, isCam, isJoint, isPose, isGripper, shm_buffer
+        )
+
+    def _pack_observation(
+        self, rsp, result, isCam, isJoint, isPose, isGripper, shm_buffer=None
+    ):
+        if shm_buffer is not None:
+            rsp.shm_name = shm_buffer.name
         if isPose:
             for _pose in result["object"]:
                 object_rsp = sim_observation_service_pb2.ObjectRsp()
@@ -509,11 +548,11 @@ class ObservationService(sim_observation_service_pb2_grpc.SimObservationService)
                 rgb_camera = _cam["rgb"]
                 camera_data.rgb_camera.format = "rgb"
                 if rgb_camera is not None:
-                    camera_data.rgb_camera.data = rgb_camera.tobytes()
+                    pack_image(camera_data.rgb_camera, rgb_camera, shm_buffer)
                 depth_camera = _cam["depth"]
                 camera_data.depth_camera.format = "depth"
                 if depth_camera is not None:
-                    camera_data.depth_camera.data = depth_camera.tobytes()
+                    pack_image(camera_data.depth_camera, depth_camera, shm_buffer)
 
                 if _cam["semantic"] is not None:
                     semantic_image = _cam["semantic"][0]
@@ -562,11 +601,44 @@ class ObservationService(sim_observation_service_pb2_grpc.SimObservationService)
             ) = left_rotation
         return rsp
 
+    def StreamObservations(self, req, context):
+        obs_req = req.observation_req
+        camera_prim_list = list(obs_req.CameraReq.camera_prim_list)
+        subscription = self.server_function.subscribe_observations(
+            data={
+                "isCam": obs_req.isCam,
+                "isJoint": obs_req.isJoint,
+                "isPose": obs_req.isPose,
+                "isGripper": obs_req.isGripper,
+                "camera_prim_list": camera_prim_list,
+                "render_depth": obs_req.CameraReq.render_depth,
+                "render_semantic": obs_req.CameraReq.render_semantic,
+                "object_prim": list(obs_req.objectPrims),
+            },
+            step_interval=max(1, req.step_interval),
+        )
+        try:
+            while context.is_active():
+                result = subscription.get(timeout=1.0)
+                if result is None:
+                    continue
+                rsp = sim_observation_service_pb2.GetObservationRsp()
+                yield self._pack_observation(
+                    rsp,
+                    result,
+                    obs_req.isCam,
+                    obs_req.isJoint,
+                    obs_req.isPose,
+                    obs_req.isGripper,
+                    self.shm_buffer if obs_req.use_shm else None,
+                )
+        finally:
+            self.server_function.unsubscribe_observations(subscription)
+
     def Reset(self, req, rsp):
         rsp = sim_observation_service_pb2.ResetRsp()
-        Reset = req.reset
         rsp.msg = self.server_function.blocking_start_server(
-            data={"reset", Reset}, Command=12
+            data={"reset": req.reset, "soft": req.soft}, Command=12
         )
         return rsp
 
@@ -895,6 +967,16 @@ class ObservationService(sim_observation_service_pb2_grpc.SimObservationService)
             rsp.bbox.append(val)
         return rsp
 
+    def GetObjectAABBs(self, req, rsp):
+        rsp = sim_observation_service_pb2.GetObjectAABBsRsp()
+        cmd = {}
+        cmd["prim_paths"] = list(req.prim_paths)
+
+        ret = self.server_function.blocking_start_server(data=cmd, Command=37)
+        for aabb in ret["points"]:
+            rsp.bbox.extend(aabb)
+        return rsp
+
     def GetWorldPose(self, req, rsp):
         rsp = sim_observation_service_pb2.GetWorldPoseRsp()
         cmd = {}
@@ -907,25 +989,71 @@ class ObservationService(sim_observation_service_pb2_grpc.SimObservationService)
             rsp.quat.append(val)
         return rsp
 
+    def GetServerStats(self, req, rsp):
+        rsp = sim_observation_service_pb2.GetServerStatsRsp()
+        # read directly, going through the command queue would skew the numbers
+        stats = self.server_function.get_server_stats(reset=req.reset)
+        rsp.stats = json.dumps(stats)
+        return rsp
+
+    def WaitUntilSettled(self, req, rsp):
+        rsp = sim_observation_service_pb2.WaitUntilSettledRsp()
+        result = self.server_function.blocking_start_server(
+            data={
+                "min_steps": max(req.min_steps, 1),
+                "max_steps": max(req.max_steps, req.min_steps, 1),
+                "linear_velocity": req.linear_velocity,
+                "angular_velocity": req.angular_velocity,
+                "joint_velocity": req.joint_velocity,
+                "prim_paths": list(req.prim_paths),
+                "joint_names": list(req.joint_names),
+            },
+            Command=38,
+        )
+        rsp.settled = result["settled"]
+        rsp.steps = result["steps"]
+        return rsp
+
 
 class GrpcServer:
-    def __init__(self, server_function):
+    def __init__(
+        self,
+        server_function,
+        enable_shm=False,
+        host=None,
+        port=None,
+        max_workers=None,
+        max_message_mb=None,
+    ):
         self.server_function = server_function
+        self.host = host or DEFAULT_HOST
+        # port 0 lets grpc pick a free port, self.port is updated once bound
+        self.port = DEFAULT_PORT if port is None else port
+        self.max_workers = max_workers or DEFAULT_MAX_WORKERS
+        self.max_message_mb = max_message_mb or DEFAULT_MAX_MESSAGE_MB
+        self._server = None
+        # same-host clients can read camera frames from shared memory
+        self.shm_buffer = ShmRingBuffer(create=True) if enable_shm else None
 
     def start(self):
         server_thread = threading.Thread(target=self.server)
         server_thread.start()
 
     def server(self):
+        self.stop()
+        max_message_length = self.max_message_mb * 1024 * 1024
         self._server = grpc.server(
-            ThreadPoolExecutor(max_workers=10),
+            ThreadPoolExecutor(max_workers=self.max_workers),
             options=[
-                ("grpc.max_send_message_length", 50 * 1024 * 1024),
-                ("grpc.max_receive_message_length", 50 * 1024 * 1024),
+                ("grpc.max_send_message_length", max_message_length),
+                ("grpc.max_receive_message_length", max_message_length),
+                # accept client keepalive pings between episodes
+                ("grpc.keepalive_permit_without_calls", 1),
+                ("grpc.http2.min_ping_interval_without_data_ms", 5000),
             ],
         )
         rs2_camera_pb2_grpc.add_CameraServiceServicer_to_server(
-            CameraService(self.server_function), self._server
+            CameraService(self.server_function, self.shm_buffer), self._server
         )
         sim_camera_service_pb2_grpc.add_SimCameraServiceServicer_to_server(
             SimCameraService(self.server_function), self._server
@@ -943,12 +1071,21 @@ class GrpcServer:
             GripperService(self.server_function), self._server
         )
         sim_observation_service_pb2_grpc.add_SimObservationServiceServicer_to_server(
-            ObservationService(self.server_function), self._server
+            ObservationService(self.server_function, self.shm_buffer), self._server
         )
-        self.stop()
-        self._server.add_insecure_port("0.0.0.0:50051")
+        self.port = self._server.add_insecure_port(f"{self.host}:{self.port}")
         self._server.start()
+        logger.info(f"grpc server listening on {self.endpoint}")
+
+    @property
+    def endpoint(self):
+        return f"{self.host}:{self.port}"
 
     def stop(self):
         if self._server:
             self._server.stop(0)
+
+    def close_shm(self):
+        if self.shm_buffer:
+            self.shm_buffer.close()
+            self.shm_buffer = None
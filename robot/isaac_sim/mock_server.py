@@ -0,0 +1,472 @@
+# Copyright (c) 2023-2025, AgiBot Inc. All Rights Reserved.
+# Author: Genie Sim Team
+# License: Mozilla Public License Version 2.0
+
+# Pure python stand-in for the Isaac Sim server: the real grpc servicers backed by a
+# kinematic world, so the client side can be profiled and load-tested on a CPU box.
+#   python robot/isaac_sim/mock_server.py --port 50051 --latency 0.002 --command_latency 2=0.5
+
+import argparse
+import os
+import random
+import sys
+import threading
+import time
+import xml.etree.ElementTree as ET
+import numpy as np
+
+current_directory = os.path.dirname(os.path.abspath(__file__))
+project_root = os.path.dirname(os.path.dirname(current_directory))
+for path in (current_directory, project_root):
+    if path not in sys.path:
+        sys.path.append(path)
+
+from grpc_server import GrpcServer
+from robot.utils import quat_to_rot_matrix, get_quaternion_from_rotation_matrix
+from base_utils.logger import Logger
+
+logger = Logger()  # Create singleton instance
+
+URDF_DIRECTORY = os.path.join(current_directory, "robot_urdf")
+# half extent of the box reported as AABB for objects without a known size
+DEFAULT_HALF_EXTENT = 0.05
+# targets further than this from the robot base are reported as IK failures
+REACH_RADIUS = 1.2
+
+
+def pose_to_matrix(position, rotation):
+    mat = np.eye(4)
+    mat[:3, :3] = quat_to_rot_matrix(rotation)
+    mat[:3, 3] = position
+    return mat
+
+
+def matrix_to_pose(mat):
+    return np.array(mat[:3, 3]), get_quaternion_from_rotation_matrix(mat[:3, :3])
+
+
+def load_joint_names(robot_urdf):
+    urdf_path = os.path.join(URDF_DIRECTORY, robot_urdf)
+    if not os.path.isfile(urdf_path):
+        logger.warning(f"{urdf_path} not found, robot has no joints")
+        return []
+    return [joint.get("name") for joint in ET.parse(urdf_path).getroot().iter("joint") if joint.get("type") != "fixed"]
+
+
+class MockSubscription:
+    def __init__(self, server_function, data, step_interval):
+        self.server_function = server_function
+        self.data = data
+        self.period = step_interval * server_function.physics_dt
+
+    def get(self, timeout=None):
+        time.sleep(self.period)
+        return self.server_function.call(11, self.data)
+
+
+class MockServerFunction:
+    """
+    Same interface as CommandController (blocking_start_server, subscribe_observations,
+    get_server_stats, exit), answered from a kinematic world state:
+    motions teleport, attached objects follow the end effector, images are synthetic.
+    Each command waits a configurable delay and then runs its handler. Handlers run one
+    at a time under a lock, the delays of concurrent commands overlap, like read-only
+    commands the sim loop drains in the same step.
+    """
+
+    def __init__(
+        self,
+        latency=0.0,
+        jitter=0.0,
+        command_latency=None,
+        physics_dt=1.0 / 120,
+        image_width=640,
+        image_height=480,
+        seed=0,
+    ):
+        self.latency = latency
+        self.jitter = jitter
+        self.command_latency = command_latency or {}
+        self.physics_dt = physics_dt
+        self.image_size = (image_width, image_height)
+        self.random = random.Random(seed)
+        self.exit = False
+        self._lock = threading.Lock()
+        self.command_counts = {}
+        self.command_time = {}
+        self.handlers = {
+            1: self._capture_camera,
+            2: self._linear_move,
+            3: self._set_joint_positions,
+            4: self._get_gripper_state,
+            5: self._get_object_pose,
+            6: self._add_object,
+            8: self._get_joint_positions,
+            9: self._set_gripper_state,
+            11: self._observation,
+            12: self._reset,
+            13: self._attach_objs,
+            14: self._detach_objs,
+            15: self._multi_move,
+            16: lambda data: str(data["isSuccess"]),
+            17: self._exit,
+            18: self._get_ee_pose,
+            19: self._get_ik_status,
+            20: lambda data: [],
+            21: self._init_robot,
+            22: self._add_camera,
+            24: self._set_object_pose,
+            25: self._set_trajectory_list,
+            26: self._get_object_joint,
+            28: self._set_frame_state,
+            32: self._change_property,
+            33: lambda data: {"num": 0},
+            34: lambda data: {"points": self._get_aabb(data["prim_path"])},
+            35: self._get_world_pose,
+            36: lambda data: [self._get_pose(path) for path in data["prim_paths"]],
+            37: lambda data: {"points": [self._get_aabb(path) for path in data["prim_paths"]]},
+            # kinematic world, nothing is ever in motion
+            38: lambda data: {"settled": True, "steps": data["min_steps"]},
+        }
+        self._init_world()
+
+    def _init_world(self):
+        self.robot_pose = np.eye(4)
+        self.joint_names = []
+        self.init_joint_positions = {}
+        self.joint_positions = {}
+        self.objects = {}
+        self.object_extents = {}
+        self.object_joints = {}
+        self._init_arms()
+        self.cameras = {}
+        self.images = {}
+        self.frame_status = []
+
+    def _init_arms(self):
+        self.ee_poses = {
+            False: pose_to_matrix([0.5, 0.3, 1.0], [1, 0, 0, 0]),
+            True: pose_to_matrix([0.5, -0.3, 1.0], [1, 0, 0, 0]),
+        }
+        self.gripper_states = {False: "open", True: "open"}
+        self.attached = {False: {}, True: {}}
+
+    # interface used by grpc_server
+    def blocking_start_server(self, data, Command):
+        # outside of the lock, concurrent callers wait in parallel
+        delay = self.command_latency.get(Command, self.latency)
+        if self.jitter:
+            delay += self.random.uniform(0, self.jitter)
+        if delay > 0:
+            time.sleep(delay)
+        return self.call(Command, data)
+
+    def call(self, Command, data):
+        handler = self.handlers.get(Command, lambda data: "success")
+        with self._lock:
+            start = time.perf_counter()
+            result = handler(data)
+            elapsed = time.perf_counter() - start
+            self.command_counts[Command] = self.command_counts.get(Command, 0) + 1
+            self.command_time[Command] = self.command_time.get(Command, 0.0) + elapsed
+        return result
+
+    def subscribe_observations(self, data, step_interval):
+        return MockSubscription(self, data, step_interval)
+
+    def unsubscribe_observations(self, subscription):
+        pass
+
+    def get_server_stats(self, reset=False):
+        with self._lock:
+            stats = {
+                "commands": {
+                    str(command_id): {
+                        "count": count,
+                        "handler_total_ms": self.command_time[command_id] * 1e3,
+                    }
+                    for command_id, count in sorted(self.command_counts.items())
+                }
+            }
+            if reset:
+                self.command_counts = {}
+                self.command_time = {}
+        return stats
+
+    # world state
+    def _get_pose(self, prim_path):
+        if prim_path == "robot":
+            return self.robot_pose
+        if prim_path not in self.objects:
+            self.objects[prim_path] = np.eye(4)
+        return self.objects[prim_path]
+
+    def _get_aabb(self, prim_path):
+        center = self._get_pose(prim_path)[:3, 3]
+        half_extent = self.object_extents.get(prim_path, DEFAULT_HALF_EXTENT)
+        return np.concatenate([center - half_extent, center + half_extent])
+
+    def _move_ee(self, is_right, pose):
+        self.ee_poses[is_right] = pose
+        for prim_path, ee_to_obj in self.attached[is_right].items():
+            self.objects[prim_path] = pose @ ee_to_obj
+
+    def _arm_joints(self, is_right):
+        arm = "arm_r" if is_right else "arm_l"
+        return {name: value for name, value in self.joint_positions.items() if arm in name}
+
+    def _capture_camera(self, data):
+        prim_path = data["Cam_prim_path"]
+        width, height = self.cameras.get(prim_path, self.image_size)
+        if prim_path not in self.images:
+            # gradient frames built once per camera, the mock should not be the bottleneck
+            rgb = np.zeros((height, width, 4), dtype=np.uint8)
+            rgb[..., 0] = np.linspace(0, 255, width, dtype=np.uint8)[None, :]
+            rgb[..., 1] = np.linspace(0, 255, height, dtype=np.uint8)[:, None]
+            rgb[..., 2] = sum(prim_path.encode()) % 256
+            rgb[..., 3] = 255
+            depth = np.repeat(np.linspace(0.5, 3.0, height, dtype=np.float32)[:, None], width, axis=1)
+            semantic = np.zeros((height, width), dtype=np.uint32)
+            self.images[prim_path] = rgb, depth, semantic
+        rgb, depth, semantic = self.images[prim_path]
+        focal = width / 2
+        return {
+            "camera_info": {
+                "width": width,
+                "height": height,
+                "ppx": width / 2,
+                "ppy": height / 2,
+                "fx": focal,
+                "fy": focal,
+            },
+            "rgb": rgb if data["isRGB"] else None,
+            "depth": depth if data["isDepth"] else None,
+            "semantic": (semantic, {"background": 0}) if data["isSemantic"] else None,
+        }
+
+    def _linear_move(self, data):
+        pose = pose_to_matrix(data["target_position"], data["target_rotation"])
+        self._move_ee(data["isArmRight"], pose)
+        return True
+
+    def _set_joint_positions(self, data):
+        for idx, value in zip(data["target_joints_indices"], data["target_joints_position"]):
+            if idx < len(self.joint_names):
+                self.joint_positions[self.joint_names[idx]] = float(value)
+        return "move joints"
+
+    def _get_gripper_state(self, data):
+        return matrix_to_pose(self.ee_poses[data["isGripperRight"]])
+
+    def _get_object_pose(self, data):
+        return matrix_to_pose(self._get_pose(data["object_prim_path"]))
+
+    def _add_object(self, data):
+        prim_path = data["usd_object_prim_path"]
+        self.objects[prim_path] = pose_to_matrix(data["usd_object_position"], data["usd_object_rotation"])
+        scale = np.asarray(data["usd_object_scale"], dtype=float)
+        if np.any(scale > 0):
+            self.object_extents[prim_path] = DEFAULT_HALF_EXTENT * scale
+        return "object added"
+
+    def _get_joint_positions(self, data):
+        return dict(self.joint_positions)
+
+    def _set_gripper_state(self, data):
+        self.gripper_states[data["is_gripper_right"]] = data["gripper_state"]
+        return "gripper moving"
+
+    def _observation(self, data):
+        if data.get("startRecording"):
+            return "Start"
+        if data.get("stopRecording"):
+            return "Stopped"
+        result = {"camera": [], "joint": {}, "object": [], "gripper": {}}
+        if data["isCam"]:
+            result["camera"] = [
+                self._capture_camera(
+                    {
+                        "Cam_prim_path": prim_path,
+                        "isRGB": True,
+                        "isDepth": data["render_depth"],
+                        "isSemantic": data["render_semantic"],
+                    }
+                )
+                for prim_path in data["camera_prim_list"]
+            ]
+        if data["isJoint"]:
+            result["joint"] = dict(self.joint_positions)
+        if data["isPose"]:
+            result["object"] = [matrix_to_pose(self._get_pose(prim_path)) for prim_path in data["object_prim"]]
+        if data["isGripper"]:
+            result["gripper"] = {
+                "left": matrix_to_pose(self.ee_poses[False]),
+                "right": matrix_to_pose(self.ee_poses[True]),
+            }
+        return result
+
+    def _reset(self, data):
+        self.joint_positions = dict(self.init_joint_positions)
+        self.attached = {False: {}, True: {}}
+        if data.get("soft"):
+            # layout objects go, robot and scene stay
+            for prim_path in list(self.objects):
+                if prim_path.startswith("/World/Objects/"):
+                    del self.objects[prim_path]
+                    self.object_extents.pop(prim_path, None)
+                    self.object_joints.pop(prim_path, None)
+            self._init_arms()
+        return "reset"
+
+    def _attach_objs(self, data):
+        is_right = data["is_right"]
+        ee_inv = np.linalg.inv(self.ee_poses[is_right])
+        for prim_path in data["obj_prim_paths"]:
+            self.attached[is_right][prim_path] = ee_inv @ self._get_pose(prim_path)
+        return "attaching"
+
+    def _detach_objs(self, data):
+        self.attached = {False: {}, True: {}}
+        return "detaching"
+
+    def _multi_move(self, data):
+        is_right = data["isArmRight"]
+        if not data["isPlan"]:
+            return True
+        arm_joints = self._arm_joints(is_right)
+        plans = [
+            {
+                "names": list(arm_joints),
+                "positions": [list(arm_joints.values())],
+            }
+            for _ in data["poses"]
+        ]
+        if data["poses"]:
+            position, rotation = data["poses"][-1]
+            self._move_ee(is_right, pose_to_matrix(position, rotation))
+        return {"cmd_plans": plans, "msg": True}
+
+    def _exit(self, data):
+        self.exit = data["exit"]
+        return "exit"
+
+    def _get_ee_pose(self, data):
+        return matrix_to_pose(self.ee_poses[data["isRight"]])
+
+    def _get_ik_status(self, data):
+        base = self.robot_pose[:3, 3]
+        arm_joints = self._arm_joints(data["isRight"])
+        return [
+            (
+                bool(np.linalg.norm(pose["position"] - base) < REACH_RADIUS),
+                arm_joints,
+            )
+            for pose in data["target_poses"]
+        ]
+
+    def _init_robot(self, data):
+        self._init_world()
+        self.robot_pose = pose_to_matrix(data["robot_position"], data["robot_rotation"])
+        robot_urdf = os.path.splitext(data["robot_cfg_file"])[0] + ".urdf"
+        self.joint_names = load_joint_names(robot_urdf)
+        self.init_joint_positions = {name: 0.0 for name in self.joint_names}
+        self.joint_positions = dict(self.init_joint_positions)
+        return "success"
+
+    def _add_camera(self, data):
+        self.cameras[data["camera_prim"]] = (data["width"], data["height"])
+        self.images.pop(data["camera_prim"], None)
+        return "success"
+
+    def _set_object_pose(self, data):
+        for object_pose in data["object_poses"]:
+            self.objects[object_pose["prim_path"]] = pose_to_matrix(object_pose["position"], object_pose["rotation"])
+        for object_joint in data["object_joints"]:
+            self.object_joints[object_joint["prim_path"]] = list(object_joint["object_joint"])
+        for name, value in zip(self.joint_names, data["joint_position"]):
+            self.joint_positions[name] = float(value)
+        return "success"
+
+    def _set_trajectory_list(self, data):
+        if data["trajectory_list"]:
+            position, rotation = data["trajectory_list"][-1]
+            self._move_ee(True, pose_to_matrix(position, rotation))
+        return "success"
+
+    def _get_object_joint(self, data):
+        positions = self.object_joints.get(data["object_prim_path"], [])
+        return {
+            "joint_names": [f"joint_{idx}" for idx in range(len(positions))],
+            "joint_positions": positions,
+            "joint_velocities": [0.0] * len(positions),
+        }
+
+    def _set_frame_state(self, data):
+        self.frame_status.append(data["frame_state"])
+        return "success"
+
+    def _change_property(self, data):
+        if data["value"] == "trigger_action":
+            return "False"
+        return "success"
+
+    def _get_world_pose(self, data):
+        position, rotation = matrix_to_pose(self._get_pose(data["prim_path"]))
+        return {"pos": position, "quat": rotation}
+
+
+def parse_command_latency(values):
+    command_latency = {}
+    for value in values:
+        command, seconds = value.split("=")
+        command_latency[int(command)] = float(seconds)
+    return command_latency
+
+
+def main():
+    parser = argparse.ArgumentParser(description="mock sim server, no Isaac Sim")
+    parser.add_argument("--host", type=str, default=None)
+    parser.add_argument("--port", type=int, default=None)
+    parser.add_argument("--max_workers", type=int, default=None)
+    parser.add_argument("--latency", type=float, default=0.0, help="seconds added to every command")
+    parser.add_argument("--jitter", type=float, default=0.0, help="uniform random extra seconds")
+    parser.add_argument(
+        "--command_latency",
+        nargs="*",
+        default=[],
+        help="per command override as id=seconds, e.g. 2=0.5 for LinearMove",
+    )
+    parser.add_argument("--physics_dt", type=float, default=1.0 / 120)
+    parser.add_argument("--image_width", type=int, default=640)
+    parser.add_argument("--image_height", type=int, default=480)
+    parser.add_argument("--enable_shm", action="store_true", default=False)
+    args = parser.parse_args()
+
+    server_function = MockServerFunction(
+        latency=args.latency,
+        jitter=args.jitter,
+        command_latency=parse_command_latency(args.command_latency),
+        physics_dt=args.physics_dt,
+        image_width=args.image_width,
+        image_height=args.image_height,
+    )
+    rpc_server = GrpcServer(
+        server_function,
+        enable_shm=args.enable_shm,
+        host=args.host,
+        port=args.port,
+        max_workers=args.max_workers,
+    )
+    rpc_server.server()
+    try:
+        while not server_function.exit:
+            time.sleep(0.1)
+    except KeyboardInterrupt:
+        pass
+    finally:
+        rpc_server.stop()
+        rpc_server.close_shm()
+
+
+if __name__ == "__main__":
+    main()
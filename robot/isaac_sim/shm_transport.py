@@ -0,0 +1,151 @@
+# Copyright (c) 2023-2025, AgiBot Inc. All Rights Reserved.
+# Author: Genie Sim Team
+# License: Mozilla Public License Version 2.0
+
+import threading
+import numpy as np
+from multiprocessing import shared_memory, resource_tracker
+
+# one slot holds a 1280x720 RGBA uint8 or float32 depth frame
+DEFAULT_SLOT_SIZE = 1280 * 720 * 4 * 4
+DEFAULT_NUM_SLOTS = 16
+# slot_size and num_slots are stored up front so clients can attach by name only
+HEADER_SIZE = 64
+# every slot has the sequence number of its write before and after the payload
+SEQ_SIZE = 8
+
+
+class ShmSlotOverwritten(RuntimeError):
+    pass
+
+
+class ShmRingBuffer:
+    """
+    Fixed-size image slots in a named shared memory block.
+    The server creates the block and writes frames, same-host clients attach by name
+    and read a frame back from (slot, shape, dtype, seq). A slot that was written again
+    before or while it is read raises ShmSlotOverwritten.
+    """
+
+    def __init__(
+        self,
+        name=None,
+        slot_size=DEFAULT_SLOT_SIZE,
+        num_slots=DEFAULT_NUM_SLOTS,
+        create=False,
+    ):
+        self.owner = create
+        if create:
+            self.shm = shared_memory.SharedMemory(
+                name=name,
+                create=True,
+                size=HEADER_SIZE + (slot_size + 2 * SEQ_SIZE) * num_slots,
+            )
+            self._header()[:] = (slot_size, num_slots)
+        else:
+            self.shm = self._attach(name)
+            slot_size, num_slots = (int(v) for v in self._header())
+        self.slot_size = slot_size
+        self.num_slots = num_slots
+        self.name = self.shm.name
+        self._next_slot = 0
+        self._seq = 0
+        self._lock = threading.Lock()
+
+    def _header(self):
+        return np.ndarray((2,), dtype=np.uint64, buffer=self.shm.buf)
+
+    def _slot_offset(self, slot):
+        return HEADER_SIZE + slot * (self.slot_size + 2 * SEQ_SIZE)
+
+    def _slot_seqs(self, slot):
+        """(seq written before the payload, seq written after it) of a slot"""
+        offset = self._slot_offset(slot)
+        return (
+            np.ndarray((1,), dtype=np.uint64, buffer=self.shm.buf, offset=offset),
+            np.ndarray(
+                (1,),
+                dtype=np.uint64,
+                buffer=self.shm.buf,
+                offset=offset + SEQ_SIZE + self.slot_size,
+            ),
+        )
+
+    @staticmethod
+    def _attach(name):
+        try:
+            return shared_memory.SharedMemory(name=name, track=False)
+        except TypeError:
+            # python < 3.13, keep the resource tracker from unlinking the server's block
+            shm = shared_memory.SharedMemory(name=name)
+            resource_tracker.unregister(shm._name, "shared_memory")
+            return shm
+
+    def fits(self, array):
+        return array.nbytes <= self.slot_size
+
+    def write(self, array):
+        array = np.ascontiguousarray(array)
+        if not self.fits(array):
+            raise ValueError(f"frame of {array.nbytes} bytes exceeds slot size {self.slot_size}")
+        with self._lock:
+            slot = self._next_slot
+            self._next_slot = (self._next_slot + 1) % self.num_slots
+            self._seq += 1
+            seq = self._seq
+        seq_before, seq_after = self._slot_seqs(slot)
+        view = np.ndarray(
+            array.shape,
+            dtype=array.dtype,
+            buffer=self.shm.buf,
+            offset=self._slot_offset(slot) + SEQ_SIZE,
+        )
+        seq_before[0] = seq
+        view[...] = array
+        seq_after[0] = seq
+        return slot, array.shape, array.dtype.str, seq
+
+    def read(self, slot, shape, dtype, seq):
+        """copy of the frame, checked against the sequence numbers around the payload"""
+        seq_before, seq_after = self._slot_seqs(slot)
+        # the write of seq has finished ...
+        if seq_after[0] != seq:
+            raise ShmSlotOverwritten(f"shm slot {slot} no longer holds frame {seq}")
+        frame = np.ndarray(
+            tuple(shape),
+            dtype=np.dtype(dtype),
+            buffer=self.shm.buf,
+            offset=self._slot_offset(slot) + SEQ_SIZE,
+        ).copy()
+        # ... and no later write started while copying
+        if seq_before[0] != seq:
+            raise ShmSlotOverwritten(f"shm slot {slot} overwritten while reading {seq}")
+        return frame
+
+    def close(self):
+        self.shm.close()
+        if self.owner:
+            self.shm.unlink()
+
+
+def pack_image(image_msg, array, shm_buffer=None):
+    """fill a CamImage/CompressedImage message, through the ring buffer when possible"""
+    if shm_buffer is not None and shm_buffer.fits(array):
+        slot, shape, dtype, seq = shm_buffer.write(array)
+        image_msg.in_shm = True
+        image_msg.shm_slot = slot
+        image_msg.shm_seq = seq
+        image_msg.shape.extend(shape)
+        image_msg.dtype = dtype
+    else:
+        image_msg.data = array.tobytes()
+
+
+def unpack_image(image_msg, dtype, shm_buffer=None):
+    """
+    flat array of the image pixels, same layout as np.frombuffer(image_msg.data),
+    raises ShmSlotOverwritten when the frame is no longer in the ring
+    """
+    if image_msg.in_shm:
+        return shm_buffer.read(image_msg.shm_slot, image_msg.shape, image_msg.dtype, image_msg.shm_seq).reshape(-1)
+    return np.frombuffer(image_msg.data, dtype=dtype)
@@ -0,0 +1,136 @@
+# Copyright (c) 2023-2025, AgiBot Inc. All Rights Reserved.
+# Author: Genie Sim Team
+# License: Mozilla Public License Version 2.0
+
+"""
+Client side batched IK: the IK-SDK arm solver spread over a process pool, so grasp
+candidate filtering does not push thousands of poses through GetIKStatus.
+
+The IK-SDK model solves the arm flange (arm_*_link7) in arm_base_link, the sim
+solves the gripper center in the robot base frame. The flange to gripper center
+offset is calibrated from the current joint state, and a solution only counts as
+a success once forward kinematics of the sim urdf reaches the target.
+"""
+
+import atexit
+import multiprocessing as mp
+
+import numpy as np
+from scipy.spatial.transform import Rotation
+
+from robot.utils import ik_manipulability
+
+# a local solution is a success within these of the target gripper pose
+IK_POSITION_TOLERANCE = 0.005  # m
+IK_ANGLE_TOLERANCE = 2.0  # deg
+
+SIM_EE_FRAMES = {"left": "gripper_l_center_link", "right": "gripper_r_center_link"}
+SIM_ARM_BASE_FRAME = "arm_base_link"
+
+_pools = {}
+_arms = {}
+_solver_paths = None
+
+
+def _init_worker(solver_paths):
+    global _solver_paths
+    _solver_paths = solver_paths
+
+
+class ArmIK:
+    """IK-SDK solver of one arm and the sim urdf it is checked against, one per process"""
+
+    def __init__(self, arm, joint_names, sdk_urdf, sdk_config, sim_urdf):
+        import ik_solver
+        import pinocchio
+
+        part = ik_solver.RobotPart.RIGHT_ARM if arm == "right" else ik_solver.RobotPart.LEFT_ARM
+        self.solver = ik_solver.Solver(part=part, urdf_path=sdk_urdf, config_path=sdk_config)
+        self.solver.set_debug_mode(False)
+        self.sim_urdf = sim_urdf
+        self.model = pinocchio.buildModelFromUrdf(sim_urdf)
+        self.data = self.model.createData()
+        self.ee_frame = self.model.getFrameId(SIM_EE_FRAMES[arm])
+        self.arm_base_frame = self.model.getFrameId(SIM_ARM_BASE_FRAME)
+        self.arm_q_idx = [self.model.joints[self.model.getJointId(name)].idx_q for name in joint_names]
+        self.joint_names = [str(name) for name in self.model.names if name != "universe"]
+
+    def frame_poses(self, q):
+        import pinocchio
+
+        pinocchio.framesForwardKinematics(self.model, self.data, q)
+        return (
+            self.data.oMf[self.arm_base_frame].homogeneous.copy(),
+            self.data.oMf[self.ee_frame].homogeneous.copy(),
+        )
+
+    def solve(self, joint_states, target_poses):
+        """
+        joint_states: {joint name: position} of the robot, target_poses: (N, 4, 4)
+        gripper poses in the robot base frame. Returns GetIKStatus style result dicts.
+        """
+        q = np.array([joint_states.get(name, 0.0) for name in self.joint_names])
+        seed = q[self.arm_q_idx]
+        base2arm_base, base2ee = self.frame_poses(q)
+        self.solver.sync_target_with_joints(seed)
+        arm_base2flange = np.asarray(self.solver.get_current_target()[0])
+        flange2ee = np.linalg.inv(arm_base2flange) @ np.linalg.inv(base2arm_base) @ base2ee
+        ee2flange = np.linalg.inv(flange2ee)
+        base2arm_base_inv = np.linalg.inv(base2arm_base)
+
+        results = []
+        for target_pose in target_poses:
+            flange_target = base2arm_base_inv @ target_pose @ ee2flange
+            # every candidate starts from the current arm, independent of chunking
+            self.solver.sync_target_with_joints(seed)
+            self.solver.update_target_quat(
+                target_pos=flange_target[:3, 3],
+                target_quat=Rotation.from_matrix(flange_target[:3, :3]).as_quat(),
+            )
+            arm_positions = np.array(self.solver.solve().tolist())
+
+            solved_q = q.copy()
+            solved_q[self.arm_q_idx] = arm_positions
+            _, solved_ee = self.frame_poses(solved_q)
+            position_error = np.linalg.norm(solved_ee[:3, 3] - target_pose[:3, 3])
+            angle_error = np.degrees(Rotation.from_matrix(solved_ee[:3, :3].T @ target_pose[:3, :3]).magnitude())
+            # joint_positions / Jacobian like Rpc_Client._parse_ik_status:
+            # the arm joints of the solution, everything else at zero
+            joint_positions = np.zeros(self.model.nq)
+            joint_positions[self.arm_q_idx] = arm_positions
+            results.append(
+                {
+                    "status": bool(position_error < IK_POSITION_TOLERANCE and angle_error < IK_ANGLE_TOLERANCE),
+                    "Jacobian": ik_manipulability(self.model, self.data, joint_positions, self.sim_urdf),
+                    "joint_positions": joint_positions,
+                    "joint_names": self.joint_names,
+                }
+            )
+        return results
+
+
+def _solve_chunk(arm, joint_names, joint_states, target_poses):
+    key = (arm, tuple(joint_names))
+    if key not in _arms:
+        _arms[key] = ArmIK(arm, joint_names, *_solver_paths)
+    return _arms[key].solve(joint_states, target_poses)
+
+
+def get_pool(solver_paths, workers):
+    """Process wide, solvers are built once per worker and reused by later robots"""
+    key = (tuple(solver_paths), workers)
+    if key not in _pools:
+        # the ik solver and grpc do not survive fork
+        context = mp.get_context("spawn")
+        _pools[key] = context.Pool(workers, initializer=_init_worker, initargs=(tuple(solver_paths),))
+        atexit.register(_pools[key].terminate)
+    return _pools[key]
+
+
+def solve_ik_batch(pool, arm, joint_names, joint_states, target_poses, workers):
+    """Split (N, 4, 4) base frame gripper poses over the pool, results in input order"""
+    chunks = [chunk for chunk in np.array_split(target_poses, workers) if len(chunk) > 0]
+    results = []
+    for chunk_results in pool.starmap(_solve_chunk, [(arm, joint_names, joint_states, chunk) for chunk in chunks]):
+        results += chunk_results
+    return results
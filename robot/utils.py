@@ -576,3 +576,15 @@ def rotation_matrix_to_quaternion(R):
         qz = 0.25 * S
 
     return np.array([qw, qx, qy, qz])
+
+
+def ik_manipulability(model, data, joint_positions, robot_urdf):
+    """Manipulability of a pinocchio model configuration, the GetIKStatus "Jacobian" score"""
+    import pinocchio
+
+    pinocchio.forwardKinematics(model, data, joint_positions)
+    if "G1" in robot_urdf:
+        J = pinocchio.computeJointJacobian(model, data, joint_positions, 24)
+    else:
+        J = pinocchio.computeJointJacobian(model, data, joint_positions, 7)
+    return np.sqrt(np.linalg.det(np.dot(J, J.T)))
@@ -0,0 +1,97 @@
+# Copyright (c) 2023-2025, AgiBot Inc. All Rights Reserved.
+# Author: Genie Sim Team
+# License: Mozilla Public License Version 2.0
+
+# Compare protobuf bytes against the shared memory ring for camera frames,
+# synthetic frames only, no sim server needed.
+
+import argparse
+import os
+import sys
+import time
+import numpy as np
+
+isaac_sim_directory = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "robot", "isaac_sim")
+if isaac_sim_directory not in sys.path:
+    sys.path.append(isaac_sim_directory)
+
+from aimdk.protocol.sim import sim_observation_service_pb2
+from shm_transport import ShmRingBuffer, pack_image, unpack_image
+
+
+def build_response(frames, shm_buffer=None):
+    rsp = sim_observation_service_pb2.GetObservationRsp()
+    if shm_buffer is not None:
+        rsp.shm_name = shm_buffer.name
+    for rgb, depth in frames:
+        camera_data = rsp.camera.add()
+        camera_data.camera_info.width = rgb.shape[1]
+        camera_data.camera_info.height = rgb.shape[0]
+        camera_data.rgb_camera.format = "rgb"
+        pack_image(camera_data.rgb_camera, rgb, shm_buffer)
+        camera_data.depth_camera.format = "depth"
+        pack_image(camera_data.depth_camera, depth, shm_buffer)
+    return rsp
+
+
+def parse_response(payload, shm_buffer=None):
+    rsp = sim_observation_service_pb2.GetObservationRsp.FromString(payload)
+    images = []
+    for camera_data in rsp.camera:
+        height, width = camera_data.camera_info.height, camera_data.camera_info.width
+        rgb = unpack_image(camera_data.rgb_camera, np.uint8, shm_buffer)
+        depth = unpack_image(camera_data.depth_camera, np.float32, shm_buffer)
+        images.append((rgb.reshape(height, width, 4), depth.reshape(height, width)))
+    return images
+
+
+def run(frames, iterations, server_buffer=None, client_buffer=None):
+    payload_size = 0
+    start = time.perf_counter()
+    for _ in range(iterations):
+        payload = build_response(frames, server_buffer).SerializeToString()
+        payload_size = len(payload)
+        parse_response(payload, client_buffer)
+    elapsed = (time.perf_counter() - start) / iterations
+    return elapsed, payload_size
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--width", type=int, default=1280)
+    parser.add_argument("--height", type=int, default=720)
+    parser.add_argument("--cameras", type=int, default=3)
+    parser.add_argument("--iterations", type=int, default=50)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(0)
+    frames = [
+        (
+            rng.integers(0, 255, (args.height, args.width, 4), dtype=np.uint8),
+            rng.random((args.height, args.width), dtype=np.float32),
+        )
+        for _ in range(args.cameras)
+    ]
+
+    proto_time, proto_size = run(frames, args.iterations)
+
+    server_buffer = ShmRingBuffer(
+        slot_size=args.width * args.height * 4,
+        num_slots=2 * args.cameras,
+        create=True,
+    )
+    try:
+        # reading through the owner mapping, attaching from the same process
+        # would confuse the resource tracker on python < 3.13
+        shm_time, shm_size = run(frames, args.iterations, server_buffer, server_buffer)
+    finally:
+        server_buffer.close()
+
+    print(f"{args.cameras} cameras {args.width}x{args.height} rgb+depth, " f"{args.iterations} iterations")
+    print(f"protobuf bytes: {proto_time * 1e3:8.2f} ms/obs, {proto_size} bytes payload")
+    print(f"shared memory : {shm_time * 1e3:8.2f} ms/obs, {shm_size} bytes payload")
+    print(f"speedup       : {proto_time / shm_time:8.2f}x")
+
+
+if __name__ == "__main__":
+    main()
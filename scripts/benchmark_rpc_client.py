@@ -0,0 +1,75 @@
+# Copyright (c) 2023-2025, AgiBot Inc. All Rights Reserved.
+# Author: Genie Sim Team
+# License: Mozilla Public License Version 2.0
+
+# Per-call overhead of Rpc_Client against an in-process gRPC server,
+# no sim needed: the server function answers every command immediately.
+
+import argparse
+import os
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+import grpc
+import numpy as np
+
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+isaac_sim_directory = os.path.join(project_root, "robot", "isaac_sim")
+for path in (project_root, isaac_sim_directory):
+    if path not in sys.path:
+        sys.path.append(path)
+
+from aimdk.protocol.sim import sim_object_service_pb2
+from aimdk.protocol.sim import sim_object_service_pb2_grpc
+from client import Rpc_Client
+from grpc_server import ObjectService
+
+
+class EchoServerFunction:
+    def blocking_start_server(self, data, Command):
+        return np.zeros(3), np.array([1.0, 0.0, 0.0, 0.0])
+
+
+def time_calls(call, iterations):
+    for _ in range(10):
+        call()
+    start = time.perf_counter()
+    for _ in range(iterations):
+        call()
+    return (time.perf_counter() - start) / iterations
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--iterations", type=int, default=2000)
+    args = parser.parse_args()
+
+    server = grpc.server(ThreadPoolExecutor(max_workers=10))
+    sim_object_service_pb2_grpc.add_SimObjectServiceServicer_to_server(ObjectService(EchoServerFunction()), server)
+    port = server.add_insecure_port("127.0.0.1:0")
+    server.start()
+    try:
+        client = Rpc_Client(f"127.0.0.1:{port}")
+        prim_path = "/World/Objects/benchmark"
+
+        def new_stub_per_call():
+            stub = sim_object_service_pb2_grpc.SimObjectServiceStub(client.channel)
+            req = sim_object_service_pb2.GetObjectPoseReq()
+            req.prim_path = prim_path
+            return stub.GetObjectPose(req)
+
+        def cached_stub():
+            return client.get_object_pose(prim_path)
+
+        per_call = time_calls(new_stub_per_call, args.iterations)
+        cached = time_calls(cached_stub, args.iterations)
+    finally:
+        server.stop(0)
+
+    print(f"GetObjectPose, {args.iterations} calls")
+    print(f"new stub per call: {per_call * 1e6:8.1f} us/call")
+    print(f"cached stub      : {cached * 1e6:8.1f} us/call")
+
+
+if __name__ == "__main__":
+    main()
@@ -35,6 +35,11 @@ import numpy as np
 from genie.sim.lab.controllers.kinematics_solver import Kinematics_Solver
 from genie.sim.lab.controllers.ruckig_move import Ruckig_Controller
 from genie.sim.lab.utils.motion_gen_reacher import CuroboMotion
+from genie.sim.lab.utils.utils import (
+    get_rotation_matrix_from_quaternion,
+    get_quaternion_from_euler,
+    matrix_to_euler_angles,
+)
 from typing import Optional
 from pxr import Usd
 
@@ -43,6 +48,37 @@ import omni.replicator.core as rep
 from pprint import pprint
 
 
+def lerp_batch(start, end, t):
+    """(len(t), dim) points from start to end"""
+    start = np.asarray(start, dtype=float)
+    end = np.asarray(end, dtype=float)
+    return start + np.asarray(t)[:, np.newaxis] * (end - start)
+
+
+def slerp_batch(q0, q1, t):
+    """(len(t), 4) quaternions from q0 to q1 along the shorter arc"""
+    q0 = np.asarray(q0, dtype=float)
+    q1 = np.asarray(q1, dtype=float)
+    t = np.asarray(t, dtype=float)
+    dot = np.dot(q0, q1)
+    if dot < 0.0:
+        q1 = -q1
+        dot = -dot
+
+    dot = min(max(dot, -1.0), 1.0)
+    theta_0 = np.arccos(dot)
+    theta = theta_0 * t
+    sin_theta = np.sin(theta)
+    sin_theta_0 = np.sin(theta_0)
+    result = np.tile(q0, (len(t), 1))
+    moving = sin_theta != 0
+    if np.any(moving):
+        s0 = np.cos(theta[moving]) - dot * sin_theta[moving] / sin_theta_0
+        s1 = sin_theta[moving] / sin_theta_0
+        result[moving] = s0[:, np.newaxis] * q0 + s1[:, np.newaxis] * q1
+    return result
+
+
 class UIBuilder:
     def __init__(self, world: World):
         self.depth_camera: Camera = None
@@ -61,6 +97,7 @@ class UIBuilder:
         self.reached = False
         self.cameras = []
         self.art_controllers = []
+        self.arm_joint_indices = {}
 
     def _init_solver(self, robot, enable_curobo, batch_num):
         self.enable_curobo = enable_curobo
@@ -318,32 +355,39 @@ class UIBuilder:
             self.kinematics_solver._articulation_kinematics_solver.compute_end_effector_pose()
         )
 
-    def _get_ik_status(self, target_position, target_orientation, isRight):
+    def _articulation_kinematics_solver(self, isRight):
         robot_base_translation, robot_base_orientation = (
             self.articulation.get_world_pose()
         )
+        kinematics_solver = self.kinematics_solver
         if self.arm_type == "dual":
             key = "left"
             if isRight:
                 key = "right"
-            self.kinematics_solver[key]._kinematics_solver.set_robot_base_pose(
-                robot_base_translation, robot_base_orientation
-            )
-            actions, success = self.kinematics_solver[
-                key
-            ]._articulation_kinematics_solver.compute_inverse_kinematics(
+            kinematics_solver = self.kinematics_solver[key]
+        kinematics_solver._kinematics_solver.set_robot_base_pose(
+            robot_base_translation, robot_base_orientation
+        )
+        return kinematics_solver._articulation_kinematics_solver
+
+    def _get_ik_status(self, target_position, target_orientation, isRight):
+        actions, success = self._articulation_kinematics_solver(
+            isRight
+        ).compute_inverse_kinematics(target_position, target_orientation)
+        return success, actions
+
+    def _get_ik_status_batch(self, target_positions, target_orientations, isRight):
+        """[(success, actions)] of a waypoint list, the robot base pose is read and set once"""
+        solver = self._articulation_kinematics_solver(isRight)
+        results = []
+        for target_position, target_orientation in zip(
+            target_positions, target_orientations
+        ):
+            actions, success = solver.compute_inverse_kinematics(
                 target_position, target_orientation
             )
-        else:
-            self.kinematics_solver._kinematics_solver.set_robot_base_pose(
-                robot_base_translation, robot_base_orientation
-            )
-            actions, success = (
-                self.kinematics_solver._articulation_kinematics_solver.compute_inverse_kinematics(
-                    target_position, target_orientation
-                )
-            )
-        return success, actions
+            results.append((success, actions))
+        return results
 
     def _move_to(self, target_positions, target_joint_indices, is_trajectory=False):
         if not self.articulation:
@@ -403,41 +447,19 @@ class UIBuilder:
         current_position, rotation_matrix = self._get_ee_pose(is_right)
 
         current_rotation = rotation_matrix_to_quaternion(rotation_matrix)
-        if not self._get_ik_status(target_position, target_orientation, is_right)[0]:
+        success, target_action = self._get_ik_status(
+            target_position, target_orientation, is_right
+        )
+        if not success:
             self.cmd_list = None
             self.reached = True
             return
-        target_arm_positions = self._get_ik_status(
-            target_position, target_orientation, is_right
-        )[1].joint_positions
-        self.idx_list = self._get_ik_status(
-            target_position, target_orientation, is_right
-        )[1].joint_indices
+        target_arm_positions = target_action.joint_positions
+        self.idx_list = target_action.joint_indices
         current_arm_positions = self.articulation.get_joint_positions(
             joint_indices=self.idx_list
         )
 
-        def lerp(start, end, t):
-            return start + t * (end - start)
-
-        def slerp(q0, q1, t):
-            dot = np.dot(q0, q1)
-            if dot < 0.0:
-                q1 = -q1
-                dot = -dot
-
-            dot = min(max(dot, -1.0), 1.0)
-            theta_0 = np.arccos(dot)
-            theta = theta_0 * t
-            sin_theta = np.sin(theta)
-            sin_theta_0 = np.sin(theta_0)
-            if sin_theta == 0:
-                return q0
-            s0 = np.cos(theta) - dot * sin_theta / sin_theta_0
-            s1 = sin_theta / sin_theta_0
-
-            return s0 * q0 + s1 * q1
-
         self.cmd_list = []
         if ee_interpolation:
             distance = np.linalg.norm(target_position - current_position)
@@ -445,13 +467,12 @@ class UIBuilder:
             joint_distance = 0
             step = (int)(distance / distance_frame)
             if step > 1:
-                for i in range(step):
-                    t = i / (step - 1)
-                    position = lerp(current_position, target_position, t)
-                    rotation = slerp(current_rotation, target_orientation, t)
-                    issuccess, arm_position = self._get_ik_status(
-                        position, rotation, is_right
-                    )
+                t = np.linspace(0.0, 1.0, step)
+                positions = lerp_batch(current_position, target_position, t)
+                rotations = slerp_batch(current_rotation, target_orientation, t)
+                for issuccess, arm_position in self._get_ik_status_batch(
+                    positions, rotations, is_right
+                ):
                     joint_distance = np.linalg.norm(
                         arm_position.joint_positions - current_arm_positions
                     )
@@ -516,23 +537,90 @@ class UIBuilder:
                 if distance < 1:
                     self.articulation.apply_action(art_action)
 
-    def _caculate_multiple_ik(self, trajectory_list):
+    def _arm_joint_indices(self, is_right):
+        """articulation dof indices the kinematics solver of an arm drives"""
+        if is_right not in self.arm_joint_indices:
+            self.arm_joint_indices[is_right] = self._get_ik_status(
+                np.array([0, 0, 0]), np.array([0, 0, 1, 0]), is_right
+            )[1].joint_indices
+        return self.arm_joint_indices[is_right]
+
+    def _curobo_trajectory_ik(self, positions, rotations, is_right):
+        """
+        (N,) IK success and (N, len(idx_list)) arm joint positions of the world frame
+        waypoints, one curobo batch
+        """
+        robot_base_translation, robot_base_orientation = (
+            self.articulation.get_world_pose()
+        )
+        base_rotation = get_rotation_matrix_from_quaternion(robot_base_orientation)
+        # robot base frame, the way command_controller feeds curobo
+        local_positions = (positions - robot_base_translation) @ base_rotation
+        local_rotations = np.array(
+            [
+                get_quaternion_from_euler(
+                    matrix_to_euler_angles(
+                        base_rotation.T @ get_rotation_matrix_from_quaternion(rotation)
+                    ),
+                    order="ZYX",
+                )
+                for rotation in rotations
+            ]
+        )
+        end_effector_name = self.end_effector_name
+        if isinstance(end_effector_name, dict):
+            end_effector_name = end_effector_name["right" if is_right else "left"]
+        success, js_solution = self.curoboMotion.solve_batch_ik(
+            local_positions, local_rotations, end_effector_name
+        )
+        success = success.view(len(positions)).cpu().numpy()
+        solution = js_solution.position.view(len(positions), -1).cpu().numpy()
+        dof_names = self.articulation.dof_names
+        columns = [
+            js_solution.joint_names.index(dof_names[idx]) for idx in self.idx_list
+        ]
+        return success, solution[:, columns]
+
+    def _caculate_multiple_ik(self, trajectory_list, is_right=True):
         current_positions = self.articulation.get_joint_positions()
-        current_joint_positions = []
-        self.idx_list = self._get_ik_status(
-            np.array([0, 0, 0]), np.array([0, 0, 1, 0]), True
-        )[1].joint_indices
-        for idx in self.idx_list:
-            current_joint_positions.append(current_positions[idx])
-        for point in trajectory_list:
-            position, rotation = point
-            succ, result = self._get_ik_status(position, rotation, True)
-            distance = np.linalg.norm(result.joint_positions - current_joint_positions)
-            logger.info(distance)
-            if distance > 1:
-                return False
-            current_joint_positions = result.joint_positions
-        return True
+        self.idx_list = self._arm_joint_indices(is_right)
+        current_joint_positions = np.asarray(current_positions)[self.idx_list]
+        if len(trajectory_list) == 0:
+            return True
+        positions = np.array([position for position, _ in trajectory_list])
+        rotations = np.array([rotation for _, rotation in trajectory_list])
+
+        ik_results = None
+        if self.curoboMotion:
+            try:
+                ik_results = self._curobo_trajectory_ik(positions, rotations, is_right)
+            except Exception as e:
+                logger.warning(f"curobo batch IK failed, solve on lula: {e}")
+        if ik_results is None:
+            results = self._get_ik_status_batch(positions, rotations, is_right)
+            ik_results = (
+                np.array([success for success, _ in results], dtype=bool),
+                np.array([actions.joint_positions for _, actions in results]),
+            )
+        success, trajectory_joint_positions = ik_results
+        # an unreachable waypoint fails the whole trajectory
+        if not np.all(success):
+            logger.debug(
+                f"trajectory points {np.flatnonzero(~success)} have no IK solution"
+            )
+            return False
+
+        # joint space jump between consecutive waypoints, from the current joints
+        distances = np.linalg.norm(
+            np.diff(
+                np.vstack([current_joint_positions, trajectory_joint_positions]),
+                axis=0,
+            ),
+            axis=1,
+        )
+        for i, distance in enumerate(distances):
+            logger.debug(f"trajectory point {i} joint distance {distance}")
+        return not np.any(distances > 1)
 
     def _teleport_robot_to_position(self, articulation_action):
         initial_positions = np.zeros(self._articulation.num_dof)
@@ -571,6 +659,8 @@ class UIBuilder:
         self.articulation = None
 
     def initialize_articulation(self, batch_num=0):
+        # dof indices are per articulation
+        self.arm_joint_indices = {}
         scene = self.my_world.scene
         if scene._scene_registry.name_exists(self.robot_name):
             self.articulation = scene.get_object(self.robot_name)
@@ -737,6 +827,19 @@ class UIBuilder:
         asyncio.ensure_future(_on_rest_async())
         return
 
+    def _on_soft_reset(self):
+        # runs between two physics steps, so the stage is edited synchronously
+        self.detach_objs()
+        self.rmp_move = False
+        self.cmd_list = None
+        self.reached = False
+        self.remove_objects()
+        if self.articulation:
+            # default joint state and root pose captured when the articulation was initialized
+            self.articulation.post_reset()
+        if self.curoboMotion:
+            self.curoboMotion.reset()
+
     def _find_all_objects_of_type(self, obj_type):
         items = []
         stage = omni.usd.get_context().get_stage()
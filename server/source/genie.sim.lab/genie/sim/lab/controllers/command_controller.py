@@ -9,6 +9,8 @@ import numpy as np
 from PIL import Image
 import omni
 from genie.sim.lab.controllers.parallel_gripper import ParallelGripper
+from genie.sim.lab.controllers.command_registry import command
+from genie.sim.lab.controllers.command_queue import CommandQueue
 from genie.sim.lab.utils import RobotCfg
 
 
@@ -52,7 +54,6 @@ import json
 from pxr import Usd, UsdGeom, UsdShade, Sdf, Gf, UsdPhysics, PhysxSchema
 from genie.sim.lab.utils import material_changer, Light
 import asyncio
-from opentelemetry import trace
 from genie.sim.lab.utils.utils import (
     get_rotation_matrix_from_quaternion,
     get_quaternion_from_euler,
@@ -74,10 +75,29 @@ from base_utils.usd_utils import (
     get_camera_prims,
 )
 
-tracer = trace.get_tracer(__name__)
+
+class ObservationSubscription:
+    def __init__(self, data, step_interval):
+        self.data = data
+        self.step_interval = step_interval
+        # only the latest observation is kept for slow consumers
+        self.frames = queue.Queue(maxsize=1)
+
+    def put(self, observation):
+        try:
+            self.frames.get_nowait()
+        except queue.Empty:
+            pass
+        self.frames.put_nowait(observation)
+
+    def get(self, timeout=None):
+        try:
+            return self.frames.get(timeout=timeout)
+        except queue.Empty:
+            return None
 
 
-class CommandController:
+class CommandController(CommandQueue):
     def __init__(
         self,
         ui_builder,
@@ -88,7 +108,9 @@ class CommandController:
         publish_ros=True,
         record_images=False,
         record_video=False,
+        max_read_commands_per_step=16,
     ):
+        super().__init__(max_read_commands_per_step=max_read_commands_per_step)
         self.ui_builder = ui_builder
         self.data = None
         self.Command = 0
@@ -99,8 +121,6 @@ class CommandController:
         self.gripper_state_R = ""
         self.gripper_state = ""
         self.gripper_initialized = False
-        self.condition = threading.Condition()
-        self.result_queue = queue.Queue()
         self.target_position = np.array([0, 0, 0])
         self.target_rotation = np.array([0, 0, 0])
         self.target_joints_pose = None
@@ -136,7 +156,8 @@ class CommandController:
         self.record_images = record_images
         self.record_video = record_video
         self.gripper_cmd_r = None
-        self._lock = threading.Lock()
+        self.observation_subscriptions = []
+        self.physics_step_count = 0
 
         # init omnigraph
         self.sensor_base = USDBase()
@@ -377,12 +398,7 @@ class CommandController:
                 self.trajectory_list = None
 
     def on_physics_step(self):
-        if (
-            self.Command == 2
-            or self.Command == 3
-            or self.Command == 24
-            or self.Command == 27
-        ):
+        if self._pending_command() in (2, 3, 24, 27):
             if "G1" in self.robot_name and self.target_point is not None:
 
                 def align_camera_to_target(camera_position, target_point):
@@ -420,6 +436,8 @@ class CommandController:
             self.ui_builder.curoboMotion.on_physics_step()
 
         self.on_command_step()
+        # observation streams
+        self._publish_observations()
         # trajectory step
         self._set_trajectory_list()
         if self.recording_started:
@@ -505,534 +523,597 @@ class CommandController:
                 print("Off contact, reset gripper sts!!!")
                 self.gripper_cmd_r = cmd_gripper_rl
 
-    # update
-    def on_command_step(self):
-        if not self.data or not self.Command:
-            return
+    @command(1)
+    def _cmd_capture_camera(self):
+        prim_path = self.data["Cam_prim_path"]
+        isRGB = self.data["isRGB"]
+        isDepth = self.data["isDepth"]
+        isSemantic = self.data["isSemantic"]
+        isGN = self.data["isGN"]
+        self.data_to_send = self._capture_camera(
+            prim_path=prim_path,
+            isRGB=isRGB,
+            isDepth=isDepth,
+            isSemantic=isSemantic,
+            isGN=isGN,
+        )
+
+    @command(2)
+    def _cmd_move_pose(self):
+        for value in self.articulat_objects.values():
+            value.initialize()
+        isSingle = False
+        self.data_to_send = None
+        target_position = self.data["target_position"]
+        target_rotation = self.data["target_rotation"]
+        is_backend = self.data["is_backend"]
+        is_Right = False
+        if self.data["isArmRight"]:
+            is_Right = True
+        if not is_backend:
+            self.ui_builder.rmp_flow = False
+            if (
+                np.linalg.norm(self.target_position - target_position) != 0.0
+                or np.linalg.norm(self.target_rotation - target_rotation) != 0.0
+                or self.ui_builder.curoboMotion.success is False
+            ):
+                self.target_position = target_position
+                self.target_rotation = target_rotation
+                self._hand_moveto(
+                    position=target_position,
+                    rotation=target_rotation,
+                    isRight=is_Right,
+                )
+            if self.ui_builder.curoboMotion.reached:
+                self.data_to_send = self.ui_builder.curoboMotion.success
         else:
-            with tracer.start_as_current_span(
-                f"rpc_server.step_command_{self.Command}"
-            ) as span:
-
-                if self.Command == 1:
-                    prim_path = self.data["Cam_prim_path"]
-                    isRGB = self.data["isRGB"]
-                    isDepth = self.data["isDepth"]
-                    isSemantic = self.data["isSemantic"]
-                    isGN = self.data["isGN"]
-                    self.data_to_send = self._capture_camera(
-                        prim_path=prim_path,
-                        isRGB=isRGB,
-                        isDepth=isDepth,
-                        isSemantic=isSemantic,
-                        isGN=isGN,
-                    )
-                if self.Command == 2:
-                    for value in self.articulat_objects.values():
-                        value.initialize()
-                    isSingle = False
-                    self.data_to_send = None
-                    target_position = self.data["target_position"]
-                    target_rotation = self.data["target_rotation"]
-                    is_backend = self.data["is_backend"]
-                    is_Right = False
-                    if self.data["isArmRight"]:
-                        is_Right = True
-                    if not is_backend:
-                        self.ui_builder.rmp_flow = False
-                        if (
-                            np.linalg.norm(self.target_position - target_position)
-                            != 0.0
-                            or np.linalg.norm(self.target_rotation - target_rotation)
-                            != 0.0
-                            or self.ui_builder.curoboMotion.success is False
-                        ):
-                            self.target_position = target_position
-                            self.target_rotation = target_rotation
-                            self._hand_moveto(
-                                position=target_position,
-                                rotation=target_rotation,
-                                isRight=is_Right,
-                            )
-                        if self.ui_builder.curoboMotion.reached:
-                            self.data_to_send = self.ui_builder.curoboMotion.success
-                    else:
-                        if (
-                            np.linalg.norm(self.target_position - target_position)
-                            != 0.0
-                            or np.linalg.norm(self.target_rotation - target_rotation)
-                            != 0.0
-                        ):
-                            self.target_position = target_position
-                            self.target_rotation = target_rotation
-                            self.arm_move_rmp(
-                                position=target_position,
-                                rotation=target_rotation,
-                                ee_interpolation=self.data["ee_interpolation"],
-                                distance_frame=self.data["distance_frame"],
-                                is_right=is_Right,
-                            )
-                        if self.ui_builder.reached:
-                            self.data_to_send = True
-                elif self.Command == 3:
-                    target_joints_pose = self.data["target_joints_position"]
-                    is_trajectory = self.data["is_trajectory"]
-                    target_joint_indices = self.data["target_joints_indices"]
-                    if not len(self.target_joints_pose):
-                        for idx, value in enumerate(
-                            list(self._get_joint_positions().values())
-                        ):
-                            if idx in target_joint_indices:
-                                self.target_joints_pose.append(value)
-                    if (
-                        np.linalg.norm(self.target_joints_pose - target_joints_pose)
-                        != 0
-                    ):
-                        self.target_joints_pose = target_joints_pose
-                        self._joint_moveto(
-                            target_joints_pose,
-                            target_joint_indices=target_joint_indices,
-                            is_trajectory=is_trajectory,
-                        )
-                    if not is_trajectory:
-                        self.data_to_send = "move joints"
-                        self.target_joints_pose = []
-                    else:
-                        if self.ui_builder.reached:
-                            self.data_to_send = "move_joints"
-                            self.target_joints_pose = []
-                # GetObjectPose Get the position of an object
-                elif self.Command == 5:  # DEPRECATED_AND_IT_IS_REPLACED_BY_ROS_TOPIC
-                    logger.debug(
-                        "this command 5 will be deprecated once grpc framework is removed"
-                    )
-                    prim_path = self.data["object_prim_path"]
-                    self.data_to_send = self._get_object_pose(prim_path)
-                # AddUsdObject Add usd object
-                elif self.Command == 6:
-                    usd_path = self.data["usd_object_path"]
-                    prim_path = self.data["usd_object_prim_path"]
-                    label_name = self.data["usd_label_name"]
-                    position = self.data["usd_object_position"]
-                    rotation = self.data["usd_object_rotation"]
-                    scale = self.data["usd_object_scale"]
-                    object_color = self.data["object_color"]
-                    object_material = self.data["object_material"]
-                    object_mass = self.data["object_mass"]
-                    add_particle = self.data["add_particle"]
-                    particle_position = self.data["particle_position"]
-                    particle_scale = self.data["particle_scale"]
-                    particle_color = self.data["particle_color"]
-                    object_com = self.data["object_com"]
-                    model_type = self.data["model_type"]
-                    static_friction = self.data["static_friction"]
-                    dynamic_friction = self.data["dynamic_friction"]
-                    self._add_usd_object(
-                        usd_path=usd_path,
-                        prim_path=prim_path,
-                        label_name=label_name,
-                        position=position,
-                        rotation=rotation,
-                        scale=scale,
-                        object_color=object_color,
-                        object_material=object_material,
-                        object_mass=object_mass,
-                        add_particle=add_particle,
-                        particle_position=particle_position,
-                        particle_scale=particle_scale,
-                        object_com=object_com,
-                        model_type=model_type,
-                        static_friction=static_friction,
-                        dynamic_friction=dynamic_friction,
-                    )
-                    self.data_to_send = "object added"
-                elif self.Command == 8:
-                    self.data_to_send = self._get_joint_positions()
-                elif self.Command == 9:
-                    logger.debug(
-                        "this command 9 will be deprecated once grpc framework is removed"
-                    )
+            if (
+                np.linalg.norm(self.target_position - target_position) != 0.0
+                or np.linalg.norm(self.target_rotation - target_rotation) != 0.0
+            ):
+                self.target_position = target_position
+                self.target_rotation = target_rotation
+                self.arm_move_rmp(
+                    position=target_position,
+                    rotation=target_rotation,
+                    ee_interpolation=self.data["ee_interpolation"],
+                    distance_frame=self.data["distance_frame"],
+                    is_right=is_Right,
+                )
+            if self.ui_builder.reached:
+                self.data_to_send = True
 
-                    state = self.data["gripper_state"]
-                    isRight = self.data["is_gripper_right"]
-                    width = self.data["opened_width"]
-
-                    self.gripper_state = state
-                    self.data_to_send = "gripper moving"
-                elif self.Command == 11:
-                    if self.data["startRecording"]:
-                        logger.info("Start recording")
-                        self.fps = self.data["fps"]
-                        self.task_name = self.data["task_name"]
-                        self.process_recording_path()
-                        self.process_camera_info_list()
-                        self.record_rosbag(self.record_images)
-
-                        # enable tf pub
-                        tf_to_record = [self.robot_prim_path]
-                        rigidbody_collider_prims = get_rigidbody_collider_prims(
-                            robot_name=(
-                                self.robot_name if hasattr(self, "robot_name") else None
-                            ),
-                            extra_prim_paths=self.data["object_prim"],
-                        )
-                        logger.info(
-                            f"record {len(rigidbody_collider_prims)} prim(s) TF with RigidBody and Collider:"
-                        )
-                        for prim in rigidbody_collider_prims:
-                            tf_to_record.append(prim.GetPath())
-                            obj_id = str(prim.GetPath()).split("/")[-1]
-                            prim_path = f"/World/Objects/{obj_id}"
-                            if prim_path not in self.usd_objects.keys():
-                                stage = omni.usd.get_context().get_stage()
-                                prim = stage.GetPrimAtPath(prim_path)
-                                if prim.IsValid():
-                                    usd_object = SingleXFormPrim(prim_path=prim_path)
-                                    self.usd_objects[prim_path] = usd_object
-                                    logger.info(
-                                        f"add rigidbody collider obj {prim_path} to usd_object"
-                                    )
-
-                            logger.info(f"- {prim.GetPath()}")
+    @command(3)
+    def _cmd_move_joints(self):
+        target_joints_pose = self.data["target_joints_position"]
+        is_trajectory = self.data["is_trajectory"]
+        target_joint_indices = self.data["target_joints_indices"]
+        if not len(self.target_joints_pose):
+            for idx, value in enumerate(list(self._get_joint_positions().values())):
+                if idx in target_joint_indices:
+                    self.target_joints_pose.append(value)
+        if np.linalg.norm(self.target_joints_pose - target_joints_pose) != 0:
+            self.target_joints_pose = target_joints_pose
+            self._joint_moveto(
+                target_joints_pose,
+                target_joint_indices=target_joint_indices,
+                is_trajectory=is_trajectory,
+            )
+        if not is_trajectory:
+            self.data_to_send = "move joints"
+            self.target_joints_pose = []
+        else:
+            if self.ui_builder.reached:
+                self.data_to_send = "move_joints"
+                self.target_joints_pose = []
+
+    # GetObjectPose Get the position of an object
+    @command(5)
+    def _cmd_get_object_pose(self):
+        # DEPRECATED_AND_IT_IS_REPLACED_BY_ROS_TOPIC
+        logger.debug("this command 5 will be deprecated once grpc framework is removed")
+        prim_path = self.data["object_prim_path"]
+        self.data_to_send = self._get_object_pose(prim_path)
+
+    # AddUsdObject Add usd object
+    @command(6)
+    def _cmd_add_usd_object(self):
+        usd_path = self.data["usd_object_path"]
+        prim_path = self.data["usd_object_prim_path"]
+        label_name = self.data["usd_label_name"]
+        position = self.data["usd_object_position"]
+        rotation = self.data["usd_object_rotation"]
+        scale = self.data["usd_object_scale"]
+        object_color = self.data["object_color"]
+        object_material = self.data["object_material"]
+        object_mass = self.data["object_mass"]
+        add_particle = self.data["add_particle"]
+        particle_position = self.data["particle_position"]
+        particle_scale = self.data["particle_scale"]
+        particle_color = self.data["particle_color"]
+        object_com = self.data["object_com"]
+        model_type = self.data["model_type"]
+        static_friction = self.data["static_friction"]
+        dynamic_friction = self.data["dynamic_friction"]
+        self._add_usd_object(
+            usd_path=usd_path,
+            prim_path=prim_path,
+            label_name=label_name,
+            position=position,
+            rotation=rotation,
+            scale=scale,
+            object_color=object_color,
+            object_material=object_material,
+            object_mass=object_mass,
+            add_particle=add_particle,
+            particle_position=particle_position,
+            particle_scale=particle_scale,
+            object_com=object_com,
+            model_type=model_type,
+            static_friction=static_friction,
+            dynamic_friction=dynamic_friction,
+        )
+        self.data_to_send = "object added"
+
+    @command(8)
+    def _cmd_get_joint_positions(self):
+        self.data_to_send = self._get_joint_positions()
+
+    @command(9)
+    def _cmd_set_gripper_state(self):
+        logger.debug("this command 9 will be deprecated once grpc framework is removed")
+
+        state = self.data["gripper_state"]
+        isRight = self.data["is_gripper_right"]
+        width = self.data["opened_width"]
+
+        self.gripper_state = state
+        self.data_to_send = "gripper moving"
+
+    @command(11)
+    def _cmd_recording(self):
+        if self.data["startRecording"]:
+            logger.info("Start recording")
+            self.fps = self.data["fps"]
+            self.task_name = self.data["task_name"]
+            self.process_recording_path()
+            self.process_camera_info_list()
+            self.record_rosbag(self.record_images)
+
+            # enable tf pub
+            tf_to_record = [self.robot_prim_path]
+            rigidbody_collider_prims = get_rigidbody_collider_prims(
+                robot_name=(self.robot_name if hasattr(self, "robot_name") else None),
+                extra_prim_paths=self.data["object_prim"],
+            )
+            logger.info(
+                f"record {len(rigidbody_collider_prims)} prim(s) TF with RigidBody and Collider:"
+            )
+            for prim in rigidbody_collider_prims:
+                tf_to_record.append(prim.GetPath())
+                obj_id = str(prim.GetPath()).split("/")[-1]
+                prim_path = f"/World/Objects/{obj_id}"
+                if prim_path not in self.usd_objects.keys():
+                    stage = omni.usd.get_context().get_stage()
+                    prim = stage.GetPrimAtPath(prim_path)
+                    if prim.IsValid():
+                        usd_object = SingleXFormPrim(prim_path=prim_path)
+                        self.usd_objects[prim_path] = usd_object
                         logger.info(
-                            f"record {len(self.articulat_objects)} articulated prim(s) TF:"
+                            f"add rigidbody collider obj {prim_path} to usd_object"
                         )
-                        for idx, key in enumerate(self.articulat_objects):
-                            self.sensor_base.publish_articulated_joint(key)
-                            self.object_prims["articulated_object_prims"].append(key)
 
-                        camera_prims = get_camera_prims(
-                            robot_name=(
-                                self.robot_name if hasattr(self, "robot_name") else None
-                            )
-                        )
-                        logger.info(
-                            f"record {len(camera_prims)} prim(s) TF with Camera:"
-                        )
-                        for prim in camera_prims:
-                            tf_to_record.append(prim.GetPath())
-                            logger.info(f"- {prim.GetPath()}")
-                        logger.info(f"sensor_base.publish_tf {self.robot_prim_path}")
-                        self.sensor_base.publish_tf(
-                            robot_prim=self.robot_prim_path,
-                            targets=tf_to_record,
-                        )
+                logger.info(f"- {prim.GetPath()}")
+            logger.info(f"record {len(self.articulat_objects)} articulated prim(s) TF:")
+            for idx, key in enumerate(self.articulat_objects):
+                self.sensor_base.publish_articulated_joint(key)
+                self.object_prims["articulated_object_prims"].append(key)
 
-                        self.recording_started = True
-                        self.data_to_send = "Start"
-                    elif self.data["stopRecording"]:
-                        logger.info("Stop recording")
-                        self.recording_started = False
-                        if self.publish_ros:
-                            for process_pid in self.process_pid:
-                                os.kill(process_pid, signal.SIGTERM)
-
-                            async def store_info():
-                                from genie.sim.lab.controllers.extract_ros_bag import (
-                                    Ros_Extrater,
-                                )
-
-                                extract_ros = Ros_Extrater(
-                                    bag_file=self.path_to_save,
-                                    output_dir=self.path_to_save,
-                                    robot_init_position=self.robot_init_position,
-                                    robot_init_rotation=self.robot_init_rotation,
-                                    camera_info=self.camera_info_list,
-                                    scene_name=self.scene_name,
-                                    scene_usd=self.scene_usd,
-                                    scene_glb=self.scene_glb,
-                                    object_names=self.object_prims,
-                                    fps=self.fps,
-                                    robot_name=self.robot_name,
-                                    frame_status=self.frame_status,
-                                    with_img=self.record_images,
-                                    with_video=self.record_video,
-                                )
-                                while True:
-                                    await asyncio.sleep(1)
-                                    if os.path.isfile(
-                                        self.path_to_save + "/metadata.yaml"
-                                    ):
-                                        extract_ros.extract()
-                                        break
-
-                            asyncio.run(store_info())
-                            self.process_pid = []
-                        self.data_to_send = "Stopped"
-                    else:  # DEPRECATED_AND_IT_IS_REPLACED_BY_ROS_TOPIC
-                        isCam = self.data["isCam"]
-                        isJoint = self.data["isJoint"]
-                        isPose = self.data["isPose"]
-                        isGripper = self.data["isGripper"]
-                        data_to_send = {}
-
-                        cam_datas = []
-                        joint_datas = {}
-                        object_datas = []
-                        gripper_datas = {}
-                        if isCam:
-                            prim_list = self.data["camera_prim_list"]
-                            isDepth = self.data["render_depth"]
-                            isSemantic = self.data["render_semantic"]
-                            for prim in prim_list:
-                                cam_datas.append(
-                                    self._capture_camera(
-                                        prim_path=prim,
-                                        isRGB=True,
-                                        isDepth=isDepth,
-                                        isSemantic=isSemantic,
-                                        isGN=False,
-                                    )
-                                )
-                        if isJoint:
-                            joint_datas = self._get_joint_positions()
-                        if isPose:
-                            obj_prim_list = self.data["object_prim"]
-                            for prim in obj_prim_list:
-                                object_datas.append(self._get_object_pose(prim))
-                        if isGripper:
-                            gripper_datas = {
-                                "left": self._get_ee_pose(is_right=False),
-                                "right": self._get_ee_pose(is_right=True),
-                            }
-                        self.data_to_send = {
-                            "camera": cam_datas,
-                            "joint": joint_datas,
-                            "object": object_datas,
-                            "gripper": gripper_datas,
-                        }
-                elif self.Command == 12:
-                    self._on_reset()
-                    self.loop_count += 1
-                    self.data_to_send = "reset"
-                elif self.Command == 13:
-                    obj_prims = self.data["obj_prim_paths"]
-                    is_right = self.data["is_right"]
-                    items = []
-                    stage = omni.usd.get_context().get_stage()
-                    if stage:
-                        for prim_path in obj_prims:
-                            for prim in Usd.PrimRange(stage.GetPrimAtPath(prim_path)):
-                                path = str(prim.GetPath())
-                                prim = get_prim_at_path(path)
-                                if prim.IsA(UsdGeom.Mesh):
-                                    items.append(path)
-                    result = self.ui_builder.attach_objs(items, is_right)
-                    self.data_to_send = "attaching"
-                elif self.Command == 14:
-                    logger.debug(
-                        "this command 14 will be deprecated once grpc framework is removed"
-                    )
-                    self.ui_builder.detach_objs()
-                    self.data_to_send = "detaching"
-                elif self.Command == 15:
-                    is_plan = self.data["isPlan"]
-                    poses = self.data["poses"]
-                    index = self.data["plan_index"]
-                    if is_plan:
-                        result = self.ui_builder._caculate_multi_ik(poses)
-                        self.data_to_send = {
-                            "cmd_plans": result,
-                            "msg": self.ui_builder.curoboMotion.success,
-                        }
-                    else:
-                        self.ui_builder._multi_move(index)
-                        if self.ui_builder.curoboMotion.reached:
-                            self.data_to_send = self.ui_builder.curoboMotion.success
-                elif self.Command == 16:
-                    isSuccess = self.data["isSuccess"]
-                    self.object_prims = {
-                        "object_prims": [],
-                        "articulated_object_prims": [],
-                    }
-                    if self.task_name is not None:
-                        result = {
-                            "task_name": self.task_name,
-                            "fail_stage_step": self.data["failStep"],
-                            "fps": self.fps,
-                            "task_status": isSuccess,
-                            "camera_info": self.camera_info_list,
-                        }
-                        with open(
-                            self.path_to_save + "/task_result.json",
-                            "w",
-                            encoding="utf-8",
-                        ) as f:
-                            json.dump(result, f, ensure_ascii=False)
-                        with open(
-                            self.path_to_save + "/frame_state.json",
-                            "w",
-                            encoding="utf-8",
-                        ) as f:
-                            json.dump(self.frame_status, f, indent=4)
-                    # if not isSuccess:
-                    #     shutil.rmtree(self.path_to_save)
-                    self.data_to_send = str(isSuccess)
-                elif self.Command == 17:
-                    logger.info("On Exit...")
-                    self.exit = self.data["exit"]
-                    self.data_to_send = "exit"
-                    if self.task_name is not None:
-                        output_path = os.path.join(
-                            benchmark_root_path(), "output", self.task_name
-                        )
-                        logger.info(
-                            f"Copy state json from {self.path_to_save} to {output_path}"
-                        )
-                        os.system(f"cp {self.path_to_save}/state.json {output_path}")
+            camera_prims = get_camera_prims(
+                robot_name=(self.robot_name if hasattr(self, "robot_name") else None)
+            )
+            logger.info(f"record {len(camera_prims)} prim(s) TF with Camera:")
+            for prim in camera_prims:
+                tf_to_record.append(prim.GetPath())
+                logger.info(f"- {prim.GetPath()}")
+            logger.info(f"sensor_base.publish_tf {self.robot_prim_path}")
+            self.sensor_base.publish_tf(
+                robot_prim=self.robot_prim_path,
+                targets=tf_to_record,
+            )
 
-                elif self.Command == 18:  # DEPRECATED_AND_IT_IS_REPLACED_BY_ROS_TOPIC
-                    logger.debug(
-                        "this command 18 will be deprecated once grpc framework is removed"
-                    )
-                    cmd = "get_ee_pose"
-                    is_right = self.data["isRight"]
-                    self.data_to_send = self._get_ee_pose(is_right)
-                elif self.Command == 19:
-                    target_poses = self.data["target_poses"]
-                    ik_result = []
-                    is_Right = self.data["isRight"]
-                    ObsAvoid = self.data["ObsAvoid"]
-                    n = 0
-                    for pose in target_poses:
-                        ik_result.append(
-                            self._get_ik_status(
-                                np.array(pose["position"]),
-                                np.array(pose["rotation"]),
-                                is_Right,
-                                ObsAvoid,
-                            )
-                        )
-                    self.data_to_send = ik_result
-                elif self.Command == 20:
-                    obj_type = self.data["obj_type"]
-                    self.data_to_send = self._find_all_objects_of_type(obj_type)
-                elif self.Command == 21:
-                    robot_cfg_file = self.data["robot_cfg_file"]
-                    scene_usd_path = self.data["scene_usd_path"]
-                    self._init_robot_cfg(
-                        robot_cfg=robot_cfg_file,
-                        scene_usd=scene_usd_path,
-                        init_position=self.data["robot_position"],
-                        init_rotation=self.data["robot_rotation"],
-                        stand_type=self.data["stand_type"],
-                        size_x=self.data["stand_size_x"],
-                        size_y=self.data["stand_size_y"],
-                    )
-                    self.data_to_send = "success"
-                elif self.Command == 22:
-                    camera_prim = self.data["camera_prim"]
-                    camera_position = self.data["camera_position"]
-                    camera_rotation = self.data["camera_rotation"]
-                    self._add_camera(
-                        camera_prim=camera_prim,
-                        camera_position=camera_position,
-                        camera_rotation=camera_rotation,
-                        width=self.data["width"],
-                        height=self.data["height"],
-                        focal_length=self.data["focus_length"],
-                        horizontal_aperture=self.data["horizontal_aperture"],
-                        vertical_aperture=self.data["vertical_aperture"],
-                        is_local=self.data["is_local"],
-                    )
-                    self.data_to_send = "success"
-                elif self.Command == 23:
-                    self.draw_lines(
-                        self.data["point_list_1"],
-                        self.data["point_list_2"],
-                        self.data["colors"],
-                        self.data["sizes"],
-                        None,
-                    )
-                    self.data_to_send = "success"
-                elif self.Command == 24:
-                    self._set_object_pose(
-                        self.data["object_poses"],
-                        self.data["joint_position"],
-                        self.data["object_joints"],
+            self.recording_started = True
+            self.data_to_send = "Start"
+        elif self.data["stopRecording"]:
+            logger.info("Stop recording")
+            self.recording_started = False
+            if self.publish_ros:
+                for process_pid in self.process_pid:
+                    os.kill(process_pid, signal.SIGTERM)
+
+                async def store_info():
+                    from genie.sim.lab.controllers.extract_ros_bag import (
+                        Ros_Extrater,
                     )
-                    self.data_to_send = "success"
-                elif self.Command == 25:
-                    self.trajectory_blocking = self.data["is_block"]
-                    if not self.trajectory_list:
-                        self.trajectory_list = self.data["trajectory_list"]
-                        self.trajectory_index = 0
-                        self.trajectory_reached = False
-                        if not self.data["is_block"]:
-                            self.data_to_send = "success"
-                    if self.trajectory_index >= len(self.trajectory_list):
-                        self.data_to_send = "success"
-                elif self.Command == 26:
-                    self.data_to_send = self._get_object_joint(
-                        self.data["object_prim_path"]
-                    )
-                elif self.Command == 27:
-                    self.target_point = self.data["target_position"]
-                    self.data_to_send = "success"
-                elif self.Command == 28:
-                    time_stamp = self.timeline.get_current_time()
-                    self.frame_status.append(
-                        {
-                            "time_stamp": time_stamp,
-                            "frame_state": json.loads(self.data["frame_state"]),
-                        }
+
+                    extract_ros = Ros_Extrater(
+                        bag_file=self.path_to_save,
+                        output_dir=self.path_to_save,
+                        robot_init_position=self.robot_init_position,
+                        robot_init_rotation=self.robot_init_rotation,
+                        camera_info=self.camera_info_list,
+                        scene_name=self.scene_name,
+                        scene_usd=self.scene_usd,
+                        scene_glb=self.scene_glb,
+                        object_names=self.object_prims,
+                        fps=self.fps,
+                        robot_name=self.robot_name,
+                        frame_status=self.frame_status,
+                        with_img=self.record_images,
+                        with_video=self.record_video,
                     )
-                    self.data_to_send = "success"
-                elif self.Command == 29:
-                    for material_info in self.data:
-                        self._set_object_material(
-                            material_info["object_prim"],
-                            material_info["material_name"],
-                            material_info["material_path"],
-                            material_info["label_name"],
-                        )
-                    self.data_to_send = "success"
-                elif self.Command == 30:
-                    for light in self.data:
-                        self._set_light(
-                            light_type=light["light_type"],
-                            light_prim=light["light_prim"],
-                            light_temperature=light["light_temperature"],
-                            light_intensity=light["light_intensity"],
-                            light_rotation=light["light_rotation"],
-                            light_texture=light["light_texture"],
-                        )
-                    self.data_to_send = "success"
-                elif self.Command == 31:
-                    self.clear_lines(self.data["name"])
-                    self.data_to_send = "success"
-                elif self.Command == 32:
-                    if isinstance(self.data["value"], bool):
-                        omni.kit.commands.execute(
-                            "ChangeProperty",
-                            prop_path=Sdf.Path(self.data["prop_path"]),
-                            value=self.data["value"],
-                            prev=None,
-                        )
-                        self.data_to_send = "success"
-                    elif (
-                        isinstance(self.data["value"], str)
-                        and self.data["value"] == "trigger_action"
-                    ):
-                        self.data_to_send = str(
-                            og.Controller.attribute(self.data["prop_path"]).get()
-                        )
-                elif self.Command == 33:
-                    num = self.get_particle_pt_num_inbbox(
-                        self.data["prim_path"], self.data["bbox_3d"]
+                    while True:
+                        await asyncio.sleep(1)
+                        if os.path.isfile(self.path_to_save + "/metadata.yaml"):
+                            extract_ros.extract()
+                            break
+
+                asyncio.run(store_info())
+                self.process_pid = []
+            self.data_to_send = "Stopped"
+        else:  # DEPRECATED_AND_IT_IS_REPLACED_BY_ROS_TOPIC
+            self.data_to_send = self._get_observation_data(self.data)
+
+    @command(12)
+    def _cmd_reset(self):
+        if self.data.get("soft"):
+            self._on_soft_reset()
+        else:
+            self._on_reset()
+        self.loop_count += 1
+        self.data_to_send = "reset"
+
+    @command(13)
+    def _cmd_attach_objs(self):
+        obj_prims = self.data["obj_prim_paths"]
+        is_right = self.data["is_right"]
+        items = []
+        stage = omni.usd.get_context().get_stage()
+        if stage:
+            for prim_path in obj_prims:
+                for prim in Usd.PrimRange(stage.GetPrimAtPath(prim_path)):
+                    path = str(prim.GetPath())
+                    prim = get_prim_at_path(path)
+                    if prim.IsA(UsdGeom.Mesh):
+                        items.append(path)
+        result = self.ui_builder.attach_objs(items, is_right)
+        self.data_to_send = "attaching"
+
+    @command(14)
+    def _cmd_detach_objs(self):
+        logger.debug(
+            "this command 14 will be deprecated once grpc framework is removed"
+        )
+        self.ui_builder.detach_objs()
+        self.data_to_send = "detaching"
+
+    @command(15)
+    def _cmd_multi_plan(self):
+        is_plan = self.data["isPlan"]
+        poses = self.data["poses"]
+        index = self.data["plan_index"]
+        if is_plan:
+            result = self.ui_builder._caculate_multi_ik(poses)
+            self.data_to_send = {
+                "cmd_plans": result,
+                "msg": self.ui_builder.curoboMotion.success,
+            }
+        else:
+            self.ui_builder._multi_move(index)
+            if self.ui_builder.curoboMotion.reached:
+                self.data_to_send = self.ui_builder.curoboMotion.success
+
+    @command(16)
+    def _cmd_task_status(self):
+        isSuccess = self.data["isSuccess"]
+        self.object_prims = {
+            "object_prims": [],
+            "articulated_object_prims": [],
+        }
+        if self.task_name is not None:
+            result = {
+                "task_name": self.task_name,
+                "fail_stage_step": self.data["failStep"],
+                "fps": self.fps,
+                "task_status": isSuccess,
+                "camera_info": self.camera_info_list,
+            }
+            with open(
+                self.path_to_save + "/task_result.json",
+                "w",
+                encoding="utf-8",
+            ) as f:
+                json.dump(result, f, ensure_ascii=False)
+            with open(
+                self.path_to_save + "/frame_state.json",
+                "w",
+                encoding="utf-8",
+            ) as f:
+                json.dump(self.frame_status, f, indent=4)
+        # if not isSuccess:
+        #     shutil.rmtree(self.path_to_save)
+        self.data_to_send = str(isSuccess)
+
+    @command(17)
+    def _cmd_exit(self):
+        logger.info("On Exit...")
+        self.exit = self.data["exit"]
+        self.data_to_send = "exit"
+        output_path = os.path.join(benchmark_root_path(), "output")
+        if self.task_name is not None:
+            output_path = os.path.join(output_path, self.task_name)
+            logger.info(f"Copy state json from {self.path_to_save} to {output_path}")
+            os.system(f"cp {self.path_to_save}/state.json {output_path}")
+        self.dump_server_stats(output_path)
+
+    @command(18)
+    def _cmd_get_ee_pose(self):
+        # DEPRECATED_AND_IT_IS_REPLACED_BY_ROS_TOPIC
+        logger.debug(
+            "this command 18 will be deprecated once grpc framework is removed"
+        )
+        cmd = "get_ee_pose"
+        is_right = self.data["isRight"]
+        self.data_to_send = self._get_ee_pose(is_right)
+
+    @command(19)
+    def _cmd_get_ik_status(self):
+        target_poses = self.data["target_poses"]
+        ik_result = []
+        is_Right = self.data["isRight"]
+        ObsAvoid = self.data["ObsAvoid"]
+        n = 0
+        for pose in target_poses:
+            ik_result.append(
+                self._get_ik_status(
+                    np.array(pose["position"]),
+                    np.array(pose["rotation"]),
+                    is_Right,
+                    ObsAvoid,
+                )
+            )
+        self.data_to_send = ik_result
+
+    @command(20)
+    def _cmd_find_objects_of_type(self):
+        obj_type = self.data["obj_type"]
+        self.data_to_send = self._find_all_objects_of_type(obj_type)
+
+    @command(21)
+    def _cmd_init_robot(self):
+        robot_cfg_file = self.data["robot_cfg_file"]
+        scene_usd_path = self.data["scene_usd_path"]
+        self._init_robot_cfg(
+            robot_cfg=robot_cfg_file,
+            scene_usd=scene_usd_path,
+            init_position=self.data["robot_position"],
+            init_rotation=self.data["robot_rotation"],
+            stand_type=self.data["stand_type"],
+            size_x=self.data["stand_size_x"],
+            size_y=self.data["stand_size_y"],
+        )
+        self.data_to_send = "success"
+
+    @command(22)
+    def _cmd_add_camera(self):
+        camera_prim = self.data["camera_prim"]
+        camera_position = self.data["camera_position"]
+        camera_rotation = self.data["camera_rotation"]
+        self._add_camera(
+            camera_prim=camera_prim,
+            camera_position=camera_position,
+            camera_rotation=camera_rotation,
+            width=self.data["width"],
+            height=self.data["height"],
+            focal_length=self.data["focus_length"],
+            horizontal_aperture=self.data["horizontal_aperture"],
+            vertical_aperture=self.data["vertical_aperture"],
+            is_local=self.data["is_local"],
+        )
+        self.data_to_send = "success"
+
+    @command(23)
+    def _cmd_draw_lines(self):
+        self.draw_lines(
+            self.data["point_list_1"],
+            self.data["point_list_2"],
+            self.data["colors"],
+            self.data["sizes"],
+            None,
+        )
+        self.data_to_send = "success"
+
+    @command(24)
+    def _cmd_set_object_pose(self):
+        self._set_object_pose(
+            self.data["object_poses"],
+            self.data["joint_position"],
+            self.data["object_joints"],
+        )
+        self.data_to_send = "success"
+
+    @command(25)
+    def _cmd_set_trajectory_list(self):
+        self.trajectory_blocking = self.data["is_block"]
+        if not self.trajectory_list:
+            self.trajectory_list = self.data["trajectory_list"]
+            self.trajectory_index = 0
+            self.trajectory_reached = False
+            if not self.data["is_block"]:
+                self.data_to_send = "success"
+        if self.trajectory_index >= len(self.trajectory_list):
+            self.data_to_send = "success"
+
+    @command(26)
+    def _cmd_get_object_joint(self):
+        self.data_to_send = self._get_object_joint(self.data["object_prim_path"])
+
+    @command(27)
+    def _cmd_set_target_point(self):
+        self.target_point = self.data["target_position"]
+        self.data_to_send = "success"
+
+    @command(28)
+    def _cmd_store_frame_state(self):
+        time_stamp = self.timeline.get_current_time()
+        self.frame_status.append(
+            {
+                "time_stamp": time_stamp,
+                "frame_state": json.loads(self.data["frame_state"]),
+            }
+        )
+        self.data_to_send = "success"
+
+    @command(29)
+    def _cmd_set_material(self):
+        for material_info in self.data:
+            self._set_object_material(
+                material_info["object_prim"],
+                material_info["material_name"],
+                material_info["material_path"],
+                material_info["label_name"],
+            )
+        self.data_to_send = "success"
+
+    @command(30)
+    def _cmd_set_light(self):
+        for light in self.data:
+            self._set_light(
+                light_type=light["light_type"],
+                light_prim=light["light_prim"],
+                light_temperature=light["light_temperature"],
+                light_intensity=light["light_intensity"],
+                light_rotation=light["light_rotation"],
+                light_texture=light["light_texture"],
+            )
+        self.data_to_send = "success"
+
+    @command(31)
+    def _cmd_clear_lines(self):
+        self.clear_lines(self.data["name"])
+        self.data_to_send = "success"
+
+    @command(32)
+    def _cmd_set_property(self):
+        if isinstance(self.data["value"], bool):
+            omni.kit.commands.execute(
+                "ChangeProperty",
+                prop_path=Sdf.Path(self.data["prop_path"]),
+                value=self.data["value"],
+                prev=None,
+            )
+            self.data_to_send = "success"
+        elif (
+            isinstance(self.data["value"], str)
+            and self.data["value"] == "trigger_action"
+        ):
+            self.data_to_send = str(
+                og.Controller.attribute(self.data["prop_path"]).get()
+            )
+
+    @command(33)
+    def _cmd_get_particle_num_in_bbox(self):
+        num = self.get_particle_pt_num_inbbox(
+            self.data["prim_path"], self.data["bbox_3d"]
+        )
+        self.data_to_send = {"num": num}
+
+    @command(34)
+    def _cmd_get_object_aabb(self):
+        cache = create_bbox_cache()
+        aabb = compute_aabb(cache, prim_path=self.data["prim_path"])
+        self.data_to_send = {"points": aabb}
+
+    @command(35)
+    def _cmd_get_world_pose(self):
+        x_target = SingleXFormPrim(self.data["prim_path"])
+        pos, quat = x_target.get_world_pose()
+        self.data_to_send = {"pos": pos, "quat": quat}
+
+    @command(36)
+    def _cmd_get_world_poses(self):
+        self.data_to_send = self._get_object_poses(self.data["prim_paths"])
+
+    @command(37)
+    def _cmd_get_object_aabbs(self):
+        cache = create_bbox_cache()
+        aabbs = [
+            compute_aabb(cache, prim_path=prim_path)
+            for prim_path in self.data["prim_paths"]
+        ]
+        self.data_to_send = {"points": aabbs}
+
+    @command(38)
+    def _cmd_wait_until_settled(self):
+        # multi-step command, sampled once per sim loop step, progress kept in the request data
+        self.data["elapsed_steps"] = steps = self.data.get("elapsed_steps", 0) + 1
+        settled = self._is_settled()
+        if (settled and steps >= self.data["min_steps"]) or steps >= self.data[
+            "max_steps"
+        ]:
+            self.data_to_send = {"settled": settled, "steps": steps}
+
+    def _is_settled(self):
+        """
+        objects are at rest when their pose change since the previous step is under the
+        linear/angular velocity thresholds, robot joints when their velocities are
+        """
+        data = self.data
+        settled = True
+        if data["joint_velocity"] > 0 and self.ui_builder.articulation:
+            articulation = self.ui_builder.articulation
+            joint_velocities = articulation.get_joint_velocities()
+            if data.get("joint_names"):
+                joint_velocities = [
+                    joint_velocities[idx]
+                    for idx, name in enumerate(articulation.dof_names)
+                    if name in data["joint_names"]
+                ]
+                if not joint_velocities and not data.get("unknown_joints"):
+                    # a typo or another robot's names, nothing to wait for
+                    data["unknown_joints"] = True
+                    logger.warning(
+                        f"WaitUntilSettled: no joint of {data['joint_names']} in the robot, treated as settled"
                     )
-                    self.data_to_send = {"num": num}
-                elif self.Command == 34:
-                    cache = create_bbox_cache()
-                    aabb = compute_aabb(cache, prim_path=self.data["prim_path"])
-                    self.data_to_send = {"points": aabb}
-                elif self.Command == 35:
-                    x_target = SingleXFormPrim(self.data["prim_path"])
-                    pos, quat = x_target.get_world_pose()
-                    self.data_to_send = {"pos": pos, "quat": quat}
-        if self.Command:
-            with self.condition:
-                self.condition.notify_all()
+            if len(joint_velocities):
+                settled = (
+                    float(np.max(np.abs(joint_velocities))) < data["joint_velocity"]
+                )
+        if data["linear_velocity"] <= 0 and data["angular_velocity"] <= 0:
+            return settled
+
+        prim_paths = data["prim_paths"] or [
+            path for path in self.usd_objects if path != "robot"
+        ]
+        now = self.ui_builder.my_world.current_time
+        # one batch, articulated objects are initialized once per sample
+        poses = np.array(self._get_object_poses(prim_paths))
+        last_time, last_poses = data.get("last_sample", (None, None))
+        data["last_sample"] = (now, poses)
+        if last_poses is None or now <= last_time:
+            return False
+        dt = now - last_time
+        for pose, last_pose in zip(poses, last_poses):
+            speed = np.linalg.norm(pose[:3, 3] - last_pose[:3, 3]) / dt
+            # rotation angle between the two orientations
+            cos_angle = (np.trace(last_pose[:3, :3].T @ pose[:3, :3]) - 1) / 2
+            angular_speed = np.arccos(np.clip(cos_angle, -1.0, 1.0)) / dt
+            if (data["linear_velocity"] > 0 and speed >= data["linear_velocity"]) or (
+                data["angular_velocity"] > 0
+                and angular_speed >= data["angular_velocity"]
+            ):
+                return False
+        return settled
 
     def _on_recording_step(self):
         return
@@ -1060,6 +1141,65 @@ class CommandController:
                 isGN=False,
             )
 
+    def _get_observation_data(self, data):
+        isCam = data["isCam"]
+        isJoint = data["isJoint"]
+        isPose = data["isPose"]
+        isGripper = data["isGripper"]
+
+        cam_datas = []
+        joint_datas = {}
+        object_datas = []
+        gripper_datas = {}
+        if isCam:
+            prim_list = data["camera_prim_list"]
+            isDepth = data["render_depth"]
+            isSemantic = data["render_semantic"]
+            for prim in prim_list:
+                cam_datas.append(
+                    self._capture_camera(
+                        prim_path=prim,
+                        isRGB=True,
+                        isDepth=isDepth,
+                        isSemantic=isSemantic,
+                        isGN=False,
+                    )
+                )
+        if isJoint:
+            joint_datas = self._get_joint_positions()
+        if isPose:
+            obj_prim_list = data["object_prim"]
+            for prim in obj_prim_list:
+                object_datas.append(self._get_object_pose(prim))
+        if isGripper:
+            gripper_datas = {
+                "left": self._get_ee_pose(is_right=False),
+                "right": self._get_ee_pose(is_right=True),
+            }
+        return {
+            "camera": cam_datas,
+            "joint": joint_datas,
+            "object": object_datas,
+            "gripper": gripper_datas,
+        }
+
+    def subscribe_observations(self, data, step_interval):
+        subscription = ObservationSubscription(data, step_interval)
+        self.observation_subscriptions.append(subscription)
+        return subscription
+
+    def unsubscribe_observations(self, subscription):
+        try:
+            self.observation_subscriptions.remove(subscription)
+        except ValueError:
+            pass
+
+    def _publish_observations(self):
+        self.physics_step_count += 1
+        for subscription in list(self.observation_subscriptions):
+            if self.physics_step_count % subscription.step_interval == 0:
+                subscription.put(self._get_observation_data(subscription.data))
+
     def _on_reset(self):
         logger.warning("reset")
         self._reset_stiffness()
@@ -1070,23 +1210,38 @@ class CommandController:
         self.articulat_objects = {}
         self.frame_status = []
 
-    def _on_blocking_thread(self, data, Command):
-        self.data = data
-        self.Command = Command
-        with self.condition:
-            while self.data_to_send is None:
-                self.condition.wait()
-            result = self.data_to_send
-            self.data_to_send = None
-            self.Command = 0
-            self.result_queue.put(result)
-
-    def blocking_start_server(self, data, Command):
-        with self._lock:
-            self._on_blocking_thread(data, Command)
-            if not self.result_queue.empty():
-                result = self.result_queue.get()
-                return result
+    def _on_soft_reset(self):
+        # episode reset without InitRobot, robot and static scene stay on the stage
+        logger.info("soft reset")
+        self._reset_stiffness()
+        self.ui_builder._on_soft_reset()
+        self.usd_objects = {
+            name: prim for name, prim in self.usd_objects.items() if name == "robot"
+        }
+        self.articulat_objects = {}
+        self.target_position = [0, 0, 0]
+        self.trajectory_list = None
+        self.trajectory_index = 0
+        self.trajectory_reached = False
+        self.gripper_cmd_r = None
+        self.frame_status = []
+
+    def get_server_stats(self, reset=False):
+        """latency histograms per command id, plus per physics step handler timings"""
+        stats = {
+            "commands": self.command_stats.to_dict(reset=reset),
+            "handler_calls": self.get_handler_timings(),
+        }
+        if reset:
+            self.handler_timings = {}
+        return stats
+
+    def dump_server_stats(self, output_dir):
+        os.makedirs(output_dir, exist_ok=True)
+        stats_path = os.path.join(output_dir, "server_stats.json")
+        with open(stats_path, "w", encoding="utf-8") as f:
+            json.dump(self.get_server_stats(), f, indent=4)
+        logger.info(f"Server stats written to {stats_path}")
 
     # debug_draw_line
     def draw_lines(self, point_list_1, point_list_2, colors, sizes, name):
@@ -1653,6 +1808,23 @@ class CommandController:
             value.initialize()
         return position, rotation
 
+    def _get_object_poses(self, object_prim_paths):
+        for value in self.articulat_objects.values():
+            value.initialize()
+        poses = []
+        for prim_path in object_prim_paths:
+            if prim_path == "robot":
+                position, rotation = self.usd_objects["robot"].get_world_pose()
+            else:
+                position, rotation = SingleXFormPrim(
+                    prim_path=prim_path
+                ).get_world_pose()
+            pose = np.eye(4)
+            pose[:3, :3] = get_rotation_matrix_from_quaternion(rotation)
+            pose[:3, 3] = position
+            poses.append(pose)
+        return poses
+
     def _get_ee_pose(self, is_right: bool) -> Tuple[np.ndarray, np.ndarray]:
         position, rotation_matrix = self.ui_builder._get_ee_pose(is_right)
         rotation = rotation_matrix_to_quaternion(rotation_matrix)
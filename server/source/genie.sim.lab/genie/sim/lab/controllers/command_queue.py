@@ -0,0 +1,93 @@
+# Copyright (c) 2023-2025, AgiBot Inc. All Rights Reserved.
+# Author: Genie Sim Team
+# License: Mozilla Public License Version 2.0
+
+import threading
+import time
+from collections import deque
+
+from genie.sim.lab.controllers.command_registry import CommandDispatcher
+from genie.sim.lab.controllers.command_stats import CommandStats
+
+# commands that only read sim state, several of them can be served in one physics step
+READ_ONLY_COMMANDS = {1, 4, 5, 8, 18, 20, 26, 33, 34, 35, 36, 37}
+
+
+class CommandRequest:
+    def __init__(self, data, Command):
+        self.data = data
+        self.Command = Command
+        self.result = None
+        self.done = threading.Event()
+        self.enqueued_at = time.perf_counter()
+        self.handler_time = 0.0
+        self.notified_at = None
+
+
+class CommandQueue(CommandDispatcher):
+    """
+    Hands commands from the grpc threads to the sim loop.
+    blocking_start_server queues a request and waits for its result, on_command_step
+    runs once per physics step: it drains up to max_read_commands_per_step read-only
+    commands, or runs the state-mutating command at the head of the queue, in order.
+    A multi-step command holds the queue until its handler sets data_to_send.
+    """
+
+    def __init__(self, max_read_commands_per_step=16):
+        super().__init__()
+        self.command_queue = deque()
+        self.current_request = None
+        self.max_read_commands_per_step = max_read_commands_per_step
+        self.command_stats = CommandStats()
+        self.data = None
+        self.Command = 0
+        self.data_to_send = None
+
+    def _pending_command(self):
+        if self.current_request:
+            return self.current_request.Command
+        try:
+            return self.command_queue[0].Command
+        except IndexError:
+            return 0
+
+    def on_command_step(self):
+        read_count = 0
+        while True:
+            if self.current_request is None:
+                if not self.command_queue:
+                    return
+                request = self.command_queue[0]
+                # keep state-mutating commands ordered, at most one per step
+                if request.Command not in READ_ONLY_COMMANDS and read_count:
+                    return
+                self.current_request = self.command_queue.popleft()
+                self.data = request.data
+                self.Command = request.Command
+                self.data_to_send = None
+                self.command_stats.record(request.Command, "queue_wait", time.perf_counter() - request.enqueued_at)
+            request = self.current_request
+            request.handler_time += self._step_command()
+            if self.data_to_send is None:
+                # multi-step command, continue on next physics step
+                return
+            request.result = self.data_to_send
+            self.data_to_send = None
+            self.data = None
+            self.Command = 0
+            self.current_request = None
+            self.command_stats.record(request.Command, "handler", request.handler_time)
+            request.notified_at = time.perf_counter()
+            request.done.set()
+            if request.Command not in READ_ONLY_COMMANDS:
+                return
+            read_count += 1
+            if read_count >= self.max_read_commands_per_step:
+                return
+
+    def blocking_start_server(self, data, Command):
+        request = CommandRequest(data, Command)
+        self.command_queue.append(request)
+        request.done.wait()
+        self.command_stats.record(Command, "notify_to_return", time.perf_counter() - request.notified_at)
+        return request.result
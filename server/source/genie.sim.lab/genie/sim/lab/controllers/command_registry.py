@@ -0,0 +1,102 @@
+# Copyright (c) 2023-2025, AgiBot Inc. All Rights Reserved.
+# Author: Genie Sim Team
+# License: Mozilla Public License Version 2.0
+
+import time
+from opentelemetry import trace
+
+from base_utils.logger import Logger
+
+logger = Logger()  # Create singleton instance
+
+tracer = trace.get_tracer(__name__)
+
+
+def command(command_id):
+    """register the decorated method as the handler of command_id"""
+
+    def decorator(func):
+        func.command_id = command_id
+        return func
+
+    return decorator
+
+
+class HandlerTiming:
+    def __init__(self):
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+        self.last = 0.0
+
+    def add(self, elapsed):
+        self.count += 1
+        self.total += elapsed
+        self.max = max(self.max, elapsed)
+        self.last = elapsed
+
+    @property
+    def mean(self):
+        return self.total / self.count if self.count else 0.0
+
+    def to_dict(self):
+        return {
+            "count": self.count,
+            "total": self.total,
+            "mean": self.mean,
+            "max": self.max,
+        }
+
+
+class CommandDispatcher:
+    """
+    Routes self.Command to the method registered with @command(id).
+    Handlers read self.data and set self.data_to_send, leaving it None keeps the
+    command running on the next physics step.
+    The table is built once per class, so a stub subclass can be dispatched without Isaac Sim.
+    """
+
+    command_handlers = {}
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        handlers = {}
+        for klass in reversed(cls.__mro__):
+            for name, attr in vars(klass).items():
+                command_id = getattr(attr, "command_id", None)
+                if command_id is None:
+                    continue
+                # a subclass may override a handler under the same name only
+                registered = handlers.get(command_id)
+                if registered is not None and registered.__name__ != name:
+                    raise ValueError(
+                        f"Command {command_id} is registered by both "
+                        f"{registered.__name__} and {name} of {cls.__name__}"
+                    )
+                handlers[command_id] = attr
+        cls.command_handlers = handlers
+
+    def __init__(self):
+        # command id -> HandlerTiming, one sample per physics step the handler ran
+        self.handler_timings = {}
+
+    def _step_command(self):
+        """run the handler of self.Command once, returns its execution time in seconds"""
+        if not self.data or not self.Command:
+            return 0.0
+        handler = self.command_handlers.get(self.Command)
+        if handler is None:
+            logger.warning(f"No handler registered for command {self.Command}")
+            return 0.0
+        with tracer.start_as_current_span(f"rpc_server.step_command_{self.Command}"):
+            start = time.perf_counter()
+            handler(self)
+            elapsed = time.perf_counter() - start
+        timing = self.handler_timings.get(self.Command)
+        if timing is None:
+            timing = self.handler_timings[self.Command] = HandlerTiming()
+        timing.add(elapsed)
+        return elapsed
+
+    def get_handler_timings(self):
+        return {command_id: timing.to_dict() for command_id, timing in sorted(self.handler_timings.items())}
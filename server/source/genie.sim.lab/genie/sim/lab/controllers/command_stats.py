@@ -0,0 +1,99 @@
+# Copyright (c) 2023-2025, AgiBot Inc. All Rights Reserved.
+# Author: Genie Sim Team
+# License: Mozilla Public License Version 2.0
+
+import threading
+
+# enqueue -> handler start, handler execution summed over physics steps,
+# handler done -> blocking_start_server returning to the grpc thread
+STAGES = ("queue_wait", "handler", "notify_to_return")
+
+
+class LatencyHistogram:
+    """
+    Log-linear histogram of microsecond latencies, HdrHistogram style.
+    Every power-of-two range is split into 2**SUB_BUCKET_BITS linear buckets,
+    which bounds the relative error of a reported value to ~3%.
+    """
+
+    SUB_BUCKET_BITS = 5
+
+    def __init__(self):
+        self.counts = {}
+        self.count = 0
+        self.total = 0
+        self.min = None
+        self.max = 0
+
+    @classmethod
+    def _index(cls, value):
+        exponent = max(value.bit_length() - cls.SUB_BUCKET_BITS - 1, 0)
+        return (exponent << cls.SUB_BUCKET_BITS) + (value >> exponent)
+
+    @classmethod
+    def _bucket_range(cls, index):
+        sub_buckets = 1 << cls.SUB_BUCKET_BITS
+        if index < 2 * sub_buckets:
+            return index, index
+        exponent = (index >> cls.SUB_BUCKET_BITS) - 1
+        mantissa = index - (exponent << cls.SUB_BUCKET_BITS)
+        return mantissa << exponent, ((mantissa + 1) << exponent) - 1
+
+    def record(self, seconds):
+        value = max(int(seconds * 1e6), 0)
+        index = self._index(value)
+        self.counts[index] = self.counts.get(index, 0) + 1
+        self.count += 1
+        self.total += value
+        self.min = value if self.min is None else min(self.min, value)
+        self.max = max(self.max, value)
+
+    def percentile(self, percent):
+        """highest value in the bucket holding the given percentile, in microseconds"""
+        if not self.count:
+            return 0
+        target = max(self.count * percent / 100.0, 1)
+        seen = 0
+        for index in sorted(self.counts):
+            seen += self.counts[index]
+            if seen >= target:
+                return min(self._bucket_range(index)[1], self.max)
+        return self.max
+
+    def to_dict(self):
+        return {
+            "count": self.count,
+            "min_ms": (self.min or 0) / 1e3,
+            "mean_ms": self.total / self.count / 1e3 if self.count else 0.0,
+            "p50_ms": self.percentile(50) / 1e3,
+            "p90_ms": self.percentile(90) / 1e3,
+            "p99_ms": self.percentile(99) / 1e3,
+            "max_ms": self.max / 1e3,
+            # [bucket lower bound in us, count], enough to merge runs offline
+            "buckets": [[self._bucket_range(index)[0], self.counts[index]] for index in sorted(self.counts)],
+        }
+
+
+class CommandStats:
+    """per command id latency histograms, written from the sim loop and grpc threads"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.histograms = {}
+
+    def record(self, command_id, stage, seconds):
+        with self._lock:
+            histograms = self.histograms.get(command_id)
+            if histograms is None:
+                histograms = self.histograms[command_id] = {name: LatencyHistogram() for name in STAGES}
+            histograms[stage].record(seconds)
+
+    def to_dict(self, reset=False):
+        with self._lock:
+            stats = {
+                str(command_id): {stage: histogram.to_dict() for stage, histogram in histograms.items()}
+                for command_id, histograms in sorted(self.histograms.items())
+            }
+            if reset:
+                self.histograms = {}
+        return stats
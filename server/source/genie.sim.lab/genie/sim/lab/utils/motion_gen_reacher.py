@@ -26,6 +26,7 @@ from curobo.util_file import (
     join_path,
     load_yaml,
 )
+from curobo.wrap.reacher.ik_solver import IKSolver, IKSolverConfig
 from curobo.wrap.reacher.motion_gen import (
     MotionGen,
     MotionGenConfig,
@@ -88,6 +89,7 @@ class CuroboMotion:
         default_config = self.robot_cfg["kinematics"]["cspace"]["retract_config"]
 
         self.world_cfg = WorldConfig()
+        self.collision_cache = {"obb": n_obstacle_cuboids, "mesh": n_obstacle_mesh}
         motion_gen_config = MotionGen.load_from_robot_config(
             robot_cfg=self.robot_cfg,
             world_model=self.world_cfg,
@@ -100,7 +102,7 @@ class CuroboMotion:
             num_batch_ik_seeds=96,
             interpolation_dt=0.01,
             interpolation_steps=5000,
-            collision_cache={"obb": n_obstacle_cuboids, "mesh": n_obstacle_mesh},
+            collision_cache=self.collision_cache,
             optimize_dt=True,
             trajopt_dt=None,
             trajopt_tsteps=step,
@@ -110,6 +112,8 @@ class CuroboMotion:
         )
 
         self.tensor_args = tensor_args
+        # built on the first solve_batch_ik, see batch_ik_solver
+        self.batch_ik = None
         self.motion_gen = MotionGen(motion_gen_config)
         self.motion_gen.warmup(parallel_finetune=True)
         self.world_model = self.motion_gen.world_collision
@@ -190,7 +194,53 @@ class CuroboMotion:
         self.motion_gen.update_world(obstacle)
         self.world_cfg = obstacle
 
+    def batch_ik_solver(self):
+        """
+        IK solver of the batched goals, apart from the motion gen one: that one runs on
+        cuda graphs, which are recorded again whenever the batch size changes. Collision
+        checks share the motion gen world.
+        """
+        if self.batch_ik is None:
+            ik_config = IKSolverConfig.load_from_robot_config(
+                self.robot_cfg,
+                tensor_args=self.tensor_args,
+                num_seeds=1,
+                self_collision_check=True,
+                collision_checker_type=CollisionCheckerType.MESH,
+                collision_cache=self.collision_cache,
+                world_coll_checker=self.motion_gen.world_collision,
+                use_cuda_graph=False,
+            )
+            self.batch_ik = IKSolver(ik_config)
+        return self.batch_ik
+
+    def current_js_position(self, joint_names):
+        sim_js = self.robot.get_joints_state()
+        return np.array(
+            [sim_js.positions[self.robot.get_dof_index(name)] for name in joint_names]
+        )
+
     def solve_batch_ik(self, positions, rotations, end_effector_name):
+        """
+        positions (3,) / rotations (4,) wxyz solve one goal, (N, 3) / (N, 4) solve N
+        goals in one batch IK call. The other target links keep their current pose for
+        every goal. Batched goals are all seeded from the current joints, so waypoints
+        of a trajectory stay on the ik branch of the arm.
+        """
+        positions = np.asarray(positions)
+        rotations = np.asarray(rotations)
+        batch = positions.ndim == 2
+
+        def other_link_pose(link_name):
+            c_p, c_rot = self.target_links[link_name].get_world_pose()
+            if batch:
+                c_p = np.tile(c_p, (len(positions), 1))
+                c_rot = np.tile(c_rot, (len(positions), 1))
+            return Pose(
+                position=self.tensor_args.to_device(c_p),
+                quaternion=self.tensor_args.to_device(c_rot),
+            )
+
         goal_pose = Pose(
             position=self.tensor_args.to_device(positions),
             quaternion=self.tensor_args.to_device(rotations),
@@ -199,31 +249,34 @@ class CuroboMotion:
         if len(self.link_names) > 1:
             link_poses = {}
             for i in self.target_links.keys():
-                c_p, c_rot = self.target_links[i].get_world_pose()
                 if i == end_effector_name:
                     link_poses[i] = Pose(
                         position=self.tensor_args.to_device(positions),
                         quaternion=self.tensor_args.to_device(rotations),
                     )
                 else:
-                    link_poses[i] = Pose(
-                        position=self.tensor_args.to_device(c_p),
-                        quaternion=self.tensor_args.to_device(c_rot),
-                    )
-            c_p, c_rot = self.target_links[self.ee_link_name].get_world_pose()
-            if end_effector_name == self.ee_link_name:
-                goal_pose = Pose(
-                    position=self.tensor_args.to_device(positions),
-                    quaternion=self.tensor_args.to_device(rotations),
-                )
-            else:
-                goal_pose = Pose(
-                    position=self.tensor_args.to_device(c_p),
-                    quaternion=self.tensor_args.to_device(c_rot),
+                    link_poses[i] = other_link_pose(i)
+            if end_effector_name != self.ee_link_name:
+                goal_pose = other_link_pose(self.ee_link_name)
+        if batch:
+            ik_solver = self.batch_ik_solver()
+            current_js = self.tensor_args.to_device(
+                np.tile(
+                    self.current_js_position(ik_solver.kinematics.joint_names),
+                    (len(positions), 1),
                 )
-        result = self.motion_gen.ik_solver.solve_single(
-            goal_pose, link_poses=link_poses
-        )
+            )
+            result = ik_solver.solve_batch(
+                goal_pose,
+                retract_config=current_js,
+                seed_config=current_js.unsqueeze(1),
+                num_seeds=1,
+                link_poses=link_poses,
+            )
+        else:
+            result = self.motion_gen.ik_solver.solve_single(
+                goal_pose, link_poses=link_poses
+            )
         return result.success, result.js_solution
 
     # nvblox camera
@@ -333,6 +386,8 @@ class CuroboMotion:
 
     def update_lock_joints(self, locked_joints):
         self.motion_gen.update_locked_joints(locked_joints, self.robot_cfg)
+        # rebuilt with the new locked joints on the next solve_batch_ik
+        self.batch_ik = None
 
     def caculate_ik_goal(self, plan_js=False, joint_state=None):
         self.reached = False
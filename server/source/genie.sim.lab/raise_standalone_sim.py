@@ -28,6 +28,36 @@ parser.add_argument(
     default=False,
     help="enable_gpu_dynamics",
 )
+parser.add_argument(
+    "--enable_shm",
+    action="store_true",
+    default=False,
+    help="serve camera frames to same-host clients through shared memory",
+)
+parser.add_argument(
+    "--grpc_host",
+    type=str,
+    default=None,
+    help="bind address of the grpc server, env SIM_GRPC_HOST, default 0.0.0.0",
+)
+parser.add_argument(
+    "--grpc_port",
+    type=int,
+    default=None,
+    help="port of the grpc server, env SIM_GRPC_PORT, default 50051",
+)
+parser.add_argument(
+    "--grpc_max_workers",
+    type=int,
+    default=None,
+    help="grpc thread pool size, env SIM_GRPC_MAX_WORKERS, default 10",
+)
+parser.add_argument(
+    "--grpc_max_message_mb",
+    type=int,
+    default=None,
+    help="grpc send/receive message limit in MB, env SIM_GRPC_MAX_MESSAGE_MB, default 50",
+)
 
 import base_utils
 
@@ -88,7 +118,14 @@ def main():
         record_images=args_cli.record_img,
         record_video=args_cli.record_video,
     )
-    rpc_server = GrpcServer(server_function=server_function)
+    rpc_server = GrpcServer(
+        server_function=server_function,
+        enable_shm=args_cli.enable_shm,
+        host=args_cli.grpc_host,
+        port=args_cli.grpc_port,
+        max_workers=args_cli.grpc_max_workers,
+        max_message_mb=args_cli.grpc_max_message_mb,
+    )
     rpc_server.start()
 
     step = 0
@@ -101,6 +138,7 @@ def main():
             if rpc_server.server_function.exit:
                 break
 
+    rpc_server.close_shm()
     simulation_app.close()
 
 
@@ -0,0 +1,34 @@
+# Copyright (c) 2023-2025, AgiBot Inc. All Rights Reserved.
+# Author: Genie Sim Team
+# License: Mozilla Public License Version 2.0
+
+import importlib.util
+import os
+import sys
+import types
+from pathlib import Path
+from unittest import mock
+
+ROOT_DIR = Path(__file__).resolve().parent.parent
+for path in [
+    ROOT_DIR,
+    ROOT_DIR / "benchmark",
+    ROOT_DIR / "server" / "source" / "genie.sim.lab",
+]:
+    if str(path) not in sys.path:
+        sys.path.append(str(path))
+
+os.environ.setdefault("SIM_REPO_ROOT", str(ROOT_DIR))
+
+# the IK-SDK solver is a native package shipped outside of pip, it is only
+# needed by the robot at runtime
+for module in ["ik_solver"]:
+    if importlib.util.find_spec(module) is None:
+        sys.modules[module] = mock.MagicMock()
+
+# the controllers package __init__ pulls in Isaac Sim through CommandController,
+# without it the pure python controller modules are imported on their own
+if importlib.util.find_spec("isaacsim") is None:
+    controllers = types.ModuleType("genie.sim.lab.controllers")
+    controllers.__path__ = [str(ROOT_DIR / "server/source/genie.sim.lab/genie/sim/lab/controllers")]
+    sys.modules.setdefault("genie.sim.lab.controllers", controllers)
@@ -0,0 +1,96 @@
+# Copyright (c) 2023-2025, AgiBot Inc. All Rights Reserved.
+# Author: Genie Sim Team
+# License: Mozilla Public License Version 2.0
+
+from types import SimpleNamespace
+
+import pytest
+
+from ader.action.common_actions import TimeOut
+from benchmark.envs import base_env
+from benchmark.envs.base_env import BaseEnv
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def time(self):
+        return self.now
+
+
+class FakeRobot:
+    def __init__(self):
+        self.resets = 0
+
+    def reset(self):
+        self.resets += 1
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = FakeClock()
+    monkeypatch.setattr(base_env.time, "time", clock.time)
+    return clock
+
+
+def make_env(step_dt, time_out):
+    env = BaseEnv(FakeRobot(), step_dt=step_dt)
+    env.task = SimpleNamespace(update_progress=lambda key, info: None)
+    env.do_action("eval", "timeout", TimeOut(env, time_out))
+    return env
+
+
+def step(env, clock, wall_delta, update=True):
+    """one env.step of the envs: the sim advanced, the host took wall_delta"""
+    clock.now += wall_delta
+    env.current_step += 1
+    if update:
+        env.action_update()
+
+
+def test_sim_time_advances_by_step_dt(clock):
+    env = make_env(step_dt=0.1, time_out=3.0)
+    # a stalled host does not move sim time, a fast one does not hold it back
+    for i in range(29):
+        step(env, clock, 5.0 if i % 7 == 0 else 0.001)
+
+    assert env.sim_time == pytest.approx(2.9)
+    assert env.wall_time == pytest.approx(5 * 5.0 + 24 * 0.001)
+    assert env.exist_eval_action() and not env.has_done
+
+    step(env, clock, 0.001)
+    assert env.sim_time == pytest.approx(3.0)
+    assert env.has_done
+    assert env.robot.resets == 1
+
+
+def test_skipped_updates_count_every_step(clock):
+    env = make_env(step_dt=0.1, time_out=10.0)
+    for i in range(9):
+        step(env, clock, 0.01, update=i % 3 == 2)
+
+    assert env.sim_time == pytest.approx(0.9)
+
+
+def test_wall_clock_mode_follows_wall_time(clock):
+    env = make_env(step_dt=None, time_out=3.0)
+    for _ in range(2):
+        step(env, clock, 1.0)
+
+    assert env.sim_time == pytest.approx(2.0)
+    assert not env.has_done
+
+    step(env, clock, 1.5)
+    assert env.has_done
+
+
+def test_reset_clock_restarts_sim_time(clock):
+    env = make_env(step_dt=0.1, time_out=10.0)
+    for _ in range(5):
+        step(env, clock, 0.5)
+    env.reset_clock()
+    step(env, clock, 0.5)
+
+    assert env.sim_time == pytest.approx(0.1)
+    assert env.wall_time == pytest.approx(0.5)
@@ -0,0 +1,152 @@
+# Copyright (c) 2023-2025, AgiBot Inc. All Rights Reserved.
+# Author: Genie Sim Team
+# License: Mozilla Public License Version 2.0
+
+import threading
+import time
+
+import pytest
+
+from genie.sim.lab.controllers.command_queue import READ_ONLY_COMMANDS, CommandQueue
+from genie.sim.lab.controllers.command_registry import command
+
+READ_POSE, READ_JOINTS, SET_JOINTS, WAIT = 4, 5, 2, 38
+
+
+class FakeSim(CommandQueue):
+    """the sim loop of CommandController reduced to its command handling"""
+
+    def __init__(self, max_read_commands_per_step=16):
+        super().__init__(max_read_commands_per_step=max_read_commands_per_step)
+        self.step = 0
+        self.log = []
+
+    def run(self, steps):
+        for _ in range(steps):
+            self.step += 1
+            self.on_command_step()
+
+    def _handled(self):
+        self.log.append((self.step, self.data["name"]))
+        self.data_to_send = {"name": self.data["name"], "step": self.step}
+
+    @command(READ_POSE)
+    def _cmd_read_pose(self):
+        self._handled()
+
+    @command(READ_JOINTS)
+    def _cmd_read_joints(self):
+        self._handled()
+
+    @command(SET_JOINTS)
+    def _cmd_set_joints(self):
+        self._handled()
+
+    @command(WAIT)
+    def _cmd_wait(self):
+        self.data["elapsed_steps"] = self.data.get("elapsed_steps", 0) + 1
+        if self.data["elapsed_steps"] >= self.data["steps"]:
+            self._handled()
+
+
+class Client:
+    """a grpc thread blocked in blocking_start_server"""
+
+    def __init__(self, sim, Command, name, **data):
+        self.result = None
+        queued = len(sim.command_queue)
+        self.thread = threading.Thread(target=self._call, args=(sim, Command, dict(data, name=name)), daemon=True)
+        self.thread.start()
+        # queue order is submission order
+        while len(sim.command_queue) == queued:
+            time.sleep(0.001)
+
+    def _call(self, sim, Command, data):
+        self.result = sim.blocking_start_server(data, Command)
+
+    def join(self):
+        self.thread.join(timeout=5)
+        assert not self.thread.is_alive()
+        return self.result
+
+
+def test_command_ids_of_the_fake_sim():
+    assert {READ_POSE, READ_JOINTS} <= READ_ONLY_COMMANDS
+    assert not {SET_JOINTS, WAIT} & READ_ONLY_COMMANDS
+
+
+def test_read_only_commands_drain_up_to_the_limit():
+    sim = FakeSim(max_read_commands_per_step=3)
+    clients = [Client(sim, READ_POSE if i % 2 else READ_JOINTS, f"read{i}") for i in range(5)]
+    sim.run(2)
+
+    assert sim.log == [(1, "read0"), (1, "read1"), (1, "read2"), (2, "read3"), (2, "read4")]
+    assert [client.join()["name"] for client in clients] == [f"read{i}" for i in range(5)]
+
+
+def test_state_mutating_commands_run_one_per_step_in_order():
+    sim = FakeSim()
+    clients = [
+        Client(sim, READ_POSE, "read0"),
+        Client(sim, READ_JOINTS, "read1"),
+        Client(sim, SET_JOINTS, "set0"),
+        Client(sim, READ_POSE, "read2"),
+        Client(sim, SET_JOINTS, "set1"),
+        Client(sim, SET_JOINTS, "set2"),
+    ]
+    sim.run(5)
+
+    # a read never overtakes a queued write, nor runs after one in the same step
+    assert sim.log == [
+        (1, "read0"),
+        (1, "read1"),
+        (2, "set0"),
+        (3, "read2"),
+        (4, "set1"),
+        (5, "set2"),
+    ]
+    for client in clients:
+        client.join()
+
+
+def test_multi_step_command_blocks_the_queue():
+    sim = FakeSim()
+    wait = Client(sim, WAIT, "wait", steps=3)
+    read = Client(sim, READ_POSE, "read")
+    sim.run(2)
+
+    assert sim.log == []
+    assert sim._pending_command() == WAIT
+    assert len(sim.command_queue) == 1
+
+    sim.run(2)
+    assert sim.log == [(3, "wait"), (4, "read")]
+    assert wait.join() == {"name": "wait", "step": 3}
+    assert read.join() == {"name": "read", "step": 4}
+    assert sim._pending_command() == 0
+
+
+def test_latency_stages_are_recorded():
+    sim = FakeSim()
+    clients = [Client(sim, READ_POSE, "read"), Client(sim, WAIT, "wait", steps=2)]
+    sim.run(3)
+    for client in clients:
+        client.join()
+
+    stats = sim.get_handler_timings()
+    assert stats[READ_POSE]["count"] == 1
+    assert stats[WAIT]["count"] == 2
+    summary = sim.command_stats.to_dict()
+    for command_id in (READ_POSE, WAIT):
+        for stage in ("queue_wait", "handler", "notify_to_return"):
+            assert summary[str(command_id)][stage]["count"] == 1
+
+
+@pytest.mark.parametrize("limit", [1, 16])
+def test_every_client_is_answered(limit):
+    sim = FakeSim(max_read_commands_per_step=limit)
+    clients = [Client(sim, [READ_POSE, SET_JOINTS, WAIT][i % 3], f"cmd{i}", steps=2) for i in range(9)]
+    sim.run(20)
+
+    assert [client.join()["name"] for client in clients] == [f"cmd{i}" for i in range(9)]
+    assert [name for _, name in sim.log] == [f"cmd{i}" for i in range(9)]
@@ -0,0 +1,82 @@
+# Copyright (c) 2023-2025, AgiBot Inc. All Rights Reserved.
+# Author: Genie Sim Team
+# License: Mozilla Public License Version 2.0
+
+import pytest
+
+from genie.sim.lab.controllers.command_registry import CommandDispatcher, command
+
+
+class StubController(CommandDispatcher):
+    def __init__(self):
+        super().__init__()
+        self.Command = 0
+        self.data = None
+        self.data_to_send = None
+
+    @command(1)
+    def on_joint_position(self):
+        self.data_to_send = "joints"
+
+    @command(2)
+    def on_gripper(self):
+        self.data_to_send = "gripper"
+
+
+def test_handlers_are_registered_per_class():
+    assert StubController.command_handlers == {
+        1: StubController.on_joint_position,
+        2: StubController.on_gripper,
+    }
+    assert CommandDispatcher.command_handlers == {}
+
+
+def test_step_command_runs_the_handler():
+    controller = StubController()
+    controller.Command = 2
+    controller.data = {"gripper": 0.5}
+    controller._step_command()
+    controller._step_command()
+
+    assert controller.data_to_send == "gripper"
+    assert controller.get_handler_timings()[2]["count"] == 2
+
+
+def test_unknown_command_is_skipped():
+    controller = StubController()
+    controller.Command = 99
+    controller.data = {"gripper": 0.5}
+
+    assert controller._step_command() == 0.0
+    assert controller.data_to_send is None
+    assert controller.get_handler_timings() == {}
+
+
+def test_subclass_overrides_handler_by_name():
+    class Override(StubController):
+        @command(2)
+        def on_gripper(self):
+            self.data_to_send = "override"
+
+    assert Override.command_handlers[1] is StubController.on_joint_position
+    assert Override.command_handlers[2] is Override.on_gripper
+
+
+def test_duplicate_command_id_is_rejected():
+    with pytest.raises(ValueError, match="Command 2"):
+
+        class Duplicate(StubController):
+            @command(2)
+            def on_other_gripper(self):
+                pass
+
+    with pytest.raises(ValueError, match="Command 3"):
+
+        class SameClass(CommandDispatcher):
+            @command(3)
+            def first(self):
+                pass
+
+            @command(3)
+            def second(self):
+                pass
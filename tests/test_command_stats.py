@@ -0,0 +1,66 @@
+# Copyright (c) 2023-2025, AgiBot Inc. All Rights Reserved.
+# Author: Genie Sim Team
+# License: Mozilla Public License Version 2.0
+
+import math
+
+import pytest
+
+from genie.sim.lab.controllers import command_stats
+from genie.sim.lab.controllers.command_stats import CommandStats, LatencyHistogram
+
+
+def test_empty_histogram():
+    histogram = LatencyHistogram()
+
+    assert histogram.percentile(50) == 0
+    assert histogram.to_dict()["p99_ms"] == 0
+    assert histogram.to_dict()["mean_ms"] == 0.0
+
+
+def test_small_latencies_are_exact():
+    histogram = LatencyHistogram()
+    for us in range(1, 51):
+        histogram.record(us / 1e6)
+
+    assert histogram.percentile(50) == 25
+    assert histogram.percentile(90) == 45
+    assert histogram.percentile(99) == 50
+    assert histogram.percentile(100) == 50
+    assert histogram.min == 1 and histogram.max == 50
+
+
+@pytest.mark.parametrize("percent", [50, 90, 99])
+def test_percentile_relative_error_is_bounded(percent):
+    histogram = LatencyHistogram()
+    values = []
+    for i in range(1, 1001):
+        seconds = i * 37e-6
+        histogram.record(seconds)
+        values.append(int(seconds * 1e6))
+
+    exact = sorted(values)[math.ceil(len(values) * percent / 100) - 1]
+    reported = histogram.percentile(percent)
+    assert exact <= reported <= exact * (1 + 2**-LatencyHistogram.SUB_BUCKET_BITS)
+
+
+def test_percentile_is_capped_at_max():
+    histogram = LatencyHistogram()
+    histogram.record(0.1)
+
+    assert histogram.percentile(99) == 100000
+
+
+def test_command_stats_per_command_and_stage():
+    stats = CommandStats()
+    stats.record(1, "handler", 0.002)
+    stats.record(1, "queue_wait", 0.001)
+    stats.record(7, "handler", 0.004)
+
+    summary = stats.to_dict(reset=True)
+    assert list(summary) == ["1", "7"]
+    assert set(summary["1"]) == set(command_stats.STAGES)
+    assert summary["1"]["handler"]["count"] == 1
+    assert summary["1"]["notify_to_return"]["count"] == 0
+    assert summary["7"]["handler"]["max_ms"] == 4.0
+    assert stats.to_dict() == {}
@@ -0,0 +1,69 @@
+# Copyright (c) 2023-2025, AgiBot Inc. All Rights Reserved.
+# Author: Genie Sim Team
+# License: Mozilla Public License Version 2.0
+
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+
+from benchmark.envs import demo_env
+from benchmark.envs.demo_env import DemoEnv
+
+OPEN_DRAWER = [
+    {
+        "action": "pull",
+        "active": {"object_id": "gripper"},
+        "passive": {"object_id": "drawer", "part_id": "part_01"},
+    }
+]
+
+
+class FakeSubstages:
+    def __init__(self):
+        self.rewinds = 0
+
+    def rewind(self):
+        self.rewinds += 1
+
+
+@pytest.fixture
+def env(monkeypatch):
+    env = DemoEnv.__new__(DemoEnv)
+    env.robot = None
+    env.stage_plans = {}
+    # load_task_solution only keeps the object_id/part_id key of articulated objects
+    env.policy_objects = {
+        "gripper": SimpleNamespace(obj_pose=np.eye(4)),
+        "drawer/part_01": SimpleNamespace(obj_pose=np.eye(4)),
+    }
+
+    env.plans = []
+
+    def generate_action_stages(objects, stages, robot):
+        substages = FakeSubstages()
+        env.plans.append(substages)
+        return [("pull", substages)]
+
+    monkeypatch.setattr(demo_env, "generate_action_stages", generate_action_stages)
+    return env
+
+
+def test_plan_of_part_is_memoized(env):
+    first = env.get_stage_plan(0, OPEN_DRAWER)
+    second = env.get_stage_plan(0, OPEN_DRAWER)
+
+    assert second is first
+    assert len(env.plans) == 1
+    assert env.plans[0].rewinds == 1
+    assert list(env.stage_plans[0][1]) == ["drawer/part_01"]
+
+
+def test_moved_part_is_replanned(env):
+    env.get_stage_plan(0, OPEN_DRAWER)
+    env.policy_objects["drawer/part_01"].obj_pose = np.eye(4)
+    env.policy_objects["drawer/part_01"].obj_pose[0, 3] = 0.1
+    env.get_stage_plan(0, OPEN_DRAWER)
+
+    assert len(env.plans) == 2
+    assert env.plans[0].rewinds == 0
@@ -0,0 +1,52 @@
+# Copyright (c) 2023-2025, AgiBot Inc. All Rights Reserved.
+# Author: Genie Sim Team
+# License: Mozilla Public License Version 2.0
+
+import os
+import random
+
+import numpy as np
+import pytest
+
+from layout.task_generate import TaskGenerator
+
+
+def draw():
+    return random.random(), np.random.rand()
+
+
+@pytest.fixture
+def generator(tmp_path):
+    generator = TaskGenerator.__new__(TaskGenerator)
+    generator.seed = 7
+    generator.cache_dir = str(tmp_path / "cache")
+    generator.cache_key = "task"
+    generator.task_template = {}
+    generator.fix_obj_infos = []
+    os.makedirs(generator.cache_dir)
+
+    # the layout solver draws from the global streams
+    def layout():
+        return [{"object_id": "cup", "x": random.random(), "y": np.random.rand()}]
+
+    generator.layouts = {"cup": layout}
+    return generator
+
+
+def test_cache_hit_leaves_rng_as_a_miss(generator, tmp_path):
+    generator.generate_tasks(str(tmp_path / "miss"), 2, "pick_cup")
+    after_miss = draw()
+    generator.generate_tasks(str(tmp_path / "hit"), 2, "pick_cup")
+    after_hit = draw()
+
+    assert sorted(os.listdir(tmp_path / "hit")) == ["pick_cup_0.json", "pick_cup_1.json"]
+    assert after_hit == after_miss
+
+
+def test_tasks_do_not_share_rng_state(generator, tmp_path):
+    generator.generate_tasks(str(tmp_path / "a"), 1, "pick_cup")
+    first = draw()
+    generator.generate_tasks(str(tmp_path / "b"), 1, "place_cup")
+    generator.generate_tasks(str(tmp_path / "c"), 1, "pick_cup")
+
+    assert draw() == first